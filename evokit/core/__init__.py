@@ -3,7 +3,7 @@
 """ Export modules from core.
 """
 from .algorithm import Algorithm # type: ignore
-from .evaluator import Evaluator # type: ignore
+from .evaluator import Evaluator, AsyncEvaluator, FitnessCache # type: ignore
 from .population import Individual, Population # type: ignore
 from .selector import Selector # type: ignore
 from .variator import Variator, NullVariator # type: ignore
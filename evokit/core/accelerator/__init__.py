@@ -5,5 +5,15 @@ and the standard :class:`Evaluator`.
 Module name is coincidentally French.
 """
 from .parallelisers import parallelise_task
+from .parallelisers import shutdown_pools
+from .parallelisers import TaskSubmitter
+from .parallelisers import ChunkPolicy
+from .parallelisers import FixedChunkSize
+from .parallelisers import ChunksPerWorker
+from .parallelisers import AdaptiveChunkSize
+from .sharing import SharedArray
 
-__all__ = ["parallelise_task",]
+__all__ = ["parallelise_task", "shutdown_pools", "TaskSubmitter",
+           "ChunkPolicy", "FixedChunkSize",
+           "ChunksPerWorker", "AdaptiveChunkSize",
+           "SharedArray"]
@@ -1,19 +1,37 @@
 from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future
 from typing import TypeVar
 from typing import Callable
 from typing import Sequence
 from typing import Optional
 from typing import Any
+from typing import Self
 from concurrent.futures.process import BrokenProcessPool
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import partial
+from pathlib import Path
 
 from ..._utils.dependency import is_installed
 
+import atexit
 import copy
+import hashlib
+import itertools
+import math
+import os
+import pickle
+import tempfile
+import threading
+import time
 
-if is_installed("multiprocess"):
-    from multiprocess.pool import Pool  # type: ignore
+if is_installed("dill"):
     import dill  # type: ignore
     dill.settings['recurse'] = True  # type: ignore
+
+if is_installed("multiprocess"):
+    from multiprocess.pool import Pool  # type: ignore
 else:
     from multiprocessing.pool import Pool
 
@@ -23,13 +41,140 @@ type AS[A] = Sequence[A]
 B = TypeVar("B")
 
 
+class ChunkPolicy(ABC):
+    """Base class for all chunking policies.
+
+    When tasks are parallelised, items are sent to worker processes
+    in chunks. Each chunk costs one round trip between processes.
+    Larger chunks cost fewer round trips; smaller chunks spread
+    work more evenly between workers.
+
+    A chunking policy decides the size of these chunks.
+    See :func:`parallelise_task`.
+    """
+    @abstractmethod
+    def chunk_size(self, item_count: int, worker_count: int) -> int:
+        """Return the number of items in each chunk.
+
+        Args:
+            item_count: Number of items to process.
+
+            worker_count: Number of worker processes.
+        """
+
+    def record(self, item_count: int, seconds: float) -> None:
+        """Record that a worker processed a chunk of :arg:`item_count`
+        items in :arg:`seconds` seconds.
+
+        The default implementation does nothing. Policies that adapt
+        to measured latencies should override this method.
+        """
+        pass
+
+
+class FixedChunkSize(ChunkPolicy):
+    """Put the same number of items in each chunk.
+    """
+    def __init__(self, size: int):
+        """
+        Args:
+            size: Number of items in each chunk.
+
+        Raise:
+            ValueError: If :arg:`size` is less than 1.
+        """
+        if size < 1:
+            raise ValueError(f"Chunk size must be at least 1. Got: {size}")
+        #: Number of items in each chunk.
+        self.size: int = size
+
+    def chunk_size(self, item_count: int, worker_count: int) -> int:
+        return self.size
+
+
+class ChunksPerWorker(ChunkPolicy):
+    """Divide items so that each worker receives a fixed
+    number of chunks.
+    """
+    def __init__(self, chunks_per_worker: int = 4):
+        """
+        Args:
+            chunks_per_worker: Number of chunks for each worker.
+                More chunks spread work more evenly.
+
+        Raise:
+            ValueError: If :arg:`chunks_per_worker` is less than 1.
+        """
+        if chunks_per_worker < 1:
+            raise ValueError(f"Each worker must receive at least one"
+                             f" chunk. Got: {chunks_per_worker}")
+        #: Number of chunks for each worker.
+        self.chunks_per_worker: int = chunks_per_worker
+
+    def chunk_size(self, item_count: int, worker_count: int) -> int:
+        return max(1, math.ceil(
+            item_count / (worker_count * self.chunks_per_worker)))
+
+
+class AdaptiveChunkSize(ChunkPolicy):
+    """Choose the chunk size from measured time per item.
+
+    Aim for chunks that each take :attr:`target_seconds` to process,
+    so that round trips between processes take a small fraction of
+    the time. Chunks are never larger than those of
+    :class:`ChunksPerWorker`, so that work remains evenly spread.
+
+    Before any chunk is processed, behave as :class:`ChunksPerWorker`.
+    """
+    def __init__(self,
+                 target_seconds: float = 0.05,
+                 chunks_per_worker: int = 4,
+                 smoothing: float = 0.5):
+        """
+        Args:
+            target_seconds: Time to process each chunk.
+
+            chunks_per_worker: See :class:`ChunksPerWorker`.
+
+            smoothing: Weight of the latest measurement in the moving
+                average of time per item. Must be in ``(0, 1]``.
+        """
+        #: Time to process each chunk.
+        self.target_seconds: float = target_seconds
+        #: Bounds the size of chunks. See :class:`ChunksPerWorker`.
+        self.bound: ChunksPerWorker = ChunksPerWorker(chunks_per_worker)
+        #: Weight of the latest measurement.
+        self.smoothing: float = smoothing
+        #: Moving average of time per item, if any is measured.
+        self.seconds_per_item: Optional[float] = None
+
+    def chunk_size(self, item_count: int, worker_count: int) -> int:
+        bound: int = self.bound.chunk_size(item_count, worker_count)
+        if not self.seconds_per_item:
+            return bound
+        return max(1, min(bound, int(self.target_seconds
+                                     / self.seconds_per_item)))
+
+    def record(self, item_count: int, seconds: float) -> None:
+        if item_count < 1:
+            return
+        latest: float = seconds / item_count
+        if self.seconds_per_item is None:
+            self.seconds_per_item = latest
+        else:
+            self.seconds_per_item += self.smoothing\
+                * (latest - self.seconds_per_item)
+
+
 def parallelise_task[S, A, B](
         # PEP 646 signature
         fn: Callable[[S, A], B],
         self: S,
         iterable: Sequence[A],
-        processes: Optional[int | ProcessPoolExecutor | Pool],
-        share_self: bool) -> Sequence[B]:
+        processes: Optional[int | str | ProcessPoolExecutor
+                            | ThreadPoolExecutor | Pool],
+        share_self: bool,
+        chunking: Optional[ChunkPolicy | int] = None) -> Sequence[B]:
     """Parallelise tasks such as variation and evaluation.
 
     Default implementations in :meth:`Variator.vary_population`
@@ -67,17 +212,26 @@ def parallelise_task[S, A, B](
         iterable: Data to be processed in parallel.
 
         processes: Option that decides how may processes to use.
-            Can be an :class:`int`, a :class:`ProcessPoolExecutor`,
+            Can be an :class:`int`, a :class:`str`, a
+            :class:`ProcessPoolExecutor`, a :class:`ThreadPoolExecutor`,
             or :python:`None`.
 
-            * If :arg:`processes` is an :class:`int`: create a new
-              :class:`ProcessPoolExecutor` with :arg:`processes` workers,
-              then use it to execute the task. On Windows, it must be at
+            * If :arg:`processes` is an :class:`int`: use a pool
+              with :arg:`processes` workers to execute the task. The
+              pool is created once, then kept for later tasks
+              (see :func:`shutdown_pools`). On Windows, it must be at
               most 61.
 
             * If :arg:`processes` is a :class:`ProcessPoolExecutor`:
               use it to execute the task.
 
+            * If :arg:`processes` is a string of form ``"threads:N"``:
+              use a pool of ``N`` threads to execute the task. As with
+              an :class:`int`, the pool is kept for later tasks.
+
+            * If :arg:`processes` is a :class:`ThreadPoolExecutor`:
+              use it to execute the task.
+
             * If (by default) ``processes==None``:
               Do not parallelise.
 
@@ -87,25 +241,80 @@ def parallelise_task[S, A, B](
         share_self: If :python:`True`, share a deep copy
             of ``self`` to each worker process.
             Non-serialisable attributes are replaced with
-            :python:`None` instead.
+            :python:`None` instead. Otherwise, share ``self``
+            as it is, which fails if ``self`` cannot be serialised.
+
+            If :arg:`processes` is :python:`None` or uses threads,
+            then this argument has no effect.
+
+        chunking: Option that decides how many items are sent
+            to a worker at once. Can be a :class:`ChunkPolicy`,
+            an :class:`int`, or :python:`None`.
+
+            * If :arg:`chunking` is an :class:`int`: use
+              :class:`FixedChunkSize` with that size.
+
+            * If (by default) ``chunking==None``: use
+              :class:`ChunksPerWorker`.
 
             If :arg:`processes` is :python:`None`, then this argument has
             no effect.
+
+    .. note::
+        :arg:`fn` and ``self`` are serialised, then sent to each worker
+        process once. Tasks only carry items in :arg:`iterable`. A
+        worker keeps what it received, and receives it again only
+        when it changes. Each chunk of items runs with a fresh copy
+        of ``self``.
+
+        An :class:`.Evaluator` or a :class:`.Variator` is serialised
+        again only if one of its attributes has been assigned since
+        it was last sent. Changes made inside an attribute, such as
+        appending to a list, are not detected. Assign the attribute
+        again to send them.
+
+    .. note::
+        Threads suit tasks that release the GIL, such as those that
+        call NumPy, and all tasks on free-threaded builds of Python.
+        Nothing is serialised. Each chunk receives a shallow copy
+        of ``self``, in which attributes named in
+        ``self.thread_local_attributes`` (if any) are also shallowly
+        copied. Declare there any state that :arg:`fn` modifies,
+        such as an evaluation context.
+
+    Raise:
+        ValueError: If :arg:`processes` is a string not of form
+            ``"threads:N"``.
     """
 
     if processes is None:
         return [fn(self, each) for each in iterable]
+
+    policy: ChunkPolicy
+    if chunking is None:
+        policy = ChunksPerWorker()
+    elif isinstance(chunking, int):
+        policy = FixedChunkSize(chunking)
+    else:
+        policy = chunking
+
+    if isinstance(processes, str):
+        processes = _managed_pool(f"threads:{_thread_count(processes)}")
+
+    if isinstance(processes, ThreadPoolExecutor):
+        return _execute_with_threads(
+            processes, fn, self, iterable, policy)
     elif isinstance(processes, ProcessPoolExecutor):
         return _execute_with_executor(
-            processes, fn, self, iterable, share_self)
+            processes, fn, self, iterable, share_self, policy)
     else:
         if isinstance(processes, int):
             if is_installed("multiprocess"):
                 return _execute_with_pool(
-                    processes, fn, self, iterable, share_self)
+                    processes, fn, self, iterable, share_self, policy)
             else:
                 return _execute_with_executor(
-                    processes, fn, self, iterable, share_self)
+                    processes, fn, self, iterable, share_self, policy)
         else:
             if not is_installed("multiprocess"):
                 raise NotImplementedError(
@@ -126,40 +335,598 @@ def parallelise_task[S, A, B](
             else:
                 return _execute_with_pool(processes, fn, self,
                                           iterable,
-                                          share_self)
+                                          share_self,
+                                          policy)
 
 
-def _duplicate_self[S, A](self: S,
-                          share_self: bool,
-                          iterable: Sequence[A],)\
-        -> Sequence[S] | Sequence[None]:
-    if share_self:
-        return [copy.deepcopy(self)
-                for _ in range(len(iterable))]
-    else:
-        return [None for _ in range(len(iterable))]
+class TaskSubmitter[S, A, B]:
+    """Submit items one at a time.
+
+    :func:`parallelise_task` processes a sequence of items, then
+    waits for all of them. A :class:`TaskSubmitter` instead returns
+    a :class:`Future` for each item, so that the caller can act on
+    each result as soon as it arrives.
+
+    Tasks run in the same pools as those of :func:`parallelise_task`.
+    As with that function, :arg:`fn` and ``self`` are serialised once,
+    when the submitter is created.
+
+    Call :meth:`close` once no more items are to be submitted, so
+    that the serialised ``self`` can be released. A submitter can
+    also be used as a context manager, which closes it on exit.
+    """
+    def __init__(self,
+                 fn: Callable[[S, A], B],
+                 caller: S,
+                 processes: Optional[int | str | ProcessPoolExecutor
+                                     | ThreadPoolExecutor | Pool],
+                 share_self: bool):
+        """
+        Args:
+            fn: Task to run for each item.
+
+            caller: The ``self`` of :func:`parallelise_task`.
+
+            processes: See :func:`parallelise_task`. If
+                :python:`None`, then :meth:`submit` runs each task
+                at once, in this thread.
+
+            share_self: See :func:`parallelise_task`.
+
+        Raise:
+            NotImplementedError: If :arg:`processes` is a
+                :class:`multiprocessing.pool.Pool`.
+        """
+        if isinstance(processes, str):
+            processes = _managed_pool(f"threads:{_thread_count(processes)}")
+        elif isinstance(processes, int):
+            processes = _managed_pool(processes)
+        elif processes is not None\
+                and not isinstance(processes, (ProcessPoolExecutor,
+                                               ThreadPoolExecutor))\
+                and not is_installed("multiprocess"):
+            raise NotImplementedError(
+                "A `multiprocessing.pool.Pool` is given in `processes`."
+                " See `parallelise_task` for why this is not supported.")
+
+        self._fn: Callable[[S, A], B] = fn
+        self._caller: S = caller
+        self._pool: Optional[ProcessPoolExecutor
+                             | ThreadPoolExecutor | Pool] = processes
+        self._reference: Optional[tuple[str, str]] = None
+        if processes is not None\
+                and not isinstance(processes, ThreadPoolExecutor):
+            self._reference = _broadcast(fn, caller, share_self)
+        # Guards :attr:`_outstanding` and :attr:`_closed`.
+        self._lock = threading.Lock()
+        # Number of submitted tasks that have not finished.
+        self._outstanding: int = 0
+        self._closed: bool = False
+
+    def submit(self, item: A) -> Future[B]:
+        """Submit :arg:`item`. Return a future of its result.
+
+        Raise:
+            RuntimeError: If the submitter is closed.
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Cannot submit to a closed"
+                                   " `TaskSubmitter`.")
+            self._outstanding += 1
+        future = self._submit(item)
+        future.add_done_callback(self._finish)
+        return future
+
+    def close(self) -> None:
+        """Stop accepting items.
+
+        Tasks that are already submitted still run. Once all of
+        them finish, the serialised ``self`` is released. Closing
+        a closed submitter does nothing.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            idle: bool = self._outstanding == 0
+        if idle:
+            self._release()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def _finish(self, _: Future[B]) -> None:
+        """Machinery.
+
+        :meta private:
+
+        Count a finished task. Release the serialised ``self`` if
+        the submitter is closed and no task remains.
+        """
+        with self._lock:
+            self._outstanding -= 1
+            idle: bool = self._closed and self._outstanding == 0
+        if idle:
+            self._release()
+
+    def _release(self) -> None:
+        """Machinery.
+
+        :meta private:
+
+        Release the serialised ``self``, if there is one.
+        """
+        reference, self._reference = self._reference, None
+        if reference is not None:
+            _release(reference)
+
+    def _submit(self, item: A) -> Future[B]:
+        """Machinery.
+
+        :meta private:
+
+        Submit :arg:`item` to the pool.
+        """
+        pool = self._pool
+        if pool is None:
+            future: Future[B] = Future()
+            try:
+                future.set_result(self._fn(self._caller, item))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+        elif isinstance(pool, ThreadPoolExecutor):
+            return pool.submit(_run_one_in_thread,
+                               self._fn, self._caller, item)
+        elif isinstance(pool, ProcessPoolExecutor):
+            return pool.submit(_run_one, self._reference, item)
+        else:
+            future = Future()
+            pool.apply_async(func=_run_one,
+                             args=[self._reference, item],
+                             callback=future.set_result,
+                             error_callback=future.set_exception)
+            return future
+
+
+#: Pools created by :func:`parallelise_task`, by number of workers,
+#: or by ``"threads:N"`` for pools of threads.
+_POOLS: dict[int | str, ProcessPoolExecutor | ThreadPoolExecutor | Pool] = {}
+
+#: Guards :attr:`_POOLS` and :attr:`_BROADCASTS`.
+_LOCK = threading.Lock()
+
+
+def _thread_count(spec: str) -> int:
+    """Machinery.
+
+    :meta private:
+
+    Return the number of threads in :arg:`spec`, which has
+    form ``"threads:N"``.
+    """
+    kind, _, count = spec.partition(":")
+    if kind != "threads" or not count.isdigit() or int(count) < 1:
+        raise ValueError(f"Expected a string of form \"threads:N\","
+                         f" where N is at least 1. Got: {spec!r}")
+    return int(count)
+
+
+def _managed_pool(processes: int | str)\
+        -> ProcessPoolExecutor | ThreadPoolExecutor | Pool:
+    """Machinery.
+
+    :meta private:
+
+    Return the pool of :arg:`processes` workers, or the pool
+    of threads if :arg:`processes` has form ``"threads:N"``.
+    Create it if it does not exist.
+    """
+    with _LOCK:
+        pool = _POOLS.get(processes)
+        if pool is None:
+            if isinstance(processes, str):
+                pool = ThreadPoolExecutor(
+                    max_workers=_thread_count(processes))
+            elif is_installed("multiprocess"):
+                pool = Pool(processes)
+            else:
+                pool = ProcessPoolExecutor(max_workers=processes)
+            _POOLS[processes] = pool
+        return pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor | ThreadPoolExecutor | Pool)\
+        -> None:
+    """Machinery.
+
+    :meta private:
+
+    Forget :arg:`pool` if it is a managed pool, so that
+    the next task creates a new pool.
+    """
+    with _LOCK:
+        for key, value in list(_POOLS.items()):
+            if value is pool:
+                del _POOLS[key]
+
+
+def shutdown_pools() -> None:
+    """Shut down all pools that :func:`parallelise_task` creates.
+
+    When :arg:`processes` is an :class:`int` or a ``"threads:N"``
+    string, :func:`parallelise_task` keeps a pool of workers for
+    later tasks. Call this function to
+    release these workers. Later tasks create new pools as needed.
+
+    This function is called when the interpreter exits. It also
+    removes the files through which worker processes receive
+    ``self`` (see :func:`parallelise_task`). If the interpreter is
+    killed instead, these files remain. They are named
+    ``evokit-<pid>-*``, in ``/dev/shm`` if it exists or in the
+    temporary directory otherwise, and can be removed by hand.
+    """
+    with _LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+        broadcasts = list(_BROADCASTS.values())
+        _BROADCASTS.clear()
+        _PINS.clear()
+
+    for pool in pools:
+        if isinstance(pool, (ProcessPoolExecutor, ThreadPoolExecutor)):
+            pool.shutdown(wait=True)
+        else:
+            pool.close()
+            pool.join()
+
+    for path in broadcasts:
+        path.unlink(missing_ok=True)
+
+
+atexit.register(shutdown_pools)
+
+
+#: Files that hold serialised callers, by digest.
+_BROADCASTS: OrderedDict[str, Path] = OrderedDict()
+
+#: Number of files in :attr:`_BROADCASTS` to keep.
+_BROADCAST_LIMIT: int = 8
+
+#: Number of live references to each file in :attr:`_BROADCASTS`,
+#: by digest. Files with references are never removed.
+_PINS: dict[str, int] = {}
+
+#: In a worker process, serialised callers received from the parent,
+#: by digest.
+_RECEIVED: OrderedDict[str, bytes] = OrderedDict()
+
+#: Number of serialised callers in :attr:`_RECEIVED` to keep.
+_RECEIVED_LIMIT: int = 4
+
+
+def _dumps(value: Any) -> bytes:
+    """Machinery.
+
+    :meta private:
+
+    Serialise :arg:`value` with `dill` if installed,
+    or :mod:`pickle` otherwise.
+    """
+    if is_installed("dill"):
+        return dill.dumps(value)
+    return pickle.dumps(value)
+
+
+def _loads(data: bytes) -> Any:
+    """Machinery.
+
+    :meta private:
+
+    Reverse :func:`_dumps`.
+    """
+    if is_installed("dill"):
+        return dill.loads(data)
+    return pickle.loads(data)
+
+
+def _broadcast_directory() -> Path:
+    """Machinery.
+
+    :meta private:
+
+    Return the directory for files in :attr:`_BROADCASTS`. Prefer
+    ``/dev/shm``, which is backed by memory, if it exists.
+    """
+    shm = Path("/dev/shm")
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        return shm
+    return Path(tempfile.gettempdir())
+
+
+def _broadcast[S, A, B](fn: Callable[[S, A], B],
+                        self: S,
+                        share_self: bool) -> tuple[str, str]:
+    """Machinery.
+
+    :meta private:
+
+    Serialise :arg:`fn` and :arg:`self` once, then store the result
+    in a file that worker processes can read. Return a reference
+    for :func:`_receive`.
+
+    If the same values are broadcast again, reuse the same file.
+    The file is kept until the reference is given to :func:`_release`.
+
+    If :arg:`self` has not been assigned to since it was last
+    broadcast with :arg:`fn` (see :func:`__setattr__`), then reuse
+    that file without serialising :arg:`self` again.
+    """
+    version: Optional[int] = _version_of(self)
+    if version is not None:
+        memo = self.__dict__.get("_broadcast_memo")
+        if memo is not None and memo[0] is fn\
+                and memo[1] == version and memo[2] == share_self:
+            digest: str = memo[3]
+            with _LOCK:
+                path = _BROADCASTS.get(digest)
+                if path is not None:
+                    _BROADCASTS.move_to_end(digest)
+                    _PINS[digest] = _PINS.get(digest, 0) + 1
+                    return (str(path), digest)
+
+    caller: S = copy.deepcopy(self) if share_self else self
+    data: bytes = _dumps((fn, caller))
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    if version is not None:
+        # Bypass :func:`__setattr__`, which would change the version.
+        object.__setattr__(self, "_broadcast_memo",
+                           (fn, version, share_self, digest))
+
+    with _LOCK:
+        path = _BROADCASTS.get(digest)
+        if path is not None:
+            _BROADCASTS.move_to_end(digest)
+        else:
+            path = _broadcast_directory()\
+                / f"evokit-{os.getpid()}-{digest}"
+            # Write then rename, so that workers never see
+            #   a partial file.
+            partial_path = path.with_suffix(".partial")
+            partial_path.write_bytes(data)
+            partial_path.replace(path)
+            _BROADCASTS[digest] = path
+        _PINS[digest] = _PINS.get(digest, 0) + 1
+        _evict()
+
+    return (str(path), digest)
+
+
+def _version_of(self: Any) -> Optional[int]:
+    """Machinery.
+
+    :meta private:
+
+    Return the version that :func:`__setattr__` has given
+    :arg:`self`, or :python:`None` if :arg:`self` is not versioned.
+    A class that overrides :func:`__setattr__` is not versioned,
+    because its assignments may not change the version.
+    """
+    if type(self).__setattr__ is not __setattr__:
+        return None
+    return getattr(self, "__dict__", {}).get("_version")
+
+
+def _release(reference: tuple[str, str]) -> None:
+    """Machinery.
+
+    :meta private:
+
+    Drop a reference that :func:`_broadcast` has returned. Once
+    no reference to a file remains, the file may be removed.
+    """
+    _, digest = reference
+    with _LOCK:
+        count = _PINS.get(digest, 0) - 1
+        if count > 0:
+            _PINS[digest] = count
+        else:
+            _PINS.pop(digest, None)
+        _evict()
+
+
+def _evict() -> None:
+    """Machinery.
+
+    :meta private:
+
+    Remove the oldest files in :attr:`_BROADCASTS` that have no
+    references, until at most :attr:`_BROADCAST_LIMIT` remain.
+    Callers must hold :attr:`_LOCK`.
+    """
+    excess = len(_BROADCASTS) - _BROADCAST_LIMIT
+    for digest in list(_BROADCASTS):
+        if excess <= 0:
+            break
+        if digest not in _PINS:
+            _BROADCASTS.pop(digest).unlink(missing_ok=True)
+            excess -= 1
+
+
+def _receive(reference: tuple[str, str]) -> Any:
+    """Machinery.
+
+    :meta private:
+
+    In a worker process, return a fresh copy of what
+    :func:`_broadcast` has stored. Only read the file when it
+    is referenced for the first time.
+
+    Keep the serialised bytes, not the caller itself, so that
+    changes a task makes to the caller do not reach later tasks.
+    """
+    path, digest = reference
+    try:
+        _RECEIVED.move_to_end(digest)
+        data = _RECEIVED[digest]
+    except KeyError:
+        data = Path(path).read_bytes()
+        _RECEIVED[digest] = data
+        while len(_RECEIVED) > _RECEIVED_LIMIT:
+            _RECEIVED.popitem(last=False)
+    return _loads(data)
+
+
+def _run_chunk[A](reference: tuple[str, str],
+                  chunk: Sequence[A]) -> tuple[list[Any], float]:
+    """Machinery.
+
+    :meta private:
+
+    In a worker process, call the broadcast function with a fresh
+    copy of the broadcast caller and each item in :arg:`chunk`.
+    Return the results and the time taken.
+    """
+    fn, self = _receive(reference)
+    start: float = time.perf_counter()
+    results = [fn(self, item) for item in chunk]
+    return (results, time.perf_counter() - start)
+
+
+def _run_one[A](reference: tuple[str, str], item: A) -> Any:
+    """Machinery.
+
+    :meta private:
+
+    In a worker process, call the broadcast function with a fresh
+    copy of the broadcast caller and :arg:`item`.
+    """
+    fn, self = _receive(reference)
+    return fn(self, item)
+
+
+def _split[A](iterable: Sequence[A],
+              policy: ChunkPolicy,
+              worker_count: int) -> list[list[A]]:
+    """Machinery.
+
+    :meta private:
+
+    Split :arg:`iterable` into chunks of the size that
+    :arg:`policy` decides.
+    """
+    items: list[A] = list(iterable)
+    size: int = max(1, policy.chunk_size(len(items), worker_count))
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _collect[B](outcomes: Sequence[tuple[list[B], float]],
+                policy: ChunkPolicy) -> list[B]:
+    """Machinery.
+
+    :meta private:
+
+    Report the time taken for each chunk to :arg:`policy`,
+    then return all results in order.
+    """
+    results: list[B] = []
+    for chunk_results, seconds in outcomes:
+        policy.record(len(chunk_results), seconds)
+        results.extend(chunk_results)
+    return results
+
+
+def _worker_count(pool: ProcessPoolExecutor | ThreadPoolExecutor | Pool)\
+        -> int:
+    """Machinery.
+
+    :meta private:
+
+    Return the number of workers in :arg:`pool`.
+    """
+    # Neither class exposes this number publicly.
+    count = getattr(pool, "_max_workers", None)\
+        or getattr(pool, "_processes", None)
+    return count or os.cpu_count() or 1
+
+
+def _thread_caller[S](self: S) -> S:
+    """Machinery.
+
+    :meta private:
+
+    Return a shallow copy of :arg:`self` for one worker thread.
+    Also copy attributes named in ``self.thread_local_attributes``,
+    so that threads do not share them.
+    """
+    caller: S = type(self).__new__(type(self))  # type: ignore[call-overload]
+    caller.__dict__.update(self.__dict__)
+    for name in getattr(self, "thread_local_attributes", ()):
+        setattr(caller, name, copy.copy(getattr(self, name)))
+    return caller
+
+
+def _run_chunk_in_thread[S, A, B](
+        fn: Callable[[S, A], B],
+        self: S,
+        chunk: Sequence[A]) -> tuple[list[B], float]:
+    """Machinery.
+
+    :meta private:
+
+    In a worker thread, call :arg:`fn` with a copy of :arg:`self`
+    and each item in :arg:`chunk`. Return the results and the
+    time taken.
+    """
+    caller: S = _thread_caller(self)
+    start: float = time.perf_counter()
+    results = [fn(caller, item) for item in chunk]
+    return (results, time.perf_counter() - start)
+
+
+def _run_one_in_thread[S, A, B](fn: Callable[[S, A], B],
+                                self: S,
+                                item: A) -> B:
+    """Machinery.
+
+    :meta private:
+
+    In a worker thread, call :arg:`fn` with a copy of :arg:`self`
+    and :arg:`item`.
+    """
+    return fn(_thread_caller(self), item)
+
+
+def _execute_with_threads[S, A, B](executor: ThreadPoolExecutor,
+                                   fn: Callable[[S, A], B],
+                                   self: S,
+                                   iterable: Sequence[A],
+                                   policy: ChunkPolicy) -> Sequence[B]:
+    task = partial(_run_chunk_in_thread, fn, self)
+    chunks = _split(iterable, policy, _worker_count(executor))
+    return _collect(list(executor.map(task, chunks)), policy)
 
 
 def _execute_with_executor[S, A, B](processes: ProcessPoolExecutor | int,
                                     fn: Callable[[S, A], B],
                                     self: S,
                                     iterable: Sequence[A],
-                                    share_self: bool) -> Sequence[B]:
+                                    share_self: bool,
+                                    policy: ChunkPolicy) -> Sequence[B]:
+    executor: ProcessPoolExecutor = _managed_pool(processes)\
+        if isinstance(processes, int) else processes  # type: ignore
+    reference = _broadcast(fn, self, share_self)
+    task = partial(_run_chunk, reference)
+    chunks = _split(iterable, policy, _worker_count(executor))
     try:
-        if isinstance(processes, int):
-            with ProcessPoolExecutor(max_workers=processes) as exec:
-                return list(exec.map(fn,
-                                     _duplicate_self(self,
-                                                     share_self,
-                                                     iterable),
-                                     iterable))
-        else:
-            return list(processes.map(fn,
-                                      _duplicate_self(self,
-                                                      share_self,
-                                                      iterable),
-                                      iterable))
+        return _collect(list(executor.map(task, chunks)), policy)
     except BrokenProcessPool:
+        _discard_pool(executor)
         raise NotImplementedError(
             """Work in a worker process has abruptly halted.
 
@@ -180,35 +947,30 @@ the same author. Alternatively, change
 either the operator of individual
 representations to evade the problem.
 """)
+    finally:
+        _release(reference)
 
 
 def _execute_with_pool[S, A, B](processes: Pool | int,
                                 fn: Callable[[S, A], B],
                                 self: S,
                                 iterable: Sequence[A],
-                                share_self: bool) -> Sequence[B]:
-    # First, execute a task to see what happens
-
-    results: Sequence[B]
+                                share_self: bool,
+                                policy: ChunkPolicy) -> Sequence[B]:
+    pool: Pool = _managed_pool(processes)\
+        if isinstance(processes, int) else processes  # type: ignore
 
-    if isinstance(processes, int):
-        with Pool(processes) as pool:
-            futures = [pool.apply_async(func=fn,
-                                        args=[self, it])
-                       for it in iterable]
+    reference = _broadcast(fn, self, share_self)
+    chunks = _split(iterable, policy, _worker_count(pool))
 
-            results = [*[fut.get() for fut in futures]]
-
-    else:
-        results = processes.starmap(
-            fn, [[self, it] for it in iterable]
-        )
-        # futures = [processes.apply_async(func=fn,
-        #                                  args=[sf, it]) for sf, it
-        #            in zip(our_selves, iterable)]
-        # results = [*[fut.get() for fut in futures]]
+    try:
+        futures = [pool.apply_async(func=_run_chunk,
+                                    args=[reference, chunk])
+                   for chunk in chunks]
 
-    return results
+        return _collect([fut.get() for fut in futures], policy)
+    finally:
+        _release(reference)
 
 
 def __getstate__(self: object) -> dict[str, Any]:
@@ -218,25 +980,61 @@ def __getstate__(self: object) -> dict[str, Any]:
 
     Ensure that when this object is pickled, its process pool,
     if any is defined (see :meth:`Variator.processes` and
-    `Evaluator.processes`), is not pickled.
+    `Evaluator.processes`), is not pickled. Neither are its
+    chunking policy and its fitness cache.
     """
     self_dict = self.__dict__.copy()
     del self_dict['processes']
+    # The chunking policy may change after each task, and is
+    #   only used by the parent process.
+    self_dict.pop('chunking', None)
+    # Workers do not consult the fitness cache.
+    self_dict.pop('cache', None)
+    # Bookkeeping of :func:`_broadcast`. Leave it out, so that
+    #   equal objects serialise to equal bytes.
+    self_dict.pop('_version', None)
+    self_dict.pop('_broadcast_memo', None)
     return self_dict
 
 
+#: Source of versions for :func:`__setattr__`. Versions are unique
+#: across all objects.
+_VERSIONS = itertools.count()
+
+
+def __setattr__(self: object, name: str, value: Any) -> None:
+    """Machinery.
+
+    :meta private:
+
+    Set an attribute, then give this object a new version. Then,
+    :func:`_broadcast` serialises this object again, instead of
+    reusing what it has sent before.
+
+    Changes made inside an attribute (for example, appending to a
+    list) do not change the version. Assign the attribute again
+    to send such changes to worker processes.
+    """
+    object.__setattr__(self, name, value)
+    object.__setattr__(self, "_version", next(_VERSIONS))
+
+
 def __deepcopy__(self: object, memo: dict[int, Any]):
     """Machinery.
 
     :meta private:
 
     Ensure that when this object is shared by processes,
-    its non-serialisable members are not copied.
+    its non-serialisable members are not copied. Its fitness
+    cache, if any, is shared instead of copied.
     """
     new_self = type(self).__new__(type(self))
     # Making sure nothing is copied for more than once.
     memo[id(self)] = new_self
     for key, value in self.__dict__.items():
+        if key == 'cache':
+            setattr(new_self, key, value)
+            continue
         can_pickle_this: bool
         try:
             can_pickle_this =\
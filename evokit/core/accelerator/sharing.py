@@ -0,0 +1,207 @@
+"""This module shares NumPy arrays with worker processes
+through :mod:`multiprocessing.shared_memory`.
+
+A :class:`SharedArray` is serialised as a reference to its block
+of shared memory, instead of as its content. When a
+:class:`SharedArray` is sent to a worker, the worker maps that
+block once, then reuses it.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from weakref import WeakValueDictionary
+
+from ..._utils.dependency import ensure_installed
+
+import sys
+import threading
+import weakref
+
+if TYPE_CHECKING:
+    from typing import Iterator
+    from typing import Optional
+    from typing import Self
+    from numpy.typing import ArrayLike
+    from numpy.typing import NDArray
+
+
+#: Arrays that this process has created or attached, by name.
+_ARRAYS: WeakValueDictionary[str, SharedArray] = WeakValueDictionary()
+
+#: In a worker process, arrays that the worker has attached, by name.
+#: Keeps these arrays alive, so that they are attached only once.
+_ATTACHED: dict[str, SharedArray] = {}
+
+#: Guards :attr:`_ARRAYS` and :attr:`_ATTACHED`.
+_LOCK = threading.Lock()
+
+
+class SharedArray:
+    """A read-only NumPy array in shared memory.
+
+    When serialised (for example, to be sent to a worker process),
+    a :class:`SharedArray` only carries the name, shape, and data
+    type of its block of shared memory. The receiving process maps
+    the same block without copying it.
+
+    The process that creates a :class:`SharedArray` owns its block,
+    and releases the block when the array is garbage-collected.
+
+    Requires NumPy.
+
+    .. warning::
+        Workers keep every array they receive. Create shared arrays
+        for data that lasts, such as fitness cases, not for data
+        that changes with each generation.
+    """
+    def __init__(self: Self, array: ArrayLike):
+        """
+        Args:
+            array: Values to copy into shared memory.
+
+        Raise:
+            TypeError: If :arg:`array` holds Python objects.
+        """
+        ensure_installed("numpy")
+        import numpy as np
+
+        source: NDArray[Any] = np.ascontiguousarray(array)
+        if source.dtype.hasobject:
+            raise TypeError("Cannot share an array of Python objects.")
+        # A block must have at least one byte.
+        memory = SharedMemory(create=True, size=max(1, source.nbytes))
+        self._memory: SharedMemory = memory
+        self._finaliser = _finalise(self, memory, True)
+
+        #: The shared values. Read-only.
+        self.array: NDArray[Any] = np.ndarray(source.shape,
+                                              dtype=source.dtype,
+                                              buffer=memory.buf)
+        self.array[...] = source
+        self.array.flags.writeable = False
+
+        with _LOCK:
+            _ARRAYS[self.name] = self
+
+    @property
+    def name(self: Self) -> str:
+        """Name of the block of shared memory.
+        """
+        return self._memory.name
+
+    def __reduce__(self: Self) -> tuple[Any, ...]:
+        # A function of this module, so that `dill` serialises it
+        #   by reference instead of by value.
+        return (_attach_array,
+                (self.name, self.array.shape, self.array.dtype.str))
+
+    def __copy__(self: Self) -> Self:
+        # The array is read-only, so sharing it is safe.
+        return self
+
+    def __deepcopy__(self: Self, memo: dict[int, Any]) -> Self:
+        return self
+
+    def __array__(self: Self, dtype: Any = None,
+                  copy: Optional[bool] = None) -> NDArray[Any]:
+        import numpy as np
+        if copy:
+            return np.array(self.array, dtype=dtype)
+        return np.asarray(self.array, dtype=dtype)
+
+    def __len__(self: Self) -> int:
+        return len(self.array)
+
+    def __getitem__(self: Self, key: Any) -> Any:
+        return self.array[key]
+
+    def __iter__(self: Self) -> Iterator[Any]:
+        return iter(self.array)
+
+    def __repr__(self: Self) -> str:
+        return f"SharedArray({self.array!r})"
+
+
+def _attach_array(name: str,
+                  shape: tuple[int, ...],
+                  dtype: str) -> SharedArray:
+    """Machinery.
+
+    :meta private:
+
+    Return the array in the block named :arg:`name`. If this
+    process has already created or attached it, return
+    that array.
+    """
+    import numpy as np
+
+    with _LOCK:
+        existing: Optional[SharedArray] = _ARRAYS.get(name)
+        if existing is not None:
+            return existing
+
+        shared = SharedArray.__new__(SharedArray)
+        memory: SharedMemory = _attach_memory(name)
+        shared._memory = memory
+        shared._finaliser = _finalise(shared, memory, False)
+        shared.array = np.ndarray(shape,
+                                  dtype=np.dtype(dtype),
+                                  buffer=memory.buf)
+        shared.array.flags.writeable = False
+
+        _ARRAYS[name] = shared
+        _ATTACHED[name] = shared
+        return shared
+
+
+def _attach_memory(name: str) -> SharedMemory:
+    """Machinery.
+
+    :meta private:
+
+    Attach the block of shared memory named :arg:`name`, without
+    registering it with the resource tracker.
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name,
+                            track=False)  # type: ignore[call-arg]
+
+    # Before Python 3.13, attaching also registers the block with
+    #   the resource tracker. If this process has its own tracker,
+    #   that tracker would unlink the block when this process exits,
+    #   while the owner still uses it.
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None
+    try:
+        return SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+def _finalise(shared: SharedArray,
+              memory: SharedMemory,
+              owner: bool) -> Any:
+    """Machinery.
+
+    :meta private:
+
+    Release :arg:`memory` when :arg:`shared` is garbage-collected,
+    or when the interpreter exits. Only the owner unlinks the block.
+    """
+    def release() -> None:
+        try:
+            memory.close()
+        except BufferError:
+            # Some view of the block is still alive. The block is
+            #   unmapped when the process exits.
+            pass
+        if owner:
+            try:
+                memory.unlink()
+            except FileNotFoundError:
+                pass
+
+    return weakref.finalize(shared, release)
@@ -2,26 +2,44 @@ from __future__ import annotations
 
 from abc import ABC, ABCMeta, abstractmethod
 from typing import TYPE_CHECKING, Generic, TypeVar
+from typing import Literal
+from collections import OrderedDict
 from functools import wraps
+from concurrent.futures import ThreadPoolExecutor
 
 from .accelerator.parallelisers import __getstate__
 from .accelerator.parallelisers import __deepcopy__
+from .accelerator.parallelisers import __setattr__
 
 from .accelerator import parallelise_task
 
 from .population import Individual
+from .population import Population
+from .._utils.dependency import ensure_installed
+from .._utils.dependency import is_installed
+
+if is_installed("dill"):
+    import dill  # type: ignore[import-untyped]
 
 
 from typing import Any
 
+import asyncio
+import inspect
+
 if TYPE_CHECKING:
     from typing import Self
     from typing import Type
     from typing import Callable
+    from typing import Awaitable
+    from typing import Hashable
+    from pathlib import Path
     from typing import Sequence
-    from .population import Population
+    from typing import Iterable
+    from typing import Iterator
     from typing import Optional
     from concurrent.futures import ProcessPoolExecutor
+    from .accelerator import ChunkPolicy
 
 
 D = TypeVar("D", bound=Individual[Any])
@@ -57,9 +75,28 @@ class _MetaEvaluator(ABCMeta):
                     return custom_evaluate(self, individual, *args, **kwargs)
             return wrapper
 
-        namespace["evaluate"] = wrap_function(
-            namespace.setdefault("evaluate", lambda: None)
-        )
+        def wrap_coroutine(
+                custom_evaluate: Callable[[Any, Any],
+                                          Awaitable[tuple[float, ...]]])\
+                -> Callable[[Any, Any], Awaitable[tuple[float, ...]]]:
+            # Same as :meth:`wrap_function`, for :class:`AsyncEvaluator`.
+            @wraps(custom_evaluate)
+            async def wrapper(self: Evaluator[Any],
+                              individual: Individual[Any],
+                              *args: Any,
+                              **kwargs: Any) -> tuple[float, ...]:
+                if (self.retain_fitness and individual.has_fitness()):
+                    return individual.fitness
+                else:
+                    return await custom_evaluate(self, individual,
+                                                 *args, **kwargs)
+            return wrapper
+
+        custom_evaluate = namespace.setdefault("evaluate", lambda: None)
+        if inspect.iscoroutinefunction(custom_evaluate):
+            namespace["evaluate"] = wrap_coroutine(custom_evaluate)
+        else:
+            namespace["evaluate"] = wrap_function(custom_evaluate)
         return type.__new__(mcls, name, bases, namespace)
 
 
@@ -70,6 +107,11 @@ class Evaluator(ABC, Generic[D], metaclass=_MetaEvaluator):
 
     Tutorial: :doc:`../guides/examples/onemax`.
     """
+    #: Names of attributes that :meth:`evaluate` modifies. When
+    #: evaluating in threads, each thread copies these attributes.
+    #: See :func:`.parallelise_task`.
+    thread_local_attributes: tuple[str, ...] = ()
+
     def __new__(cls, *args: Any, **kwargs: Any) -> Self:
         """Machinery.
 
@@ -79,17 +121,26 @@ class Evaluator(ABC, Generic[D], metaclass=_MetaEvaluator):
         """
         instance = super().__new__(cls)
         instance.retain_fitness = False
+        instance.processes = None
+        instance.share_self = False
+        instance.chunking = None
+        instance.cache = None
         return instance
 
     def __init__(self: Self,
                  *args,
-                 processes: Optional[int | ProcessPoolExecutor] = None,
+                 processes: Optional[int | str | ProcessPoolExecutor
+                                     | ThreadPoolExecutor] = None,
                  share_self: bool = False,
+                 chunking: Optional[ChunkPolicy | int] = None,
+                 cache: Optional[FitnessCache[D]] = None,
                  **kwargs) -> None:
         """
         Args:
             processes: See :class:`.Variator`.
             share_self: See :class:`.Variator`.
+            chunking: See :func:`.parallelise_task`.
+            cache: See :attr:`cache`.
         """
         self.retain_fitness: bool
         """ If this evaluator should re-evaluate an :class:`.Individual` whose
@@ -100,6 +151,13 @@ class Evaluator(ABC, Generic[D], metaclass=_MetaEvaluator):
 
         self.share_self = share_self
 
+        self.chunking = chunking
+
+        #: If not :python:`None`, :meth:`evaluate_population` remembers
+        #: fitnesses in this cache, and evaluates each genome once.
+        #: Calls to :meth:`evaluate` do not use the cache.
+        self.cache: Optional[FitnessCache[D]] = cache
+
     @abstractmethod
     def evaluate(self: Self,
                  individual: D,
@@ -134,20 +192,454 @@ class Evaluator(ABC, Generic[D], metaclass=_MetaEvaluator):
         Effect:
             For each item in :arg:`pop`, set its :attr:`.Individual.fitness`.
 
+        If :attr:`cache` is set, then individuals whose genomes are
+        in the cache are not evaluated. Individuals with the same
+        genome are evaluated once.
+
         .. note::
             Overrides of this method must **never** return a value.
             It does its work through effects.
         """
-        fitnesses: Sequence[tuple[float, ...]] = parallelise_task(
+        fitnesses: Sequence[tuple[float, ...]]
+        if self.cache is None:
+            fitnesses = self._evaluate_all(pop)
+        else:
+            fitnesses = self._evaluate_with_cache(pop, self.cache)
+
+        for (individual, fitness) in zip(pop, fitnesses):
+            individual.fitness = fitness
+
+        # Prepare :meth:`.Population.fitness_matrix`.
+        pop._cache_fitnesses(fitnesses)
+
+    def evaluate_stream(self: Self,
+                        individuals: Iterable[D],
+                        batch_size: int = 1024) -> Iterator[D]:
+        """Evaluate individuals as they are produced.
+
+        Collect :arg:`individuals` into batches of :arg:`batch_size`.
+        Evaluate each batch with :meth:`evaluate_population`, then
+        yield its members. At most one batch is held at once.
+
+        Args:
+            individuals: Individuals to evaluate.
+
+            batch_size: Number of individuals in each batch. Larger
+                batches give workers more to do at once.
+        """
+        batch: list[D] = []
+        for individual in individuals:
+            batch.append(individual)
+            if len(batch) >= batch_size:
+                yield from self._evaluate_batch(batch)
+                batch = []
+        if batch:
+            yield from self._evaluate_batch(batch)
+
+    def _evaluate_batch(self: Self, batch: list[D]) -> Population[D]:
+        """Machinery.
+
+        :meta private:
+
+        Evaluate :arg:`batch` with :meth:`evaluate_population`.
+        """
+        population: Population[D] = Population(batch)
+        self.evaluate_population(population)
+        return population
+
+    def _evaluate_all(self: Self,
+                      individuals: Sequence[D]) -> Sequence[tuple[float, ...]]:
+        """Machinery.
+
+        :meta private:
+
+        Evaluate :arg:`individuals`, in parallel if so configured.
+        """
+        return parallelise_task(
             fn=self.evaluate.__func__,  # type: ignore
             self=self,
-            iterable=pop,
+            iterable=individuals,
             processes=self.processes,
-            share_self=self.share_self
+            share_self=self.share_self,
+            chunking=self.chunking
         )
 
-        for (individual, fitness) in zip(pop, fitnesses):
-            individual.fitness = fitness
+    def _evaluate_with_cache(self: Self,
+                             pop: Population[D],
+                             cache: FitnessCache[D])\
+            -> list[tuple[float, ...]]:
+        """Machinery.
+
+        :meta private:
+
+        Look up :arg:`pop` in :arg:`cache`. Evaluate each genome
+        that is not found once, then remember its fitness.
+        """
+        keys: list[Hashable] = [cache.key_of(x) for x in pop]
+        found: list[Optional[tuple[float, ...]]] =\
+            [cache.lookup(key) for key in keys]
+
+        missing: dict[Hashable, D] = {}
+        for key, individual, fitness in zip(keys, pop, found):
+            if fitness is None and key not in missing:
+                missing[key] = individual
+
+        computed: dict[Hashable, tuple[float, ...]] = dict(
+            zip(missing, self._evaluate_all(list(missing.values()))))
+        for key, fitness in computed.items():
+            cache.store(key, fitness)
+
+        return [fitness if fitness is not None else computed[key]
+                for key, fitness in zip(keys, found)]
 
     __getstate__ = __getstate__
     __deepcopy__ = __deepcopy__
+    __setattr__ = __setattr__
+
+
+class FitnessCache(Generic[D]):
+    """Remember fitnesses of individuals, by their genomes.
+
+    Give a cache to :class:`Evaluator` (see :attr:`Evaluator.cache`),
+    so that offspring that repeat a known genome are not evaluated
+    again. Genomes are identified by :meth:`.Individual.genome_key`,
+    or by :arg:`key` if given.
+
+    .. warning::
+        The evaluator should be deterministic. Otherwise, the
+        remembered fitness may differ from what the evaluator
+        would return.
+    """
+    def __init__(self: Self,
+                 max_size: Optional[int] = 65536,
+                 policy: Literal["lru", "lfu"] = "lru",
+                 key: Optional[Callable[[D], Hashable]] = None) -> None:
+        """
+        Args:
+            max_size: Most fitnesses to remember. If :python:`None`,
+                then remember all.
+
+            policy: Which fitness to forget when the cache is full.
+
+                * ``"lru"``: the least recently used.
+
+                * ``"lfu"``: the least frequently used. Among those,
+                  the least recently used.
+
+            key: Return the key of an individual. If :python:`None`,
+                then use :meth:`.Individual.genome_key`.
+
+        Raise:
+            ValueError: If :arg:`policy` is not one of the above.
+        """
+        if policy not in ("lru", "lfu"):
+            raise ValueError(f"Policy must be \"lru\" or \"lfu\"."
+                             f" Got: {policy}")
+        #: Most fitnesses to remember.
+        self.max_size: Optional[int] = max_size
+        #: Which fitness to forget when the cache is full.
+        self.policy: Literal["lru", "lfu"] = policy
+        #: Return the key of an individual.
+        self.key: Optional[Callable[[D], Hashable]] = key
+
+        #: Number of lookups that found a fitness.
+        self.hits: int = 0
+        #: Number of lookups that did not.
+        self.misses: int = 0
+        #: Number of fitnesses forgotten to make room.
+        self.evictions: int = 0
+
+        self._fitnesses: dict[Hashable, tuple[float, ...]] = {}
+        # For LRU, keys from least to most recently used.
+        self._recency: OrderedDict[Hashable, None] = OrderedDict()
+        # For LFU, number of uses of each key, and keys with each
+        #   number of uses, from least to most recently used.
+        self._uses: dict[Hashable, int] = {}
+        self._by_uses: dict[int, OrderedDict[Hashable, None]] = {}
+        self._least_uses: int = 0
+
+    def key_of(self: Self, individual: D) -> Hashable:
+        """Return the key of :arg:`individual`.
+        """
+        if self.key is not None:
+            return self.key(individual)
+        return individual.genome_key()
+
+    def lookup(self: Self, key: Hashable) -> Optional[tuple[float, ...]]:
+        """Return the fitness remembered for :arg:`key`, or
+        :python:`None` if there is none.
+        """
+        fitness = self._fitnesses.get(key)
+        if fitness is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._touch(key)
+        return fitness
+
+    def store(self: Self, key: Hashable, fitness: tuple[float, ...]) -> None:
+        """Remember that :arg:`key` has :arg:`fitness`.
+        """
+        if key in self._fitnesses:
+            self._fitnesses[key] = fitness
+            self._touch(key)
+            return
+
+        if self.max_size is not None:
+            if self.max_size < 1:
+                return
+            while len(self._fitnesses) >= self.max_size:
+                self._evict()
+
+        self._fitnesses[key] = fitness
+        if self.policy == "lru":
+            self._recency[key] = None
+        else:
+            self._uses[key] = 1
+            self._by_uses.setdefault(1, OrderedDict())[key] = None
+            self._least_uses = 1
+
+    @property
+    def hit_rate(self: Self) -> float:
+        """Fraction of lookups that found a fitness. ``nan`` if
+        there has been no lookup.
+        """
+        lookups: int = self.hits + self.misses
+        return self.hits / lookups if lookups else float('nan')
+
+    def clear(self: Self) -> None:
+        """Forget all fitnesses. Statistics are kept.
+        """
+        self._fitnesses.clear()
+        self._recency.clear()
+        self._uses.clear()
+        self._by_uses.clear()
+        self._least_uses = 0
+
+    def save(self: Self, file_path: str | Path) -> None:
+        """Pickle this cache with :mod:`dill`, then dump the result
+        to :arg:`file_path`. See :meth:`load`.
+
+        Effect:
+            The file :arg:`file_path` is created or overwritten.
+        """
+        ensure_installed("dill")
+        with open(file_path, mode='wb') as file:
+            dill.dump(self, file)  # type: ignore
+
+    @staticmethod
+    def load(file_path: str | Path) -> FitnessCache[Any]:
+        """Load a cache from :arg:`file_path`. Return the result.
+
+        Use this to reuse fitnesses across runs.
+        """
+        ensure_installed("dill")
+        with open(file_path, mode='rb') as file:
+            return dill.load(file)  # type: ignore
+
+    def __len__(self: Self) -> int:
+        return len(self._fitnesses)
+
+    def _touch(self: Self, key: Hashable) -> None:
+        """Machinery.
+
+        :meta private:
+
+        Record a use of :arg:`key`.
+        """
+        if self.policy == "lru":
+            self._recency.move_to_end(key)
+            return
+
+        uses: int = self._uses[key]
+        bucket = self._by_uses[uses]
+        del bucket[key]
+        if not bucket:
+            del self._by_uses[uses]
+            if self._least_uses == uses:
+                self._least_uses = uses + 1
+        self._uses[key] = uses + 1
+        self._by_uses.setdefault(uses + 1, OrderedDict())[key] = None
+
+    def _evict(self: Self) -> None:
+        """Machinery.
+
+        :meta private:
+
+        Forget one fitness, as :attr:`policy` decides.
+        """
+        key: Hashable
+        if self.policy == "lru":
+            key, _ = self._recency.popitem(last=False)
+        else:
+            if self._least_uses not in self._by_uses:
+                self._least_uses = min(self._by_uses)
+            bucket = self._by_uses[self._least_uses]
+            key, _ = bucket.popitem(last=False)
+            if not bucket:
+                del self._by_uses[self._least_uses]
+            del self._uses[key]
+        del self._fitnesses[key]
+        self.evictions += 1
+
+
+class AsyncEvaluator(Evaluator[D]):
+    """Base class for evaluators whose :meth:`evaluate`
+    is a coroutine.
+
+    Suits evaluations that mostly wait, for example on a simulator
+    or a remote service. :meth:`evaluate_population` keeps up to
+    :attr:`concurrency` evaluations in flight at once, in one
+    process. As with :class:`Evaluator`, genomes found in
+    :attr:`.Evaluator.cache` are not evaluated again.
+
+    Derive this class and define :meth:`evaluate` with
+    :python:`async def`.
+    """
+    def __init__(self: Self,
+                 *args: Any,
+                 concurrency: int = 64,
+                 timeout: Optional[float] = None,
+                 retries: int = 0,
+                 **kwargs: Any) -> None:
+        """
+        Args:
+            concurrency: Most evaluations to run at once.
+
+            timeout: Seconds each call to :meth:`evaluate` may take.
+                If :python:`None`, then calls never time out.
+
+            retries: Times to retry a call to :meth:`evaluate`
+                that raises an exception or times out.
+
+        Raise:
+            ValueError: If :arg:`concurrency` is less than 1,
+                or if :arg:`retries` is negative.
+        """
+        super().__init__(*args, **kwargs)
+        if concurrency < 1:
+            raise ValueError(f"Concurrency must be at least 1."
+                             f" Got: {concurrency}")
+        if retries < 0:
+            raise ValueError(f"Retries must not be negative."
+                             f" Got: {retries}")
+        #: Most evaluations to run at once.
+        self.concurrency: int = concurrency
+        #: Seconds each call to :meth:`evaluate` may take.
+        self.timeout: Optional[float] = timeout
+        #: Times to retry a failed call to :meth:`evaluate`.
+        self.retries: int = retries
+
+    @abstractmethod
+    async def evaluate(self: Self,  # type: ignore[override]
+                       individual: D,
+                       *args: Any,
+                       **kwargs: Any) -> tuple[float, ...]:
+        """Evaluation strategy. Return the fitness of an individual.
+
+        Subclasses should override this method with a coroutine.
+
+        Args:
+            individual: The individual to evaluate.
+        """
+
+    def evaluate_population(self: Self,
+                            pop: Population[D],
+                            *args: Any,
+                            **kwargs: Any) -> None:
+        """Context of :meth:`evaluate`.
+
+        Run :meth:`evaluate_population_async` to completion. If an
+        event loop is already running in this thread (for example,
+        in a Jupyter notebook), run it in another thread.
+
+        Effect:
+            For each item in :arg:`pop`, set its :attr:`.Individual.fitness`.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(self.evaluate_population_async(pop))
+            return
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(asyncio.run,
+                            self.evaluate_population_async(pop)).result()
+
+    async def evaluate_population_async(self: Self,
+                                        pop: Population[D]) -> None:
+        """Same as :meth:`evaluate_population`, for callers
+        that already run in an event loop.
+
+        Raise:
+            Exception: Whatever the last attempt to evaluate an
+                individual raises, after :attr:`retries` retries.
+                :class:`TimeoutError` if that attempt timed out.
+        """
+        fitnesses: Sequence[tuple[float, ...]]
+        if self.cache is None:
+            fitnesses = await self._evaluate_all_async(pop)
+        else:
+            fitnesses = await self._evaluate_with_cache_async(
+                pop, self.cache)
+
+        for (individual, fitness) in zip(pop, fitnesses):
+            individual.fitness = fitness
+
+        # Prepare :meth:`.Population.fitness_matrix`.
+        pop._cache_fitnesses(fitnesses)
+
+    async def _evaluate_all_async(self: Self,
+                                  individuals: Sequence[D])\
+            -> Sequence[tuple[float, ...]]:
+        """Machinery.
+
+        :meta private:
+
+        Evaluate :arg:`individuals`, with up to :attr:`concurrency`
+        evaluations in flight at once.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def evaluate_one(individual: D) -> tuple[float, ...]:
+            async with semaphore:
+                for attempt in range(self.retries + 1):
+                    try:
+                        return await asyncio.wait_for(
+                            self.evaluate(individual), self.timeout)
+                    except Exception:
+                        if attempt == self.retries:
+                            raise
+            raise AssertionError("Unreachable.")
+
+        return await asyncio.gather(
+            *(evaluate_one(individual) for individual in individuals))
+
+    async def _evaluate_with_cache_async(self: Self,
+                                         pop: Population[D],
+                                         cache: FitnessCache[D])\
+            -> list[tuple[float, ...]]:
+        """Machinery.
+
+        :meta private:
+
+        Same as :meth:`_evaluate_with_cache`, but evaluate genomes
+        that are not found with :meth:`_evaluate_all_async`.
+        """
+        keys: list[Hashable] = [cache.key_of(x) for x in pop]
+        found: list[Optional[tuple[float, ...]]] =\
+            [cache.lookup(key) for key in keys]
+
+        missing: dict[Hashable, D] = {}
+        for key, individual, fitness in zip(keys, pop, found):
+            if fitness is None and key not in missing:
+                missing[key] = individual
+
+        computed: dict[Hashable, tuple[float, ...]] = dict(
+            zip(missing,
+                await self._evaluate_all_async(list(missing.values()))))
+        for key, fitness in computed.items():
+            cache.store(key, fitness)
+
+        return [fitness if fitness is not None else computed[key]
+                for key, fitness in zip(keys, found)]
@@ -5,9 +5,11 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
 
     from typing import Callable
+    from typing import Hashable
     from typing import Optional
     from typing import Self
     from typing import Type
+    from numpy.typing import NDArray
 
 from functools import wraps
 
@@ -48,7 +50,6 @@ class _MetaGenome(ABCMeta):
             def wrapper(self: Individual[Any],
                         *args: Any, **kwargs: Any) -> Individual[Any]:
                 custom_copy_result: Individual[Any]
-                custom_copy_result = custom_copy(self, *args, **kwargs)
                 # Previously commented out because inheriting fitness
                 #   was an undocumented feature that also takes control
                 #   away from the user. This change has been rolled back.
@@ -59,7 +60,10 @@ class _MetaGenome(ABCMeta):
                 if self.can_copy_fitness and self.has_fitness():
                     old_fitness = self.fitness
                     custom_copy_result = custom_copy(self, *args, **kwargs)
-                    custom_copy_result.fitness = old_fitness
+                    # The copy is not yet in any population, so no
+                    #   cached fitness matrix can depend on it. Setting
+                    #   `_fitness` directly keeps these caches valid.
+                    custom_copy_result._fitness = old_fitness
                 else:
                     custom_copy_result = custom_copy(self, *args, **kwargs)
 
@@ -99,6 +103,10 @@ class Individual(ABC, Generic[R], metaclass=_MetaGenome):
 
     Tutorial: :doc:`../guides/examples/onemax`.
     """
+    #: Incremented whenever the fitness of any individual changes.
+    #: Used by :meth:`Population.fitness_matrix` to detect stale caches.
+    _fitness_epoch: int = 0
+
     def __new__(cls: Type[Self], *args: Any, **kwargs: Any) -> Self:
         """Machinery.
 
@@ -172,6 +180,7 @@ class Individual(ABC, Generic[R], metaclass=_MetaGenome):
             Whatever. Sphinx will not see this, and neither should you.
         """
         self._fitness = value
+        Individual._fitness_epoch += 1
 
     def reset_fitness(self) -> None:
         """Reset the fitness of the individual.
@@ -180,6 +189,7 @@ class Individual(ABC, Generic[R], metaclass=_MetaGenome):
             The :attr:`.fitness` of this individual becomes ``None``.
         """
         self._fitness = None
+        Individual._fitness_epoch += 1
 
     def has_fitness(self) -> bool:
         """Return `True` if :attr:`.fitness` is not None.
@@ -187,6 +197,22 @@ class Individual(ABC, Generic[R], metaclass=_MetaGenome):
         """
         return self._fitness is not None
 
+    def genome_key(self: Self) -> Hashable:
+        """Return a hashable value that identifies :attr:`.genome`.
+
+        Individuals with equal keys should have equal fitness.
+        :class:`.FitnessCache` uses these keys to remember fitnesses.
+
+        The default implementation returns :attr:`.genome`.
+        Subclasses whose genomes are not hashable, or are
+        hashed by identity, should override this method.
+
+        Raise:
+            TypeError: If :attr:`.genome` is not hashable.
+        """
+        hash(self.genome)
+        return self.genome
+
     @abstractmethod
     def copy(self) -> Self:
         """Return an identical copy of the individual.
@@ -304,6 +330,14 @@ class Population(UserList[D], Generic[D]):
         """
         super().__init__(initlist)
 
+        # Either ``None`` or a tuple of three items: the value of
+        #   :attr:`Individual._fitness_epoch` and a copy of :attr:`data`
+        #   when the cache is made, then either the fitness matrix or
+        #   a sequence of fitnesses that it can be built from.
+        self._fitness_cache: Optional[tuple[int,
+                                            list[D],
+                                            Any]] = None
+
     def copy(self) -> Self:
         """Return an independent population.
 
@@ -345,24 +379,96 @@ class Population(UserList[D], Generic[D]):
         for x in self:
             x.reset_fitness()
 
+    def fitness_matrix(self: Self) -> NDArray[Any]:
+        """Return fitnesses of all individuals as a NumPy array.
+
+        The array has one row for each individual and one column for
+        each objective. Rows of individuals without fitness, and
+        trailing cells of fitnesses shorter than others, are ``nan``.
+
+        The array is cached. :meth:`.Evaluator.evaluate_population`
+        also prepares the cache. The cache is rebuilt if this
+        population changes, or if the fitness of any individual is set.
+
+        .. warning::
+            The returned array is read-only. Do not modify it.
+        """
+        ensure_installed("numpy")
+        import numpy as np
+
+        rows: Any
+        cache = self._fitness_cache
+        if cache is not None\
+                and cache[0] == Individual._fitness_epoch\
+                and _same_members(cache[1], self.data):
+            if isinstance(cache[2], np.ndarray):
+                return cache[2]
+            rows = cache[2]
+        else:
+            rows = [x._fitness for x in self.data]
+
+        matrix = _build_fitness_matrix(rows)
+        self._fitness_cache = (Individual._fitness_epoch,
+                               list(self.data),
+                               matrix)
+        return matrix
+
+    def _cache_fitnesses(self: Self,
+                         fitnesses: Sequence[tuple[float, ...]]) -> None:
+        """Machinery.
+
+        :meta private:
+
+        Remember that the individuals in this population have
+        :arg:`fitnesses`, in the same order. The fitness matrix is
+        built from these values when it is first requested.
+        """
+        self._fitness_cache = (Individual._fitness_epoch,
+                               list(self.data),
+                               fitnesses)
+
     def best(self: Self) -> D:
         """Return the highest-fitness individual in this population.
+
+        Fitnesses are compared as tuples. Individuals whose fitness
+        has a ``nan`` (including those without fitness) are ignored,
+        unless all individuals are; then, return the first individual.
+        If several individuals have the highest fitness, return the
+        first of them.
+
+        Uses :meth:`fitness_matrix` if NumPy is installed.
         """
+        if is_installed("numpy") and len(self) > 0:
+            best_index: Optional[int] =\
+                _lexicographic_argmax(self.fitness_matrix())
+            return self[0] if best_index is None else self[best_index]
+
         best_individual: D = self[0]
-        # from evokit.core.population import Population
-        # a = Population(1, 2, 3)
-        # b = Population("1", "2", "3")
+        best_is_nan: bool = _has_nan(best_individual.fitness)
 
         for x in self:
-            if best_individual.fitness == (float('nan'),):
-                best_individual = x
-            elif x.fitness == (float('nan'),):
+            if _has_nan(x.fitness):
                 pass
-            elif x.fitness > best_individual.fitness:
+            elif best_is_nan or x.fitness > best_individual.fitness:
                 best_individual = x
+                best_is_nan = False
 
         return best_individual
 
+    def take(self: Self, indices: Iterable[int]) -> Self:
+        """Return a new population of the individuals at
+        :arg:`indices`, in that order.
+
+        Individuals are not copied. Subclasses that store individuals
+        in other forms can override this method to avoid accessing
+        each individual.
+
+        Args:
+            indices: Positions of individuals in this population.
+        """
+        data = self.data
+        return type(self)([data[i] for i in indices])
+
     def __str__(self: Self) -> str:
         return "[" + ", ".join(str(item) for item in self) + "]"
 
@@ -387,6 +493,135 @@ class Population(UserList[D], Generic[D]):
     __repr__ = __str__
 
 
+def _same_members(left: Sequence[Any], right: Sequence[Any]) -> bool:
+    """Machinery.
+
+    :meta private:
+
+    Return if :arg:`left` and :arg:`right` hold the same objects,
+    in the same order. Unlike ``==``, do not call ``__eq__``, which
+    individuals may override to compare genomes.
+    """
+    return len(left) == len(right)\
+        and all(x is y for x, y in zip(left, right))
+
+
+def _has_nan(fitness: tuple[float, ...]) -> bool:
+    """Machinery.
+
+    :meta private:
+
+    Return if :arg:`fitness` has a ``nan``.
+    """
+    # `nan` is the only value that does not equal itself.
+    return any(x != x for x in fitness)
+
+
+def _build_fitness_matrix(rows: Sequence[Optional[tuple[float, ...]]])\
+        -> NDArray[Any]:
+    """Machinery.
+
+    :meta private:
+
+    Return a read-only matrix of fitnesses. See
+    :meth:`Population.fitness_matrix`.
+    """
+    import numpy as np
+
+    matrix: NDArray[Any]
+    try:
+        if None in rows:
+            raise ValueError("Some individuals have no fitness.")
+        matrix = np.array(rows, dtype=float)
+        if matrix.ndim != 2:
+            raise ValueError("Fitnesses have different lengths.")
+    except ValueError:
+        width: int = max((len(x) for x in rows if x is not None),
+                         default=1)
+        matrix = np.full((len(rows), width), np.nan)
+        for i, row in enumerate(rows):
+            if row is not None:
+                matrix[i, :len(row)] = row
+
+    matrix.flags.writeable = False
+    return matrix
+
+
+def _lexicographic_argmax(matrix: NDArray[Any]) -> Optional[int]:
+    """Machinery.
+
+    :meta private:
+
+    Return the index of the first highest row of :arg:`matrix`,
+    comparing rows as tuples. Ignore rows that have a ``nan``.
+    If all rows have a ``nan``, return ``None``.
+    """
+    import numpy as np
+
+    candidates = np.flatnonzero(~np.isnan(matrix).any(axis=1))
+    for j in range(matrix.shape[1]):
+        if candidates.size < 2:
+            break
+        column = matrix[candidates, j]
+        candidates = candidates[column == column.max()]
+
+    return int(candidates[0]) if candidates.size > 0 else None
+
+
+def _top_k_indices(matrix: NDArray[Any], k: int) -> NDArray[Any]:
+    """Machinery.
+
+    :meta private:
+
+    Return indices of the :arg:`k` highest rows of :arg:`matrix`,
+    in ascending order. Rows are compared as tuples. Rows that have
+    a ``nan`` are lower than all other rows, and are ordered among
+    themselves by index.
+
+    The result is the same as that of a stable ascending sort, then
+    taking the last :arg:`k` items. In particular, between equal rows,
+    the row with the higher index is higher.
+
+    Only rows that can be among the highest are sorted, so this
+    takes :math:`O(n)` time when few rows tie.
+    """
+    import numpy as np
+
+    n: int = matrix.shape[0]
+    k = max(0, min(k, n))
+    if k == 0:
+        return np.arange(0)
+
+    valid_rows = np.flatnonzero(~np.isnan(matrix).any(axis=1))
+
+    if valid_rows.size < k:
+        # Choose all valid rows, and the last of the others.
+        invalid_rows = np.flatnonzero(np.isnan(matrix).any(axis=1))
+        low = invalid_rows[invalid_rows.size - (k - valid_rows.size):]
+        return np.concatenate((low, _sorted_rows(matrix, valid_rows)))
+
+    # A row can only be chosen if its first objective is at least
+    #   the k-th highest first objective.
+    first = matrix[valid_rows, 0]
+    threshold = np.partition(first, first.size - k)[first.size - k]
+    candidates = valid_rows[first >= threshold]
+    return _sorted_rows(matrix, candidates)[candidates.size - k:]
+
+
+def _sorted_rows(matrix: NDArray[Any], rows: NDArray[Any]) -> NDArray[Any]:
+    """Machinery.
+
+    :meta private:
+
+    Return :arg:`rows`, which are indices of :arg:`matrix` in ascending
+    order, sorted stably by their rows in :arg:`matrix`.
+    """
+    import numpy as np
+
+    # `lexsort` sorts by the last key first, and is stable.
+    return rows[np.lexsort(matrix[rows].T[::-1])]
+
+
 def save(popi: Population | Individual,
          file_path: str | Path) -> None:
     """Produce an :meth:`.Individual.archive` of :arg:`popi`,
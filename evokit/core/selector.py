@@ -84,6 +84,23 @@ class Selector(ABC, Generic[D]):
 
         return Population(list(_generate_results()))
 
+    def select_stream(self: Self,
+                      individuals: Iterable[D],
+                      *args: Any,
+                      **kwargs: Any) -> Population[D]:
+        """Select from individuals as they are produced.
+
+        The default implementation collects :arg:`individuals` into
+        a population, then calls :meth:`select_population`. Selectors
+        that can select without keeping all individuals should
+        override this method to use less memory.
+
+        Args:
+            individuals: Individuals to select from.
+        """
+        return self.select_population(Population(list(individuals)),
+                                      *args, **kwargs)
+
     def select(self: Self,
                from_pool: Sequence[D],
                *args: Any,
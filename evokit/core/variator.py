@@ -6,13 +6,17 @@ from .accelerator import parallelise_task
 
 from .accelerator.parallelisers import __getstate__
 from .accelerator.parallelisers import __deepcopy__
+from .accelerator.parallelisers import __setattr__
 
 if TYPE_CHECKING:
     from typing import Optional
     from typing import Sequence
+    from typing import Iterator
     from typing import Self
     from typing import Type
     from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures import ThreadPoolExecutor
+    from .accelerator import ChunkPolicy
 
 from logging import warning
 from abc import abstractmethod
@@ -33,6 +37,10 @@ class Variator(ABC, Generic[D]):
 
     Tutorial: :doc:`../guides/examples/onemax`.
     """
+    #: Names of attributes that :meth:`vary` modifies. When
+    #: varying in threads, each thread copies these attributes.
+    #: See :func:`.parallelise_task`.
+    thread_local_attributes: tuple[str, ...] = ()
 
     def __new__(cls: Type[Self], *args: Any, **kwargs: Any) -> Self:
         """Machinery.
@@ -44,17 +52,21 @@ class Variator(ABC, Generic[D]):
         instance.arity = None
         instance.processes = None
         instance.share_self = False
+        instance.chunking = None
 
         return instance
 
     def __init__(self: Self,
                  *args: Any,
-                 processes: Optional[int | ProcessPoolExecutor] = None,
+                 processes: Optional[int | str | ProcessPoolExecutor
+                                     | ThreadPoolExecutor] = None,
                  share_self: bool = False,
+                 chunking: Optional[ChunkPolicy | int] = None,
                  **kwargs: Any) -> None:
         """
         See :class:`Variator` for parameters :arg:`processes`
-        and :arg:`share_self`.
+        and :arg:`share_self`. See :func:`.parallelise_task`
+        for parameter :arg:`chunking`.
         """
 
         #: Size of input to :meth:`vary`.
@@ -68,6 +80,10 @@ class Variator(ABC, Generic[D]):
         """
         self.share_self = share_self
 
+        #: How many items are sent to a worker at once.
+        #: See :func:`.parallelise_task`.
+        self.chunking = chunking
+
     @abstractmethod
     def vary(self: Self,
              parents: Sequence[D],
@@ -147,18 +163,49 @@ class Variator(ABC, Generic[D]):
                              self=self,
                              iterable=parent_groups,
                              processes=processes,
-                             share_self=share_self)
+                             share_self=share_self,
+                             chunking=self.chunking)
 
+        # Extend one list, instead of concatenating tuples, which
+        #   would take quadratic time.
+        offspring: list[D] = []
         for group in nested_results:
             for individual in group:
                 individual.reset_fitness()
+                offspring.append(individual)
 
-        next_population = Population(list(sum(nested_results, ())))
+        next_population = Population(offspring)
 
         return next_population
 
+    def vary_population_iter(self: Self,
+                             population: Population[D],
+                             *args: Any,
+                             **kwargs: Any) -> Iterator[D]:
+        """Vary the population lazily.
+
+        Same as the default :meth:`vary_population`, except that
+        offspring are produced one group of parents at a time,
+        instead of collected into a population. Use this to keep
+        only some offspring in memory at once.
+
+        Does not parallelise, and does not use overrides of
+        :meth:`vary_population`.
+
+        Args:
+            population: Population to vary.
+        """
+        if self.arity is None:
+            raise TypeError("Variator does not specify arity,"
+                            "cannot create parent groups")
+        for parents in zip(*(iter(population),) * self.arity):
+            for individual in self.vary(parents):
+                individual.reset_fitness()
+                yield individual
+
     __getstate__ = __getstate__
     __deepcopy__ = __deepcopy__
+    __setattr__ = __setattr__
 
 
 class NullVariator(Variator[D]):
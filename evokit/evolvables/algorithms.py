@@ -5,13 +5,38 @@ from ..core import Selector
 from ..core import Population
 from ..core import Individual
 from ..core import Algorithm
+from ..core.accelerator import TaskSubmitter
+from ..core.accelerator.parallelisers import _dumps
+from ..core.accelerator.parallelisers import _loads
+from .._utils.dependency import is_installed
+from .selectors import CrowdedTournamentSelector
+from .selectors import NSGA2Selector
 
 from typing import TypeVar
 from typing import Any
 from typing import override
 from typing import Generic
 from typing import Self
+from typing import Literal
+from typing import Optional
+from typing import Callable
+from typing import Sequence
 from abc import ABC
+from concurrent.futures import Future
+from concurrent.futures import wait
+from concurrent.futures import FIRST_COMPLETED
+
+import copy
+import heapq
+import random
+import traceback
+
+if is_installed("multiprocess"):
+    from multiprocess import Pipe  # type: ignore
+    from multiprocess import Process  # type: ignore
+else:
+    from multiprocessing import Pipe
+    from multiprocessing import Process
 
 
 T = TypeVar("T", bound=Individual[Any])
@@ -43,17 +68,39 @@ class SimpleLinearAlgorithm(HomogeneousAlgorithm[T]):
         #. `vary` :attr:`population`
             #. `update` :attr:`population` with result
         #. `event`: ``POST_SELECTION``
+
+    If :attr:`streaming` is set, then offspring pass from the variator
+    to the evaluator to the selector as they are produced (see
+    :meth:`.Variator.vary_population_iter`,
+    :meth:`.Evaluator.evaluate_stream`, and
+    :meth:`.Selector.select_stream`). Only survivors and one batch
+    of offspring are kept at once. The full offspring population never
+    exists, so only ``POST_SELECTION`` is fired.
     """
     @override
     def __init__(self: Self,
                  population: Population[T],
                  evaluator: Evaluator[T],
                  selector: Selector[T],
-                 variator: Variator[T]) -> None:
+                 variator: Variator[T],
+                 streaming: bool = False,
+                 batch_size: int = 1024) -> None:
+        """
+        Args:
+            streaming: If :python:`True`, then stream offspring
+                through operators instead of collecting them.
+
+            batch_size: Number of offspring to evaluate at once,
+                if :arg:`streaming` is :python:`True`.
+        """
         self.population = population
         self.evaluator = evaluator
         self.selector = selector
         self.variator = variator
+        #: If offspring are streamed through operators.
+        self.streaming: bool = streaming
+        #: Number of offspring to evaluate at once, when streaming.
+        self.batch_size: int = batch_size
         self.watchers: list[Watcher[SimpleLinearAlgorithm[T], Any]] = []
         # Each event name informs what action has taken place.
         #   This should be easier to understand, compared to "PRE_...".
@@ -64,6 +111,13 @@ class SimpleLinearAlgorithm(HomogeneousAlgorithm[T]):
 
     @override
     def step(self: Self) -> None:
+        if self.streaming:
+            offspring = self.variator.vary_population_iter(self.population)
+            self.population = self.selector.select_stream(
+                self.evaluator.evaluate_stream(offspring, self.batch_size))
+            self.update("POST_SELECTION")
+            return
+
         self.population = self.variator.vary_population(self.population)
         self.update("POST_VARIATION")
 
@@ -147,6 +201,67 @@ class LinearAlgorithm(HomogeneousAlgorithm[T]):
         self.update("POST_OFFSPRING_SELECTION")
 
 
+class NSGA2Algorithm(LinearAlgorithm[T]):
+    """NSGA-II, a multi-objective evolutionary algorithm [NSGA2]_.
+
+    Treat each item in :attr:`.Individual.fitness` as an objective to
+    maximise. Parents are chosen with :class:`.CrowdedTournamentSelector`.
+    Survivors are chosen from parents and offspring together with
+    :class:`.NSGA2Selector`, so that the population keeps its size.
+
+    Each step includes the same operations as in
+    :class:`LinearAlgorithm`, except that survivors are selected from
+    both the population before selection and its offspring. Members
+    of the population are evaluated only if they have no fitness,
+    because survivors were evaluated in an earlier step.
+
+    Requires NumPy.
+    """
+    @override
+    def __init__(self: Self,
+                 population: Population[T],
+                 evaluator: Evaluator[T],
+                 variator: Variator[T]) -> None:
+        """
+        Args:
+            population: Initial population.
+
+            evaluator: Evaluator of both parents and offspring.
+
+            variator: Variator of parents.
+        """
+        super().__init__(population=population,
+                         parent_evaluator=evaluator,
+                         parent_selector=CrowdedTournamentSelector(
+                             len(population)),
+                         variator=variator,
+                         survivor_evaluator=evaluator,
+                         survivor_selector=NSGA2Selector(len(population)))
+
+    @override
+    def step(self) -> None:
+        unevaluated: Population[T] = Population(
+            [x for x in self.population if not x.has_fitness()])
+        if unevaluated:
+            self.parent_evaluator.evaluate_population(unevaluated)
+        self.update("POST_PARENT_EVALUATION")
+
+        elders: Population[T] = self.population
+        self.population = \
+            self.parent_selector.select_population(self.population)
+        self.update("POST_PARENT_SELECTION")
+
+        self.population = self.variator.vary_population(self.population)
+        self.update("POST_VARIATION")
+
+        self.survivor_evaluator.evaluate_population(self.population)
+        self.update("POST_OFFSPRING_EVALUATION")
+
+        self.population = self.survivor_selector.select_population(
+            Population([*elders, *self.population]))
+        self.update("POST_OFFSPRING_SELECTION")
+
+
 class CanonicalGeneticAlgorithm(HomogeneousAlgorithm[T]):
     """The canonical genetic algorithm [CANON_GA]_.
 
@@ -199,3 +314,581 @@ class CanonicalGeneticAlgorithm(HomogeneousAlgorithm[T]):
 
         self.population = self.selector.select_population(self.population)
         self.update("POST_SELECTION")
+
+
+class SteadyStateAlgorithm(HomogeneousAlgorithm[T]):
+    """An evolutionary algorithm that replaces individuals one at a time.
+
+    Keep up to :attr:`in_flight` offspring in evaluation at once. When
+    an evaluation finishes, insert that offspring into
+    :attr:`population`, then breed and submit a new offspring. The
+    algorithm never waits for a whole population to be evaluated.
+
+    Offspring are evaluated as configured by :attr:`evaluator`, so
+    that :attr:`.Evaluator.processes` decides where they are evaluated
+    (see :func:`.parallelise_task`). The :meth:`.Evaluator.evaluate`
+    of the evaluator is used; :meth:`.Evaluator.evaluate_population`
+    is not.
+
+    Each step includes the following operations:
+        #. If some members of :attr:`population` have no fitness,
+           evaluate :attr:`population`
+        #. Repeat until :attr:`births` offspring are inserted:
+            #. wait for an evaluation to finish
+            #. insert that offspring into :attr:`population`
+            #. `event`: ``POST_INSERTION``
+            #. select parents from :attr:`population`, vary them,
+               then submit the offspring for evaluation
+
+    Evaluations that are in flight when a step ends carry over
+    to the next step.
+    """
+    @override
+    def __init__(self: Self,
+                 population: Population[T],
+                 evaluator: Evaluator[T],
+                 parent_selector: Selector[T],
+                 variator: Variator[T],
+                 in_flight: Optional[int] = None,
+                 replacement: Literal["worst", "tournament"] = "worst",
+                 bracket_size: int = 2,
+                 births: Optional[int] = None) -> None:
+        """
+        Args:
+            population: Initial population.
+
+            evaluator: Evaluator of offspring.
+
+            parent_selector: Selector of parents. Its
+                :attr:`.Selector.budget` should equal the
+                :attr:`.Variator.arity` of :arg:`variator`.
+
+            variator: Variator that breeds offspring with
+                :meth:`.Variator.vary`.
+
+            in_flight: Most offspring to evaluate at once. If
+                :python:`None`, then use the number of workers in
+                :attr:`.Evaluator.processes`, or ``1`` if it does not
+                parallelise.
+
+            replacement: Decides which member of :attr:`population`
+                an offspring replaces.
+
+                * ``"worst"``: the worst member, unless the offspring
+                  is worse than that member.
+
+                * ``"tournament"``: the worst of :arg:`bracket_size`
+                  members, chosen uniformly at random.
+
+            bracket_size: Size of a tournament bracket,
+                if :arg:`replacement` is ``"tournament"``.
+
+            births: Number of offspring to insert in each step. If
+                :python:`None`, then use the size of :arg:`population`.
+
+        Raise:
+            ValueError: If :arg:`replacement` is not one of
+                the above.
+        """
+        if replacement not in ("worst", "tournament"):
+            raise ValueError(f"Replacement must be \"worst\" or"
+                             f" \"tournament\". Got: {replacement}")
+        self.population = population
+        self.evaluator = evaluator
+        self.parent_selector = parent_selector
+        self.variator = variator
+        #: Most offspring to evaluate at once.
+        self.in_flight: Optional[int] = in_flight
+        #: How offspring replace members of :attr:`population`.
+        self.replacement: Literal["worst", "tournament"] = replacement
+        #: Size of a tournament bracket.
+        self.bracket_size: int = bracket_size
+        #: Number of offspring to insert in each step.
+        self.births: Optional[int] = births
+        self.watchers: list[Watcher[SteadyStateAlgorithm[T], Any]] = []
+        # Offspring in evaluation, with futures of their fitness.
+        self._pending: dict[Future[tuple[float, ...]], T] = {}
+        # Heap of ``(rank, index, version)`` for each member of
+        #   :attr:`population`. An entry is current if its version
+        #   matches that index in :attr:`_versions`.
+        self._worst: list[tuple[tuple[bool, tuple[float, ...]],
+                                int, int]] = []
+        # Version of each index in :attr:`population`.
+        self._versions: list[int] = []
+
+    events = ["POST_INSERTION"]
+
+    @override
+    def step(self: Self) -> None:
+        if not all(x.has_fitness() for x in self.population):
+            self.evaluator.evaluate_population(self.population)
+
+        births: int = self.births if self.births is not None\
+            else len(self.population)
+        in_flight: int = self._in_flight_limit()
+        # Members may have changed between steps. Index them again.
+        self._index_population()
+
+        # Offspring still in evaluation when this step ends keep the
+        #   submitter's serialised evaluator until they finish.
+        with TaskSubmitter(self.evaluator.evaluate.__func__,  # type: ignore
+                           self.evaluator,
+                           self.evaluator.processes,
+                           self.evaluator.share_self) as submitter:
+            self._fill(submitter, in_flight)
+
+            born: int = 0
+            while born < births:
+                done, _ = wait(self._pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if born >= births:
+                        # Insert the others in the next step.
+                        break
+                    offspring: T = self._pending.pop(future)
+                    offspring.fitness = future.result()
+                    self._insert(offspring)
+                    born += 1
+                    self.update("POST_INSERTION")
+                self._fill(submitter, in_flight)
+
+    def _in_flight_limit(self: Self) -> int:
+        """Machinery.
+
+        :meta private:
+
+        Return the most offspring to evaluate at once.
+        """
+        if self.in_flight is not None:
+            return max(1, self.in_flight)
+        processes = self.evaluator.processes
+        if processes is None:
+            return 1
+        if isinstance(processes, int):
+            return processes
+        if isinstance(processes, str):
+            return int(processes.partition(":")[2])
+        # Neither executors nor pools expose this number publicly.
+        return getattr(processes, "_max_workers", None)\
+            or getattr(processes, "_processes", None) or 1
+
+    def _fill(self: Self,
+              submitter: TaskSubmitter[Evaluator[T], T,
+                                       tuple[float, ...]],
+              in_flight: int) -> None:
+        """Machinery.
+
+        :meta private:
+
+        Breed until :arg:`in_flight` offspring are in evaluation.
+
+        Raise:
+            RuntimeError: If :attr:`variator` gives no offspring
+                :attr:`_BREED_ATTEMPTS` times in a row.
+        """
+        attempts: int = 0
+        while len(self._pending) < in_flight:
+            if self._breed(submitter) > 0:
+                attempts = 0
+            else:
+                attempts += 1
+                if attempts >= _BREED_ATTEMPTS:
+                    raise RuntimeError(
+                        f"The variator gave no offspring in"
+                        f" {_BREED_ATTEMPTS} attempts in a row.")
+
+    def _breed(self: Self,
+               submitter: TaskSubmitter[Evaluator[T], T,
+                                        tuple[float, ...]]) -> int:
+        """Machinery.
+
+        :meta private:
+
+        Select parents, vary them, then submit each offspring
+        for evaluation. Return the number of offspring.
+        """
+        parents: Population[T] =\
+            self.parent_selector.select_population(self.population)
+        if self.variator.arity is not None:
+            parents = Population(parents[:self.variator.arity])
+        count: int = 0
+        for offspring in self.variator.vary(parents):
+            offspring.reset_fitness()
+            self._pending[submitter.submit(offspring)] = offspring
+            count += 1
+        return count
+
+    def _index_population(self: Self) -> None:
+        """Machinery.
+
+        :meta private:
+
+        Rebuild :attr:`_worst` from :attr:`population`, if
+        :attr:`replacement` is ``"worst"``.
+        """
+        if self.replacement != "worst":
+            return
+        self._versions = [0] * len(self.population)
+        self._worst = [(_rank(x), i, 0)
+                       for i, x in enumerate(self.population)]
+        heapq.heapify(self._worst)
+
+    def _insert(self: Self, offspring: T) -> None:
+        """Machinery.
+
+        :meta private:
+
+        Replace a member of :attr:`population` with :arg:`offspring`,
+        as :attr:`replacement` decides.
+        """
+        if self.replacement == "worst":
+            self._insert_over_worst(offspring)
+            return
+
+        indices: list[int] = random.sample(
+            range(len(self.population)),
+            min(self.bracket_size, len(self.population)))
+        if not indices:
+            self.population.append(offspring)
+            return
+
+        worst: int = min(indices,
+                         key=lambda i: _rank(self.population[i]))
+        self.population[worst] = offspring
+
+    def _insert_over_worst(self: Self, offspring: T) -> None:
+        """Machinery.
+
+        :meta private:
+
+        Replace the worst member of :attr:`population` with
+        :arg:`offspring`, unless the offspring is worse. Between
+        equally bad members, replace the first one.
+
+        Find the worst member with :attr:`_worst`, then update it.
+        """
+        heap = self._worst
+        versions: list[int] = self._versions
+        # Discard entries of members that have been replaced.
+        while heap and heap[0][2] != versions[heap[0][1]]:
+            heapq.heappop(heap)
+
+        rank: tuple[bool, tuple[float, ...]] = _rank(offspring)
+        if not heap:
+            versions.append(0)
+            heapq.heappush(heap, (rank, len(self.population), 0))
+            self.population.append(offspring)
+            return
+
+        worst_rank, worst, _ = heap[0]
+        if rank < worst_rank:
+            return
+        self.population[worst] = offspring
+        versions[worst] += 1
+        heapq.heappush(heap, (rank, worst, versions[worst]))
+
+
+#: Most times in a row that :class:`SteadyStateAlgorithm` breeds
+#: without offspring, before it gives up.
+_BREED_ATTEMPTS: int = 100
+
+
+#: A topology decides where migrants go. Given the number of islands
+#: and the index of an island, return indices of islands that send
+#: migrants to that island.
+type Topology = Callable[[int, int], Sequence[int]]
+
+
+def ring_topology(count: int, index: int) -> Sequence[int]:
+    """Each island receives migrants from the one before it.
+    """
+    return [(index - 1) % count] if count > 1 else []
+
+
+def full_topology(count: int, index: int) -> Sequence[int]:
+    """Each island receives migrants from all other islands.
+    """
+    return [i for i in range(count) if i != index]
+
+
+def random_topology(count: int, index: int) -> Sequence[int]:
+    """Each island receives migrants from another island,
+    chosen uniformly at random each time.
+    """
+    others = full_topology(count, index)
+    return [random.choice(others)] if others else []
+
+
+class IslandAlgorithm(Algorithm, Generic[T]):
+    """An island model.
+
+    Run several :class:`HomogeneousAlgorithm`\\ s, called islands,
+    each in its own worker process. Islands evolve independently,
+    and exchange their best individuals every
+    :attr:`migration_interval` generations.
+
+    An island is sent to its worker once. Afterwards, only migrants
+    travel between processes.
+
+    Each step includes the following operations:
+        #. for each island, in parallel:
+            #. replace the worst members of the island's
+               population with immigrants, if any
+            #. `step` the island :attr:`migration_interval` times
+            #. send copies of its :attr:`migrants` best members
+               to islands that :attr:`topology` decides
+        #. `update` :attr:`population` and :attr:`island_fitness`
+        #. `event`: ``POST_MIGRATION``
+
+    Watchers of islands run in worker processes, so their records
+    stay there. Register watchers with this algorithm instead. Call
+    :meth:`collect` to retrieve islands.
+
+    Call :meth:`close` to stop worker processes.
+    """
+    @override
+    def __init__(self: Self,
+                 islands: Sequence[HomogeneousAlgorithm[T]],
+                 migration_interval: int = 1,
+                 migrants: int = 1,
+                 topology: Literal["ring", "full", "random"]
+                 | Topology = "ring",
+                 use_processes: bool = True) -> None:
+        """
+        Args:
+            islands: Algorithms to run. Must be serialisable.
+
+            migration_interval: Generations between migrations.
+
+            migrants: Number of individuals each island sends
+                to each of its neighbours.
+
+            topology: Decides which islands send migrants to which.
+                Can be ``"ring"`` (:func:`ring_topology`), ``"full"``
+                (:func:`full_topology`), ``"random"``
+                (:func:`random_topology`), or a :type:`Topology`.
+
+            use_processes: If :python:`False`, then run islands
+                one after another in this process.
+
+        Raise:
+            ValueError: If :arg:`topology` is a string not
+                listed above.
+        """
+        topologies: dict[str, Topology] = {"ring": ring_topology,
+                                           "full": full_topology,
+                                           "random": random_topology}
+        if isinstance(topology, str):
+            if topology not in topologies:
+                raise ValueError(f"Unknown topology: {topology}")
+            topology = topologies[topology]
+
+        #: Generations between migrations.
+        self.migration_interval: int = migration_interval
+        #: Number of individuals each island sends to each neighbour.
+        self.migrants: int = migrants
+        #: Decides which islands send migrants to which.
+        self.topology: Topology = topology
+
+        #: Best members of all islands after the last migration,
+        #: :attr:`migrants` from each island, in order of islands.
+        self.population: Population[T] = Population()
+        #: Fitness of the best member of each island after the
+        #: last migration.
+        self.island_fitness: list[tuple[float, ...]] = []
+
+        self._islands: list[_IslandHandle[T]] = [
+            _IslandHandle(island, use_processes) for island in islands]
+        self._emigrants: list[list[T]] = [[] for _ in islands]
+        self.watchers: list[Watcher[IslandAlgorithm[T], Any]] = []
+
+    events = ["POST_MIGRATION"]
+
+    @override
+    def step(self: Self) -> None:
+        count: int = len(self._islands)
+        for index, island in enumerate(self._islands):
+            immigrants: list[T] = [
+                x for source in self.topology(count, index)
+                for x in self._emigrants[source]]
+            island.send(("step", self.migration_interval,
+                         immigrants, self.migrants))
+
+        # Islands run in parallel. Collect results after all
+        #   islands have started.
+        replies: list[tuple[list[T], tuple[float, ...]]] =\
+            _receive_all(self._islands)
+
+        self._emigrants = [emigrants for emigrants, _ in replies]
+        self.island_fitness = [fitness for _, fitness in replies]
+        self.population = Population(
+            [x for emigrants in self._emigrants for x in emigrants])
+        self.update("POST_MIGRATION")
+
+    def collect(self: Self) -> list[HomogeneousAlgorithm[T]]:
+        """Return a copy of each island, in its current state.
+        """
+        for island in self._islands:
+            island.send(("collect",))
+        return _receive_all(self._islands)
+
+    def close(self: Self) -> None:
+        """Stop all worker processes. Afterwards, this
+        algorithm can no longer step.
+        """
+        for island in self._islands:
+            island.close()
+
+
+class _IslandHandle(Generic[T]):
+    """Machinery.
+
+    :meta private:
+
+    Own one island, either in a worker process or in this process.
+    Commands sent with :meth:`send` are answered by :meth:`receive`,
+    which also raises what the command has raised.
+    """
+    def __init__(self: Self,
+                 island: HomogeneousAlgorithm[T],
+                 use_process: bool) -> None:
+        self._island: Optional[HomogeneousAlgorithm[T]] = None
+        self._reply: Any = None
+        self._error: Optional[Exception] = None
+        self._process: Any = None
+        if use_process:
+            self._connection, child_connection = Pipe()
+            self._process = Process(target=_island_worker,
+                                    args=(child_connection,),
+                                    daemon=True)
+            self._process.start()
+            child_connection.close()
+            self._connection.send_bytes(_dumps(island))
+        else:
+            self._island = island
+
+    def send(self: Self, command: tuple[Any, ...]) -> None:
+        if self._process is None:
+            assert self._island is not None
+            try:
+                self._reply = _answer(self._island, command)
+            except Exception as e:
+                self._error = e
+                return
+            if command[0] == "collect":
+                # Do not give out the island that this handle owns.
+                self._reply = copy.deepcopy(self._reply)
+        else:
+            self._connection.send_bytes(_dumps(command))
+
+    def receive(self: Self) -> Any:
+        if self._process is None:
+            error, self._error = self._error, None
+            if error is not None:
+                raise error
+            return self._reply
+        status, value = _loads(self._connection.recv_bytes())
+        if status == "error":
+            raise RuntimeError(f"An island has failed:\n{value}")
+        return value
+
+    def close(self: Self) -> None:
+        if self._process is not None and self._process.is_alive():
+            self._connection.send_bytes(_dumps(("close",)))
+            self._process.join()
+            self._connection.close()
+
+
+def _receive_all(islands: Sequence[_IslandHandle[T]]) -> list[Any]:
+    """Machinery.
+
+    :meta private:
+
+    Receive a reply from each of :arg:`islands`. If any island
+    has failed, raise the first failure, but only after all
+    replies are received. Otherwise, a later command would
+    receive a reply that was meant for this one.
+    """
+    replies: list[Any] = []
+    error: Optional[Exception] = None
+    for island in islands:
+        try:
+            replies.append(island.receive())
+        except Exception as e:
+            if error is None:
+                error = e
+    if error is not None:
+        raise error
+    return replies
+
+
+def _island_worker(connection: Any) -> None:
+    """Machinery.
+
+    :meta private:
+
+    In a worker process, receive an island, then answer
+    commands until told to close.
+    """
+    island: HomogeneousAlgorithm[Any] = _loads(connection.recv_bytes())
+    while True:
+        command = _loads(connection.recv_bytes())
+        if command[0] == "close":
+            return
+        try:
+            reply = ("ok", _answer(island, command))
+        except Exception:
+            reply = ("error", traceback.format_exc())
+        connection.send_bytes(_dumps(reply))
+
+
+def _answer(island: HomogeneousAlgorithm[T],
+            command: tuple[Any, ...]) -> Any:
+    """Machinery.
+
+    :meta private:
+
+    Carry out :arg:`command` on :arg:`island`. See
+    :meth:`IslandAlgorithm.step` and :meth:`IslandAlgorithm.collect`.
+    """
+    if command[0] == "collect":
+        return island
+
+    _, generations, immigrants, migrants = command
+    population: Population[T] = island.population
+    if immigrants:
+        worst_first: list[int] = sorted(
+            range(len(population)), key=lambda i: _rank(population[i]))
+        for index, immigrant in zip(worst_first, immigrants):
+            # Islands in the same process may receive the same migrant.
+            population[index] = immigrant.copy()
+
+    for _ in range(generations):
+        island.step()
+
+    population = island.population
+    best_first: list[T] = sorted(population, key=_rank, reverse=True)
+    emigrants: list[T] = []
+    for member in best_first[:migrants]:
+        emigrant = member.copy()
+        # Do not send ancestors to other islands.
+        emigrant.expunge_parents()
+        emigrants.append(emigrant)
+    best_fitness: tuple[float, ...] = best_first[0].fitness\
+        if best_first else (float('nan'),)
+    return (emigrants, best_fitness)
+
+
+def _rank(individual: Individual[Any]) -> tuple[bool, tuple[float, ...]]:
+    """Machinery.
+
+    :meta private:
+
+    Return a key that orders individuals by fitness. Individuals
+    whose fitness has a ``nan`` come first, and are equal to each other.
+    """
+    fitness: tuple[float, ...] = individual.fitness
+    # `nan` is neither less than nor equal to anything, so keys
+    #   that contain it cannot be ordered.
+    if any(x != x for x in fitness):
+        return (False, ())
+    return (True, fitness)
@@ -12,16 +12,23 @@ from ..core import Variator
 
 from .algorithms import SimpleLinearAlgorithm
 from .selectors import Elitist, TruncationSelector
-from typing import Self, Sequence
+from typing import Self, Sequence, Iterable
+from typing import override
 
-from .._utils.dependency import is_installed
+from ..core.population import _build_fitness_matrix
+from ..core.population import _lexicographic_argmax
+from .._utils.dependency import ensure_installed, is_installed
 
 import random
+from functools import cache
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from typing import Optional
+    from typing import Hashable
     from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures import ThreadPoolExecutor
+    from numpy.typing import NDArray
 
 
 T = TypeVar('T', bound=Individual[Any])
@@ -122,6 +129,9 @@ class BitString(Individual[int]):
         self._assert_pos_out_of_bound(pos)
         self.genome ^= 1 << pos
 
+    def genome_key(self: Self) -> Hashable:
+        return (self.size, self.genome)
+
     def __str__(self: Self) -> str:
         size: int = self.size
         return str((size * [0] + [int(digit)
@@ -174,6 +184,438 @@ class BitString(Individual[int]):
                              f"string of length {self.size}")
 
 
+class BitStringPopulation(Population[BitString]):
+    """A population of :class:`BitString` s that have the same size.
+
+    The population stores its members in one of two forms: as
+    a list of :class:`BitString` s, like any other :class:`.Population`,
+    or as a matrix of packed bits where each row is a member. Operators
+    that support this population (:class:`MutateBits`,
+    :class:`OnePointCrossover`, :class:`CountBits`, and
+    :class:`.TruncationSelector`) work on the whole matrix at once,
+    which is much faster than working on one member at a time.
+
+    The population converts between these forms when needed.
+    Accessing members (for example by indexing or iterating) unpacks
+    the matrix into :class:`BitString` s. Accessing :attr:`bits`
+    packs these members again.
+
+    Requires NumPy.
+
+    .. note::
+        Offspring created from the matrix do not record their
+        :attr:`.Individual.parents`.
+
+    .. note::
+        :func:`.Elitist` accesses members of its results, and
+        therefore unpacks the matrix once in each step.
+    """
+    def __init__(self: Self,
+                 initlist: Optional[Sequence[BitString]]
+                 | Iterable[BitString] = None,
+                 size: Optional[int] = None):
+        """
+        Args:
+            initlist: If provided, an iterable of initial members.
+
+            size: Size of each member. If not provided, use the size
+                of the first member.
+        """
+        ensure_installed("numpy")
+        self._bits: Optional[NDArray[Any]] = None
+        self._packed_fitness: Optional[NDArray[Any]] = None
+        self._data: list[BitString] = []
+
+        #: Size of each member.
+        self.size: Optional[int] = size
+
+        if isinstance(initlist, BitStringPopulation)\
+                and initlist._bits is not None:
+            super().__init__()
+            self._set_packed(initlist._bits,
+                             initlist.size,
+                             initlist._packed_fitness)
+        else:
+            super().__init__(initlist)
+
+    @classmethod
+    def from_bits(cls: Type[BitStringPopulation],
+                  bits: NDArray[Any],
+                  size: int,
+                  fitness: Optional[NDArray[Any]] = None)\
+            -> BitStringPopulation:
+        """Return a population whose members are rows of :arg:`bits`.
+
+        Args:
+            bits: Matrix of type ``uint8``, with one row for
+                each member. Each row has ``ceil(size / 8)`` bytes and
+                is big-endian: the first byte holds the highest bits.
+                Unused bits in the first byte must be ``0``.
+
+            size: Size of each member.
+
+            fitness: If given, the fitness of each member, as
+                returned by :meth:`.fitness_matrix`.
+        """
+        population = cls()
+        population._set_packed(bits, size, fitness)
+        return population
+
+    @classmethod
+    def random(cls: Type[BitStringPopulation],
+               count: int,
+               size: int) -> BitStringPopulation:
+        """Return a population of random members.
+
+        Each bit in each member may be either 1 or 0 with equal
+        probability. See :meth:`BitString.random`.
+
+        Args:
+            count: Number of members.
+
+            size: Size of each member.
+        """
+        ensure_installed("numpy")
+        import numpy as np
+
+        bits = _rng().integers(0, 256, (count, _byte_count(size)),
+                               dtype=np.uint8)
+        if bits.shape[1] > 0:
+            bits[:, 0] &= 0xFF >> _padding(size)
+        return cls.from_bits(bits, size)
+
+    @property
+    def data(self: Self) -> list[BitString]:  # type: ignore[override]
+        """Members of this population.
+
+        Unpack the matrix, if the population is packed.
+        """
+        if self._bits is not None:
+            self._unpack()
+        return self._data
+
+    @data.setter
+    def data(self: Self, value: list[BitString]) -> None:
+        self._bits = None
+        self._packed_fitness = None
+        self._data = value
+
+    @property
+    def bits(self: Self) -> NDArray[Any]:
+        """Members of this population as a matrix of packed bits.
+
+        Pack the members, if the population is not packed.
+        See :meth:`from_bits` for the layout of the matrix.
+
+        .. warning::
+            The returned array is read-only. Do not modify it.
+
+        Raise:
+            ValueError: If members do not have the same size.
+        """
+        if self._bits is None:
+            self._pack()
+        assert self._bits is not None
+        return self._bits
+
+    def is_packed(self: Self) -> bool:
+        """Return if the population is stored as a matrix of bits.
+        """
+        return self._bits is not None
+
+    def member(self: Self, pos: int) -> BitString:
+        """Return the member at position :arg:`pos`.
+
+        If the population is packed, return a new :class:`BitString`
+        without unpacking the population. Changes to that object
+        do not affect the population.
+
+        Args:
+            pos: Position of the member.
+        """
+        if self._bits is None:
+            return self._data[pos]
+
+        assert self.size is not None
+        row = self._bits[pos]
+        member = BitString(int.from_bytes(row.tobytes(), "big"), self.size)
+        member._fitness = _fitness_of_row(self._packed_fitness, pos)
+        return member
+
+    @override
+    def __len__(self: Self) -> int:
+        if self._bits is not None:
+            return int(self._bits.shape[0])
+        return len(self._data)
+
+    @override
+    def copy(self: Self) -> Self:
+        """Return an independent population.
+
+        If the population is packed, the new population shares the
+        (read-only) matrix with this population.
+        """
+        if self._bits is None:
+            return super().copy()
+        return type(self)(self)
+
+    @override
+    def take(self: Self, indices: Iterable[int]) -> Self:
+        """Return a new population of members at :arg:`indices`.
+
+        If the population is packed, take rows of the matrix instead.
+        """
+        if self._bits is None:
+            return super().take(indices)
+
+        import numpy as np
+        rows = np.fromiter(indices, dtype=np.intp)
+        population = type(self)()
+        population._set_packed(
+            self._bits[rows],
+            self.size,
+            None if self._packed_fitness is None
+            else self._packed_fitness[rows])
+        return population
+
+    @override
+    def reset_fitness(self: Self) -> None:
+        if self._bits is None:
+            super().reset_fitness()
+        else:
+            self._packed_fitness = None
+
+    @override
+    def fitness_matrix(self: Self) -> NDArray[Any]:
+        if self._bits is None:
+            return super().fitness_matrix()
+
+        import numpy as np
+        if self._packed_fitness is None:
+            matrix = np.full((len(self), 1), np.nan)
+            matrix.flags.writeable = False
+            return matrix
+        return self._packed_fitness
+
+    @override
+    def best(self: Self) -> BitString:
+        """Return the highest-fitness member in this population.
+
+        See :meth:`.Population.best`. If the population is packed,
+        return a new :class:`BitString` (see :meth:`member`).
+        """
+        if self._bits is None or len(self) == 0:
+            return super().best()
+
+        best_index = _lexicographic_argmax(self.fitness_matrix())
+        return self.member(0 if best_index is None else best_index)
+
+    def _set_packed(self: Self,
+                    bits: NDArray[Any],
+                    size: Optional[int],
+                    fitness: Optional[NDArray[Any]] = None) -> None:
+        """Machinery.
+
+        :meta private:
+
+        Store :arg:`bits` and :arg:`fitness` as the members of this
+        population. Both arrays become read-only.
+        """
+        bits.flags.writeable = False
+        if fitness is not None:
+            fitness.flags.writeable = False
+        self._data = []
+        self._bits = bits
+        self._packed_fitness = fitness
+        self.size = size
+
+    def _pack(self: Self) -> None:
+        """Machinery.
+
+        :meta private:
+
+        Pack members of this population into a matrix.
+        """
+        import numpy as np
+
+        members = self._data
+        sizes = set(x.size for x in members)
+        if len(sizes) > 1:
+            raise ValueError(f"Members have different sizes: {sizes}")
+        size: int = sizes.pop() if sizes else (self.size or 0)
+
+        byte_count = _byte_count(size)
+        bits = np.frombuffer(
+            b"".join(x.genome.to_bytes(byte_count, "big")
+                     for x in members),
+            dtype=np.uint8).reshape(len(members), byte_count)
+
+        fitnesses = [x._fitness for x in members]
+        fitness = None if all(x is None for x in fitnesses)\
+            else _build_fitness_matrix(fitnesses)
+
+        self._set_packed(bits, size, fitness)
+
+    def _unpack(self: Self) -> None:
+        """Machinery.
+
+        :meta private:
+
+        Replace the matrix with a list of :class:`BitString` s.
+        """
+        bits, fitness, size = self._bits, self._packed_fitness, self.size
+        assert bits is not None and size is not None
+
+        raw: bytes = bits.tobytes()
+        step: int = bits.shape[1]
+        members: list[BitString] = [
+            BitString(int.from_bytes(raw[i * step:(i + 1) * step], "big"),
+                      size)
+            for i in range(bits.shape[0])]
+
+        if fitness is not None:
+            for i, member in enumerate(members):
+                member._fitness = _fitness_of_row(fitness, i)
+
+        self.data = members
+        if fitness is not None:
+            # The packed fitness is still valid for these members.
+            self._fitness_cache = (Individual._fitness_epoch,
+                                   list(members),
+                                   fitness)
+
+
+def _rng() -> Any:
+    """Machinery.
+
+    :meta private:
+
+    Return a NumPy random generator, seeded from
+    :mod:`numpy.random`. Calls to :func:`numpy.random.seed`
+    therefore make results reproducible.
+    """
+    import numpy as np
+    return np.random.default_rng(np.random.randint(0, 2**31 - 1))
+
+
+def _byte_count(size: int) -> int:
+    """Machinery.
+
+    :meta private:
+
+    Return the number of bytes in each row of a bit matrix.
+    """
+    return (size + 7) // 8
+
+
+def _padding(size: int) -> int:
+    """Machinery.
+
+    :meta private:
+
+    Return the number of unused high bits in the first byte
+    of each row of a bit matrix.
+    """
+    return _byte_count(size) * 8 - size
+
+
+def _fitness_of_row(fitness: Optional[NDArray[Any]],
+                    pos: int) -> Optional[tuple[float, ...]]:
+    """Machinery.
+
+    :meta private:
+
+    Return the fitness at row :arg:`pos` of :arg:`fitness`, or
+    ``None`` if that row has no fitness.
+    """
+    if fitness is None:
+        return None
+    row = fitness[pos]
+    if (row != row).all():
+        return None
+    return tuple(row.tolist())
+
+
+#: Below this mutation rate, :func:`_flip_mask` selects positions
+#: to flip instead of drawing a random number for each bit.
+_SPARSE_MUTATION_RATE: float = 1 / 32
+
+#: Number of bits handled at once by :func:`_flip_mask`, when drawing
+#: a random number for each bit. Bounds the memory used.
+_DENSE_MUTATION_CHUNK: int = 1 << 22
+
+
+def _flip_mask(count: int, size: int, rate: float) -> NDArray[Any]:
+    """Machinery.
+
+    :meta private:
+
+    Return a bit matrix (see :meth:`BitStringPopulation.from_bits`)
+    of :arg:`count` rows, where each bit is ``1`` with
+    probability :arg:`rate`.
+    """
+    import numpy as np
+
+    rng = _rng()
+    padding = _padding(size)
+    byte_count = _byte_count(size)
+    mask = np.zeros((count, byte_count), dtype=np.uint8)
+    total: int = count * size
+
+    if total == 0:
+        return mask
+
+    if rate < _SPARSE_MUTATION_RATE:
+        # Draw the number of flips, then draw that many distinct
+        #   positions. Much cheaper than one draw per bit.
+        flips = rng.choice(total, size=rng.binomial(total, rate),
+                           replace=False, shuffle=False)
+        rows, columns = np.divmod(flips, size)
+        columns += padding
+        # Positions are distinct, so XOR sets each bit once.
+        np.bitwise_xor.at(
+            mask, (rows, columns >> 3),
+            (0x80 >> (columns & 7)).astype(np.uint8))
+        return mask
+
+    rows_per_chunk: int = max(1, _DENSE_MUTATION_CHUNK // size)
+    chunk = np.zeros((min(rows_per_chunk, count), byte_count * 8),
+                     dtype=bool)
+    for start in range(0, count, rows_per_chunk):
+        stop = min(start + rows_per_chunk, count)
+        flips = chunk[:stop - start]
+        flips[:, padding:] = rng.random((stop - start, size)) < rate
+        mask[start:stop] = np.packbits(flips, axis=1)
+    return mask
+
+
+def _count_bits(bits: NDArray[Any]) -> NDArray[Any]:
+    """Machinery.
+
+    :meta private:
+
+    Return the number of ``1`` s in each row of :arg:`bits`.
+    """
+    import numpy as np
+
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(bits).sum(axis=1, dtype=np.int64)
+    return _popcount_table()[bits].sum(axis=1, dtype=np.int64)
+
+
+@cache
+def _popcount_table() -> NDArray[Any]:
+    """Machinery.
+
+    :meta private:
+
+    Return the number of ``1`` s in each byte value, for
+    versions of NumPy without :func:`numpy.bitwise_count`.
+    """
+    import numpy as np
+    return np.array([i.bit_count() for i in range(256)], dtype=np.uint8)
+
+
 class CountBits(Evaluator[BitString]):
     """Count the number of ``1`` s.
 
@@ -183,6 +625,37 @@ class CountBits(Evaluator[BitString]):
     def evaluate(self, individual: BitString) -> tuple[float,]:
         return (individual.genome.bit_count(),)
 
+    @override
+    def evaluate_population(self: Self,
+                            pop: Population[BitString],
+                            *args: Any,
+                            **kwargs: Any) -> None:
+        """Context of :meth:`evaluate`.
+
+        If :arg:`pop` is a :class:`BitStringPopulation`, count the bits
+        of all members at once. Otherwise, see
+        :meth:`.Evaluator.evaluate_population`.
+        """
+        if not isinstance(pop, BitStringPopulation):
+            super().evaluate_population(pop, *args, **kwargs)
+            return
+
+        import numpy as np
+
+        old_fitness = pop._packed_fitness
+        if self.retain_fitness and old_fitness is not None:
+            if old_fitness.shape[1] != 1:
+                # Fitnesses from another evaluator. Let
+                #   :meth:`evaluate` decide which to keep.
+                super().evaluate_population(pop, *args, **kwargs)
+                return
+
+        fitness = _count_bits(pop.bits).astype(float)[:, np.newaxis]
+        if self.retain_fitness and old_fitness is not None:
+            fitness = np.where(np.isnan(old_fitness), fitness, old_fitness)
+
+        pop._set_packed(pop.bits, pop.size, fitness)
+
 
 class MutateBits(Variator[BitString]):
     """Randomly flip each bit in the parent.
@@ -193,10 +666,14 @@ class MutateBits(Variator[BitString]):
     ..note::
         This operator can use Numpy (if installed) to speed up
         bit flips by orders of magnitude.
+
+        Given a :class:`BitStringPopulation`,
+        :meth:`vary_population` flips bits of all members at once.
     """
     def __init__(self,
                  mutation_rate: float, *,
-                 processes: Optional[int | ProcessPoolExecutor] = None,
+                 processes: Optional[int | str | ProcessPoolExecutor
+                                     | ThreadPoolExecutor] = None,
                  share_self: bool = False):
         """
         Args:
@@ -235,12 +712,34 @@ class MutateBits(Variator[BitString]):
 
         return (offspring,)
 
+    @override
+    def vary_population(self: Self,
+                        population: Population[BitString],
+                        *args: Any,
+                        **kwargs: Any) -> Population[BitString]:
+        """Vary the population.
+
+        If :arg:`population` is a :class:`BitStringPopulation`, flip
+        bits of all members at once and return a packed population.
+        Otherwise, see :meth:`.Variator.vary_population`.
+        """
+        if not isinstance(population, BitStringPopulation):
+            return super().vary_population(population, *args, **kwargs)
+
+        bits = population.bits
+        size: int = population.size or 0
+        return BitStringPopulation.from_bits(
+            bits ^ _flip_mask(len(bits), size, self.mutation_rate), size)
+
 
 class OnePointCrossover(Variator[BitString]):
     """Split and recombine parents.
 
     2-to-1 variator for :class:`.BitString`. Split parents at position
     `k`, then interleave the segments.
+
+    Given a :class:`BitStringPopulation`, :meth:`vary_population`
+    recombines all pairs of parents at once.
     """
     def __init__(self, crossover_probability: float):
         """
@@ -282,6 +781,48 @@ class OnePointCrossover(Variator[BitString]):
             return (parents[0].copy(),
                     parents[1].copy())
 
+    @override
+    def vary_population(self: Self,
+                        population: Population[BitString],
+                        *args: Any,
+                        **kwargs: Any) -> Population[BitString]:
+        """Vary the population.
+
+        If :arg:`population` is a :class:`BitStringPopulation`,
+        recombine all pairs of parents at once and return a packed
+        population. Otherwise, see :meth:`.Variator.vary_population`.
+        """
+        if not isinstance(population, BitStringPopulation):
+            return super().vary_population(population, *args, **kwargs)
+
+        import numpy as np
+
+        bits = population.bits
+        size: int = population.size or 0
+        pair_count: int = len(bits) // 2
+        first = bits[0:2 * pair_count:2]
+        second = bits[1:2 * pair_count:2]
+
+        # Without crossover, the first child takes all bits from
+        #   the first parent, like splitting at the end.
+        rng = _rng()
+        splits = np.where(
+            rng.random(pair_count) < self.crossover_probability,
+            rng.integers(0, size + 1, pair_count),
+            size) + _padding(size)
+
+        # Number of bits in each byte that come before the split.
+        head_lengths = np.clip(
+            splits[:, np.newaxis] - 8 * np.arange(bits.shape[1]), 0, 8)
+        head_mask = ((0xFF00 >> head_lengths) & 0xFF).astype(np.uint8)
+        tail_mask = ~head_mask
+
+        offspring = np.empty((2 * pair_count, bits.shape[1]),
+                             dtype=np.uint8)
+        offspring[0::2] = (first & head_mask) | (second & tail_mask)
+        offspring[1::2] = (second & head_mask) | (first & tail_mask)
+        return BitStringPopulation.from_bits(offspring, size)
+
 
 # def _splice_genes(p1_genome: int,
 #                   p2_genome: int,
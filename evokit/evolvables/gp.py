@@ -4,14 +4,17 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from typing import Optional
+    from typing import Hashable
     from typing import Any
     from typing import Self
     from typing import Callable
     from typing import Sequence
+    from ..core import Population
 
 from typing import TypeVar
 
 from itertools import chain
+from collections import OrderedDict
 from ..core import Variator
 
 import functools
@@ -19,14 +22,22 @@ import random
 import typing
 from inspect import signature
 from typing import Generic
+from functools import wraps
+from types import MethodType
 
 from ..core import Evaluator, Individual
+from .._utils.dependency import ensure_installed
 
 
 T = TypeVar("T")
 
 _EXPR_PARAM_PREFIX: str = "x"
 
+#: Maximum depth of nested calls in source generated by
+#: :meth:`Expression.compile`. Deeper subtrees are compiled
+#: separately, because the Python parser limits nesting.
+_COMPILE_NESTING_LIMIT: int = 50
+
 
 def _get_arity(fun: Callable[..., Any]
                | Expression[Any]
@@ -38,7 +49,8 @@ def _get_arity(fun: Callable[..., Any]
     Otherwise, return 0.
 
     Does not work with built-in functions and other objects that do not
-    work with :meth:`.inspect.signature`.
+    work with :meth:`.inspect.signature`. For these objects, declare
+    the arity in :class:`ExpressionFactory` instead.
 
     Args:
         fun: An object
@@ -68,16 +80,36 @@ class Expression(Generic[T]):
                  arity: int,
                  value: T | Callable[..., T] | Symbol,
                  children: list[Expression[T]],
-                 factory: Optional[ExpressionFactory[T]] = None):
+                 factory: Optional[ExpressionFactory[T]] = None,
+                 value_arity: Optional[int] = None):
+        """
+        Args:
+            arity: Arity of the expression.
+
+            value: Value of the node.
+
+            children: Children of the node.
+
+            factory: The factory that built this node, if any.
+
+            value_arity: Arity of :arg:`value`. If not given,
+                inspect :arg:`value` to find its arity.
+        """
         #: Arity of the expression node.
         self.arity: int = arity
         #: Value of the expression node.
         self.value: T | typing.Callable[..., T] | Symbol = value
+        #: Arity of :attr:`value`. Should be updated if :attr:`value`
+        #: is replaced with an item of different arity.
+        self.value_arity: int = _get_arity(value)\
+            if value_arity is None else value_arity
         #: Children of the expression node.
         self.children = children
 
         self._factory = factory
 
+        self._compiled: dict[bool, Callable[..., T]] = {}
+
     @property
     def factory(self: Self) -> ExpressionFactory[T]:
         """The :class:`.ExpressionFactory`, if any, that built this object.
@@ -112,7 +144,7 @@ class Expression(Generic[T]):
                              f"{self_arity} parameters, "
                              f"{params_arity} given.")
 
-        value_arity: int = _get_arity(self.value)
+        value_arity: int = self.value_arity
         children_arity: int = len(self.children)
 
         if (value_arity != children_arity):
@@ -130,13 +162,57 @@ class Expression(Generic[T]):
         else:
             return self.value
 
+    def compile(self: Self, vectorised: bool = False) -> Callable[..., T]:
+        """Return a callable that evaluates this expression tree.
+
+        The tree is translated into Python source, then compiled into
+        one function. Calling the result gives the same value as calling
+        the expression, but does not inspect the arity of nodes or
+        create a generator at each node.
+
+        The result is cached. Later calls return the same callable.
+
+        Args:
+            vectorised: If ``True``, replace each callable node with its
+                counterpart in :mod:`.primitives.vectorised` (requires
+                NumPy). The returned callable then takes arrays, and
+                evaluates each node once over all elements.
+
+        .. warning::
+            The cached callable does not reflect changes made to the tree
+            after compilation. Operators in this module vary copies of
+            programs, which are not compiled.
+
+            Unlike :meth:`__call__`, the compiled callable raises a
+            :class:`TypeError` when given the wrong number of arguments.
+
+        Raise:
+            ValueError: If a node does not have as many children as
+                its :attr:`value` takes arguments.
+        """
+        if vectorised not in self._compiled:
+            substitute: Optional[Callable[[Callable[..., Any]],
+                                          Callable[..., Any]]] = None
+            if vectorised:
+                from .primitives.vectorised import counterpart
+                substitute = counterpart
+            self._compiled[vectorised] =\
+                _compile_expression(self, self.arity, substitute)
+        return self._compiled[vectorised]
+
+    def __getstate__(self: Self) -> dict[str, Any]:
+        # Compiled callables cannot be pickled. Compile again on demand.
+        state: dict[str, Any] = self.__dict__.copy()
+        state["_compiled"] = {}
+        return state
+
     def copy(self: Self) -> Self:
         """Return a deep copy.
 
         Call the :python:`copy(self, ...)` method on :attr:`value`,
         each item in :attr:`children`, and :attr:`value` (if :attr:`value`
         implements a method named ``copy``). Use the results to create
-        a new :class:`Expression`
+        a new :class:`Expression`. The copy is not compiled.
         """
         new_value: T | Callable[..., T] | Symbol
         if (hasattr(self.value, "copy")
@@ -150,7 +226,8 @@ class Expression(Generic[T]):
         return self.__class__(self.arity,
                               new_value,
                               new_children,
-                              self.factory)
+                              self.factory,
+                              self.value_arity)
 
     def nodes(self: Self) -> tuple[Expression[T], ...]:
         """Return a flat list view of all nodes and subnodes.
@@ -161,6 +238,19 @@ class Expression(Generic[T]):
         return (self,
                 *(chain.from_iterable((x.nodes() for x in self.children))))
 
+    def structural_key(self: Self) -> tuple[Any, ...]:
+        """Return a hashable key that describes the structure of this tree.
+
+        Two trees have equal keys if their nodes have the same values
+        (callables and constants by identity and value respectively,
+        :class:`Symbol`\\ s by position) and their children have equal
+        keys, in the same order.
+
+        Hash the key to obtain a structural hash of the tree.
+        """
+        return (_value_key(self.value),
+                *(x.structural_key() for x in self.children))
+
     def __str__(self: Self) -> str:
         delimiter = ", "
 
@@ -178,6 +268,98 @@ class Expression(Generic[T]):
         return (f"{my_name}{children_name}")
 
 
+def _compile_expression(expr: Expression[T],
+                        arity: int,
+                        substitute: Optional[Callable[[Callable[..., Any]],
+                                                      Callable[..., Any]]]
+                        = None) -> Callable[..., T]:
+    """Machinery.
+
+    :meta private:
+
+    Compile :arg:`expr` into a function of :arg:`arity` positional
+    arguments. Values of nodes are bound to names in the namespace of
+    the generated source, so that constants need not have a
+    literal representation.
+
+    If :arg:`substitute` is given, each callable value is replaced
+    with its result.
+    """
+    namespace: dict[str, Any] = {}
+    params: str = ", ".join(f"a{i}" for i in range(arity))
+    body: str = _expression_source(expr, arity, namespace, 0, substitute)
+    return eval(f"lambda {params}: {body}", namespace)
+
+
+def _expression_source(expr: Expression[T],
+                       arity: int,
+                       namespace: dict[str, Any],
+                       depth: int,
+                       substitute: Optional[Callable[[Callable[..., Any]],
+                                                     Callable[..., Any]]]
+                       = None) -> str:
+    """Machinery.
+
+    :meta private:
+
+    Return the source of an expression that evaluates :arg:`expr`.
+    Add names used by the source to :arg:`namespace`.
+    """
+    if depth >= _COMPILE_NESTING_LIMIT:
+        # Compile the subtree on its own, then call it as a value.
+        subtree_name: str = f"v{len(namespace)}"
+        namespace[subtree_name] = _compile_expression(expr, arity,
+                                                      substitute)
+        return f"{subtree_name}({", ".join(f"a{i}" for i in range(arity))})"
+
+    value_arity: int = expr.value_arity
+    children_arity: int = len(expr.children)
+
+    if (value_arity != children_arity):
+        raise ValueError(f"Node misconfigured. Expecting"
+                         f"{value_arity} arguments, while "
+                         f"{children_arity} children are given.")
+
+    if isinstance(expr.value, Symbol):
+        if expr.value.pos >= arity:
+            raise IndexError(f"Symbol {expr.value} is out of range for"
+                             f" an expression with arity {arity}.")
+        return f"a{expr.value.pos}"
+
+    value_name: str = f"v{len(namespace)}"
+
+    if callable(expr.value):
+        namespace[value_name] = expr.value if substitute is None\
+            else substitute(expr.value)
+        return f"{value_name}({", ".join(
+            _expression_source(x, arity, namespace, depth + 1, substitute)
+            for x in expr.children)})"
+    else:
+        namespace[value_name] = expr.value
+        return value_name
+
+
+def _value_key(value: Any) -> Any:
+    """Machinery.
+
+    :meta private:
+
+    Return a hashable key for the value of an :class:`Expression`.
+    """
+    if isinstance(value, Symbol):
+        return (Symbol, value.pos)
+    try:
+        hash(value)
+    except TypeError:
+        return (type(value), id(value))
+    if callable(value):
+        return value
+    else:
+        # Distinguish values that are equal but of different types,
+        #   such as 1 and 1.0.
+        return (type(value), value)
+
+
 class Symbol():
     """Dummy object used by :class:`.ExpressionFactory`.
     This object represents a positional argument, as
@@ -214,7 +396,9 @@ class ExpressionFactory(Generic[T]):
     """
     def __init__(self: Self,
                  primitives: tuple[T | Callable[..., T], ...],
-                 arity: int):
+                 arity: int,
+                 override_arities: Optional[dict[Callable[..., T],
+                                                 int]] = None):
         """
         Args:
             primitives: instructions and terminals that occupy nodes
@@ -223,6 +407,11 @@ class ExpressionFactory(Generic[T]):
 
             arity: Arity of constructed :class:`Expression` instances.
 
+            override_arities: Arities of primitives. Primitives
+                not in :arg:`override_arities` are inspected with
+                :meth:`inspect.signature`. Use this argument for
+                built-in functions that cannot be inspected.
+
         Raise:
             ValueError if ``arity=0`` and ``primitives`` does not contain
             nullary values. The tree cannot be built without terminals.
@@ -235,20 +424,46 @@ class ExpressionFactory(Generic[T]):
 
         self.primitive_pool[0] = []
 
+        # Arities are computed once here, then stored in each
+        #   :class:`Expression` this factory builds. Keys are
+        #   `id`\ s because primitives need not be hashable; items in
+        #   :attr:`primitive_pool` are kept alive by this factory.
+        self._arities: dict[int, int] = {}
+
         for item in primitives:
-            item_arity: int = _get_arity(item)
+            item_arity: int
+            if override_arities is not None\
+                    and callable(item) and item in override_arities:
+                item_arity = override_arities[item]
+            else:
+                item_arity = _get_arity(item)
+            self._arities[id(item)] = item_arity
             if item_arity not in self.primitive_pool:
                 self.primitive_pool[item_arity] = []
 
             self.primitive_pool[item_arity].append(item)
 
         for i in range(arity):
-            self.primitive_pool[0].append(Symbol(i))
+            symbol: Symbol = Symbol(i)
+            self._arities[id(symbol)] = 0
+            self.primitive_pool[0].append(symbol)
 
         if not self.primitive_pool[0]:
             # Remember to test it
             raise ValueError("Factory is initialised with no terminal node.")
 
+    def arity_of(self: Self, value: T | Callable[..., T] | Symbol) -> int:
+        """Return the arity of :arg:`value`.
+
+        If :arg:`value` is in :attr:`primitive_pool`, return the arity
+        computed when this factory is initialised. Otherwise, inspect
+        :arg:`value`.
+        """
+        try:
+            return self._arities[id(value)]
+        except KeyError:
+            return _get_arity(value)
+
     def _build_is_node_overbudget(self: Self) -> bool:
         return self._temp_node_budget_used > self._temp_node_budget_cap
 
@@ -297,14 +512,15 @@ class ExpressionFactory(Generic[T]):
             self.draw_primitive(1) if layer_budget < 1\
             else self.draw_primitive(nullary_ratio)
 
-        inferred_value_arity = _get_arity(target_primitive)
+        inferred_value_arity = self.arity_of(target_primitive)
 
         return Expression(arity=self.arity,
                           value=target_primitive,
                           children=[*(self._build_recurse(layer_budget - 1,
                                                           nullary_ratio)
                                     for _ in range(inferred_value_arity))],
-                          factory=self)
+                          factory=self,
+                          value_arity=inferred_value_arity)
 
     def draw_primitive(self: Self,
                        nullary_ratio: Optional[float] = None,
@@ -367,6 +583,19 @@ class Program(Individual[Expression[T]]):
     def copy(self) -> Self:
         return self.__class__(self.genome.copy())
 
+    def genome_key(self) -> Hashable:
+        """Return the :meth:`Expression.structural_key` of
+        :attr:`.genome`.
+        """
+        return self.genome.structural_key()
+
+    def compile(self, vectorised: bool = False) -> Callable[..., T]:
+        """Return a callable that evaluates :attr:`.genome`.
+
+        See :meth:`Expression.compile`.
+        """
+        return self.genome.compile(vectorised)
+
 
 class ProgramFactory(Generic[T]):
     """Convenience factory class for :class:`Program`.
@@ -377,9 +606,13 @@ class ProgramFactory(Generic[T]):
     """
     def __init__(self: Self,
                  primitives: tuple[T | Callable[..., T], ...],
-                 arity: int):
-        self.exprfactory = ExpressionFactory[T](primitives=primitives,
-                                                arity=arity)
+                 arity: int,
+                 override_arities: Optional[dict[Callable[..., T],
+                                                 int]] = None):
+        self.exprfactory = ExpressionFactory[T](
+            primitives=primitives,
+            arity=arity,
+            override_arities=override_arities)
 
     def build(self: Self,
               node_budget: int,
@@ -484,11 +717,13 @@ class MutateNode(Variator[Program[T]]):
         root1: Program[T] = parents[0].copy()
         root_pass: Program[T] = parents[0].copy()
         random_node = random.choice(root1.genome.nodes())
+        # The new value has the same arity, so
+        #   :attr:`Expression.value_arity` remains correct.
         random_node.value = root1.genome.factory.primitive_by_arity(
-            _get_arity(random_node.value))
+            random_node.value_arity)
 
         random_node.value = root1.genome.factory.primitive_by_arity(
-            _get_arity(random_node.value))
+            random_node.value_arity)
 
         return (root1, root_pass)
 
@@ -538,9 +773,14 @@ class SymbolicEvaluator(Evaluator[Program[float]]):
     fitness to programs whose output is closer to that of
     the objective function.
     """
+    # Each thread remembers outputs of subtrees on its own.
+    thread_local_attributes = ("_subtree_indices", "_subtree_outputs")
+
     def __init__(self,
                  objective: Callable[..., float],
-                 support: tuple[tuple[float, ...], ...]):
+                 support: tuple[tuple[float, ...], ...],
+                 vectorised: bool = False,
+                 share_subtrees: bool = False):
         """
         Args:
             objective: Function to compare against.
@@ -548,22 +788,181 @@ class SymbolicEvaluator(Evaluator[Program[float]]):
             support: Collection of points on which the program
                 is compared against ``objective``.
 
+            vectorised: If ``True``, store :arg:`support` as a
+                NumPy array, then evaluate each program once over
+                all points with :meth:`Program.compile`
+                (``vectorised=True``).
+
+                The objective is evaluated at each point once, when
+                this evaluator is initialised. It should therefore
+                be deterministic.
+
+            share_subtrees: If ``True``, remember the output of each
+                distinct subtree (by :meth:`Expression.structural_key`)
+                during :meth:`evaluate_population`, so that subtrees
+                shared by programs in the population are computed once.
+                Outputs are forgotten when the next call begins, or
+                when more than :attr:`subtree_limit` are remembered.
+                Requires :arg:`vectorised`.
+
         Raise:
             TypeError: if the first item in ``support`` does not
                 match the arity of ``objective``.
+
+            ValueError: if :arg:`share_subtrees` is set but
+                :arg:`vectorised` is not.
         """
         self.objective: Callable[..., float] = objective
         self.support: tuple[tuple[float, ...], ...] = support
         self.arity = _get_arity(objective)
+        self.vectorised = vectorised
+        self.share_subtrees = share_subtrees
+
+        if share_subtrees and not vectorised:
+            raise ValueError("Sharing subtrees requires"
+                             " vectorised evaluation.")
+
+        # Map structural keys of subtrees, whose children are replaced
+        #   with indices, to indices of their outputs.
+        self._subtree_indices: dict[tuple[Any, ...], int] = {}
+        self._subtree_outputs: list[Any] = []
+        #: Most outputs of subtrees to remember. If more are
+        #: remembered, then all are forgotten before the next program
+        #: is evaluated. Bounds memory when :meth:`evaluate` is called
+        #: without :meth:`evaluate_population`.
+        self.subtree_limit: int = 16384
 
         if self.arity != len(support[0]):
             raise TypeError(f"The objective function has arity "
                             f"{self.arity}, first item in support has arity "
                             f"{support[0]}; they are not the same.")
 
+        if vectorised:
+            ensure_installed("numpy")
+            import numpy as np
+            #: Columns of the support, one for each parameter.
+            self.support_columns = tuple(
+                np.asarray(support, dtype=float).T)
+            #: Values of the objective function at each point.
+            self.targets = np.asarray([objective(*sup) for sup in support],
+                                      dtype=float)
+
     def evaluate(self, individual: Program[float]) -> tuple[float]:
-        return (-sum([abs(self.objective(*sup) - individual.genome(*sup))
-                     for sup in self.support]),)
+        if self.vectorised:
+            import numpy as np
+            outputs: Any
+            if self.share_subtrees:
+                if len(self._subtree_outputs) > self.subtree_limit:
+                    self._subtree_indices = {}
+                    self._subtree_outputs = []
+                outputs = self._subtree_outputs[
+                    self._evaluate_subtree(individual.genome)]
+            else:
+                outputs = individual.compile(vectorised=True)(
+                    *self.support_columns)
+            return (-float(np.sum(np.abs(self.targets - outputs))),)
+        else:
+            program: Callable[..., float] = individual.compile()
+            return (-sum([abs(self.objective(*sup) - program(*sup))
+                         for sup in self.support]),)
+
+    def evaluate_population(self,
+                            pop: Population[Program[float]],
+                            *args: Any,
+                            **kwargs: Any) -> None:
+        """Context of :meth:`evaluate`.
+
+        Same as :meth:`.Evaluator.evaluate_population`. If
+        :attr:`share_subtrees` is ``True``, also forget outputs of
+        subtrees remembered by the last call.
+        """
+        self._subtree_indices = {}
+        self._subtree_outputs = []
+        super().evaluate_population(pop, *args, **kwargs)
+
+    def _evaluate_subtree(self, expr: Expression[float]) -> int:
+        """Evaluate :arg:`expr` over the support, reusing outputs
+        of subtrees that have been evaluated before.
+
+        Return the index of the output in :attr:`_subtree_outputs`.
+        """
+        from .primitives.vectorised import counterpart
+
+        child_indices: tuple[int, ...] = tuple(
+            self._evaluate_subtree(x) for x in expr.children)
+        # Children are identified by their indices, so that each node
+        #   is hashed once, instead of once for each of its ancestors.
+        key: tuple[Any, ...] = (_value_key(expr.value), child_indices)
+
+        index: Optional[int] = self._subtree_indices.get(key)
+
+        if index is None:
+            output: Any
+            if callable(expr.value):
+                output = counterpart(expr.value)(
+                    *(self._subtree_outputs[i] for i in child_indices))
+            elif isinstance(expr.value, Symbol):
+                output = self.support_columns[expr.value.pos]
+            else:
+                output = expr.value
+            index = len(self._subtree_outputs)
+            self._subtree_outputs.append(output)
+            self._subtree_indices[key] = index
+
+        return index
+
+
+def MemoiseExpression(evaluator: Evaluator[Program[T]],
+                      max_size: int = 1024) -> Evaluator[Program[T]]:
+    """Decorator that lets an evaluator remember fitnesses of programs.
+
+    Wrap :python:`evaluator.evaluate`, so that programs with the same
+    :meth:`Expression.structural_key` are evaluated once. Remember
+    the fitnesses of at most :arg:`max_size` distinct programs,
+    forgetting the least recently used first.
+
+    .. warning::
+
+        The evaluator should be deterministic. Otherwise, the
+        remembered fitness may differ from what the evaluator
+        would return.
+
+    Args:
+        evaluator: An evaluator of :class:`Program`\\ s.
+
+        max_size: Maximum number of remembered fitnesses.
+    """
+    def wrap_function(custom_evaluate:
+                      Callable[..., tuple[float, ...]])\
+            -> Callable[..., tuple[float, ...]]:
+
+        memo: OrderedDict[tuple[Any, ...], tuple[float, ...]] = OrderedDict()
+
+        @wraps(custom_evaluate)
+        def wrapper(self: Evaluator[Program[T]],
+                    individual: Program[T],
+                    *args: Any, **kwargs: Any) -> tuple[float, ...]:
+            """Context that implements memoisation.
+            """
+            key: tuple[Any, ...] = individual.genome.structural_key()
+
+            if key in memo:
+                memo.move_to_end(key)
+                return memo[key]
+
+            fitness: tuple[float, ...] =\
+                custom_evaluate(self, individual, *args, **kwargs)
+            memo[key] = fitness
+            if len(memo) > max_size:
+                memo.popitem(last=False)
+            return fitness
+        return wrapper
+
+    setattr(evaluator, 'evaluate',
+            MethodType(
+                wrap_function(evaluator.evaluate.__func__),  # type:ignore
+                evaluator))
+    return evaluator
 
 
 class PenaliseNodeCount(Evaluator[Program[float]]):
@@ -16,9 +16,13 @@ from ._program import Operation
 from ._program import Condition
 from ._program import RegisterStates
 
+from ._compile import CompiledProgram
+from ._compile import compile_program
+
 from ._initialise import LGPFactory
 
 from ._o_evaluator import LGPEvaluator
+from ._o_evaluator import SharedFitnessCases
 from ._o_individual import LinearGeneticProgram
 from ._o_variator import Crossover
 
@@ -43,9 +47,12 @@ __all__ = [
     "Operation",
     "Condition",
     "RegisterStates",
+    "CompiledProgram",
+    "compile_program",
     "check_all",
     "LGPFactory",
     "LGPEvaluator",
+    "SharedFitnessCases",
     "LinearGeneticProgram",
     "Crossover",
 ]
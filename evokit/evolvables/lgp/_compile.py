@@ -0,0 +1,487 @@
+from ._program import Instruction
+from ._program import StructureScope
+from ._program import Label
+from ._program import Operation
+from ._program import Condition
+from ._program import CellSpecifier
+from ._program import StateVectorType
+from ._program import RegisterStates
+from ._program import For
+from ._program import While
+from ._program import If
+
+from typing import Self, Optional, Sequence, Callable, Any
+
+
+class CompiledProgram[R]:
+    """A linear program, compiled to a Python function.
+
+    Running a program with :meth:`.RegisterStates.run` finds the
+    type of each instruction, resolves each operand, and finds the
+    scope of each control structure, every time the instruction
+    executes. A compiled program does all that once: the compiler
+    lowers the program to Python source, where each operand is a
+    direct index into the register or constant vector and each
+    control structure is a Python block.
+
+    Calling a compiled program has the same effect as calling
+    :meth:`.RegisterStates.run` with the same instructions. The
+    exception is custom :class:`.StructureType`\\ s, which are called
+    as they are by :meth:`.RegisterStates.run`.
+
+    Compiled programs do not print what they execute. Use
+    :meth:`.RegisterStates.run` with :python:`verbose=True` for that.
+
+    A vectorised program runs on many fitness cases at once. Each
+    register holds a NumPy array with one item for each case, and
+    each operation runs once over all cases. Conditions become
+    boolean masks: a case that fails a condition keeps its registers,
+    as though the body of the structure had been skipped for it.
+    """
+    def __init__(self: Self,
+                 instructions: Sequence[Optional[Instruction[R]]],
+                 vectorised: bool = False):
+        """
+        Args:
+            instructions: Instructions to compile. Items that are
+                ``None`` are skipped.
+
+            vectorised: If ``True``, then compile the program to run on
+                arrays. Replace each function with its counterpart in
+                :mod:`.primitives.vectorised`. Requires NumPy.
+
+                If the program cannot be vectorised (for example, if
+                it has a custom :class:`.StructureType`), then it runs
+                with :meth:`.RegisterStates.run` on each case in turn.
+
+        Raise:
+            ValueError: If an instruction is not recognised, or
+                if an operation assigns to a negative index.
+        """
+        #: Instructions of the program.
+        self.instructions: Sequence[Optional[Instruction[R]]] =\
+            instructions
+
+        #: If the program runs on arrays.
+        self.vectorised: bool = vectorised
+
+        names: dict[str, Any] = {"range": range, "min": min}
+        lines: list[str] = ["def program(r, c):"]
+        try:
+            if vectorised:
+                _lower_vectorised(instructions, 1, None, lines, names)
+            else:
+                _lower(instructions, 1, lines, names)
+            lowered: bool = True
+        except _NotVectorisable:
+            lowered = False
+        if len(lines) == 1:
+            lines.append("    pass")
+
+        #: Python source of the compiled program.
+        self.source: str = "\n".join(lines)
+
+        self._function: Callable[[list[Any], Sequence[Any]], None]
+        self._function = self._interpret_each if vectorised\
+            else self._interpret
+        if lowered:
+            try:
+                exec(compile(self.source, "<lgp>", "exec"), names)
+                self._function = names["program"]
+            except (SyntaxError, RecursionError, MemoryError):
+                # Python limits how deeply blocks can nest. Run deeply
+                #   nested programs with the interpreter instead.
+                pass
+
+    def __call__(self: Self,
+                 registers: list[Any],
+                 constants: Sequence[Any]) -> None:
+        """Run the program.
+
+        Args:
+            registers: Variable registers. If the program is
+                vectorised, then each register is an array with
+                one item for each fitness case.
+
+            constants: Constant registers. If the program is
+                vectorised, then each constant is either an array
+                with one item for each fitness case, or a scalar.
+
+        Effect:
+            Update :arg:`registers`. A vectorised program replaces
+            arrays in :arg:`registers`; it does not change them.
+        """
+        if self.vectorised:
+            import numpy as np
+            # Masked cases may still compute invalid values,
+            #   which are then discarded.
+            with np.errstate(all="ignore"):
+                self._function(registers, constants)
+        else:
+            self._function(registers, constants)
+
+    def _interpret(self: Self,
+                   registers: list[R],
+                   constants: tuple[R, ...]) -> None:
+        """Machinery.
+
+        :meta private:
+
+        Run the program with :meth:`.RegisterStates.run`.
+        """
+        RegisterStates(registers, constants).run(self.instructions)
+
+    def _interpret_each(self: Self,
+                        registers: list[Any],
+                        constants: Sequence[Any]) -> None:
+        """Machinery.
+
+        :meta private:
+
+        Run the program with :meth:`.RegisterStates.run` on each
+        fitness case in :arg:`registers` and :arg:`constants`.
+        """
+        import numpy as np
+        columns = np.broadcast_arrays(*registers, *constants)
+        rows = np.stack(columns[:len(registers)], axis=-1)\
+            .tolist() if registers else []
+        constant_rows = np.stack(columns[len(registers):], axis=-1)\
+            .tolist() if constants else [[]] * len(rows)
+        prepared = RegisterStates.prepare(self.instructions)
+        results: list[list[Any]] = []
+        for row, constant_row in zip(rows, constant_rows):
+            RegisterStates(row, tuple(constant_row)).run(prepared)
+            results.append(row)
+        for i, column in enumerate(zip(*results)):
+            registers[i] = np.asarray(column)
+
+    def __reduce__(self: Self) -> tuple[Any, ...]:
+        # Generated functions cannot be pickled. Compile again.
+        return (type(self), (self.instructions, self.vectorised))
+
+    def __str__(self: Self) -> str:
+        return self.source
+
+    __repr__ = __str__
+
+
+def compile_program[R](instructions: Sequence[Optional[Instruction[R]]],
+                       vectorised: bool = False) -> CompiledProgram[R]:
+    """Compile :arg:`instructions`. See :class:`CompiledProgram`.
+    """
+    return CompiledProgram(instructions, vectorised)
+
+
+class _NotVectorisable(Exception):
+    """Machinery.
+
+    :meta private:
+
+    Raised when a program cannot be vectorised.
+    """
+
+
+def _lower(instructions: Sequence[Optional[Instruction[Any]]],
+           depth: int,
+           lines: list[str],
+           names: dict[str, Any]) -> None:
+    """Machinery.
+
+    :meta private:
+
+    Append the source of :arg:`instructions` to :arg:`lines`,
+    indented by :arg:`depth` levels. Bind objects that the source
+    refers to in :arg:`names`.
+
+    Find scopes as :meth:`.RegisterStates.run` does: a structure
+    finds its scope in the instructions that contain it, so that
+    the scope of a parent structure limits that of its child.
+    """
+    indent: str = "    " * depth
+    pos: int = 0
+    while pos < len(instructions):
+        instruction: Optional[Instruction[Any]] = instructions[pos]
+        match instruction:
+            case Operation():
+                if instruction.target < 0:
+                    raise ValueError("Malformed instruction: assignment"
+                                     f" to index {instruction.target}.")
+                lines.append(
+                    f"{indent}r[{instruction.target}] ="
+                    f" {_bind(instruction.function, names)}("
+                    f"{", ".join(_operand(s) for s in
+                                 instruction.operands)})")
+                pos += 1
+            case StructureScope():
+                scope: int = instruction.scope(instructions, pos)
+                body = instructions[pos + 1:pos + scope + 1]
+                _lower_structure(instruction, body, depth, lines, names)
+                pos += scope + 1
+            case Label() | None:
+                pos += 1
+            case _:
+                raise ValueError("Instruction type"
+                                 f" {type(instruction).__name__}"
+                                 " not recognised.")
+
+
+def _lower_structure(instruction: StructureScope,
+                     body: Sequence[Optional[Instruction[Any]]],
+                     depth: int,
+                     lines: list[str],
+                     names: dict[str, Any]) -> None:
+    """Machinery.
+
+    :meta private:
+
+    Append the source of a control structure and its :arg:`body`.
+    """
+    indent: str = "    " * depth
+    stype = instruction.stype
+    # Match exact types: subclasses may change how the body runs.
+    if type(stype) is For:
+        count = stype.count
+        if isinstance(count, (int, float)):
+            times: str = str(min(int(count), stype.LOOP_CAP))
+        else:
+            times = f"min({_operand(count)}, {stype.LOOP_CAP})"
+        lines.append(f"{indent}for _ in range({times}):")
+    elif type(stype) is While:
+        lines.append(f"{indent}for _ in range({While.LOOP_CAP}):")
+        depth += 1
+        lines.append(f"{'    ' * depth}if"
+                     f" {_condition(stype.condition, names)}:")
+    elif type(stype) is If:
+        lines.append(f"{indent}if {_condition(stype.condition, names)}:")
+    else:
+        lines.append(f"{indent}{_bind(stype, names)}("
+                     f"{_bind(RegisterStates, names)}(r, c),"
+                     f" {_bind(body, names)})")
+        return
+
+    start: int = len(lines)
+    _lower(body, depth + 1, lines, names)
+    if len(lines) == start:
+        lines.append(f"{'    ' * (depth + 1)}pass")
+
+
+def _condition(condition: Condition[Any] | bool,
+               names: dict[str, Any]) -> str:
+    """Machinery.
+
+    :meta private:
+
+    Return the source of :arg:`condition`.
+    """
+    if isinstance(condition, bool):
+        return str(condition)
+    return (f"{_bind(condition.function, names)}("
+            f"{", ".join(_operand(s) for s in condition.args)})")
+
+
+def _operand(spec: CellSpecifier) -> str:
+    """Machinery.
+
+    :meta private:
+
+    Return the source of the cell that :arg:`spec` specifies.
+    """
+    if spec[0] == StateVectorType.register:
+        return f"r[{int(spec[1])}]"
+    else:
+        return f"c[{int(spec[1])}]"
+
+
+def _bind(value: Any, names: dict[str, Any]) -> str:
+    """Machinery.
+
+    :meta private:
+
+    Bind :arg:`value` to a new name in :arg:`names`. Return that name.
+    """
+    name: str = f"_{len(names)}"
+    names[name] = value
+    return name
+
+
+def _lower_vectorised(instructions: Sequence[Optional[Instruction[Any]]],
+                      depth: int,
+                      mask: Optional[str],
+                      lines: list[str],
+                      names: dict[str, Any]) -> None:
+    """Machinery.
+
+    :meta private:
+
+    Same as :func:`_lower`, but for arrays. If :arg:`mask` is given,
+    then it names a boolean array: operations only update cases
+    where that array is ``True``.
+    """
+    indent: str = "    " * depth
+    pos: int = 0
+    while pos < len(instructions):
+        instruction: Optional[Instruction[Any]] = instructions[pos]
+        match instruction:
+            case Operation():
+                if instruction.target < 0:
+                    raise ValueError("Malformed instruction: assignment"
+                                     f" to index {instruction.target}.")
+                value: str = (
+                    f"{_bind_counterpart(instruction.function, names)}("
+                    f"{", ".join(_operand(s) for s in
+                                 instruction.operands)})")
+                target: str = f"r[{instruction.target}]"
+                if mask is not None:
+                    value = (f"{_bind(_where(), names)}({mask},"
+                             f" {value}, {target})")
+                lines.append(f"{indent}{target} = {value}")
+                pos += 1
+            case StructureScope():
+                scope: int = instruction.scope(instructions, pos)
+                body = instructions[pos + 1:pos + scope + 1]
+                _lower_structure_vectorised(instruction, body, depth,
+                                            mask, lines, names)
+                pos += scope + 1
+            case Label() | None:
+                pos += 1
+            case _:
+                raise ValueError("Instruction type"
+                                 f" {type(instruction).__name__}"
+                                 " not recognised.")
+
+
+def _lower_structure_vectorised(instruction: StructureScope,
+                                body: Sequence[Optional[Instruction[Any]]],
+                                depth: int,
+                                mask: Optional[str],
+                                lines: list[str],
+                                names: dict[str, Any]) -> None:
+    """Machinery.
+
+    :meta private:
+
+    Same as :func:`_lower_structure`, but for arrays. The body of
+    each structure runs under a new mask, which selects cases where
+    the parent mask and the condition of the structure both hold.
+    Skip the body if no case is selected.
+    """
+    indent: str = "    " * depth
+    stype = instruction.stype
+    # Name each mask after the depth of its block. A nested structure
+    #   is always deeper than its parent, so it never reuses the name.
+    child: Optional[str] = mask
+    # Lines that close the body.
+    closing: list[str] = []
+    if type(stype) is If or type(stype) is While:
+        condition = stype.condition
+        if condition is False:
+            return
+        if type(stype) is While:
+            lines.append(f"{indent}for _ in range({While.LOOP_CAP}):")
+            depth += 1
+            indent = "    " * depth
+        if isinstance(condition, bool):
+            if type(stype) is If:
+                lines.append(f"{indent}if True:")
+            else:
+                depth -= 1
+        else:
+            child = f"m{depth}"
+            test: str = _condition_vectorised(condition, names)
+            lines.append(f"{indent}{child} = {test}" if mask is None
+                         else f"{indent}{child} = {mask} & {test}")
+            lines.append(f"{indent}if {child}.any():")
+            if type(stype) is While:
+                # Registers of cases that skip the body do not change,
+                #   so the condition stays false for them.
+                closing = [f"{indent}else:", f"{indent}    break"]
+    elif type(stype) is For:
+        count = stype.count
+        if isinstance(count, (int, float)):
+            lines.append(f"{indent}for _ in range("
+                         f"{min(int(count), stype.LOOP_CAP)}):")
+        else:
+            counts: str = f"n{depth}"
+            child = f"m{depth}"
+            lines.append(f"{indent}{counts} = {_bind(_counts(), names)}("
+                         f"{_operand(count)}, {stype.LOOP_CAP})")
+            lines.append(f"{indent}for i{depth} in range("
+                         f"{_bind(_most(), names)}({counts})):")
+            test = f"{counts} > i{depth}"
+            lines.append(f"{indent}    {child} = {test}" if mask is None
+                         else f"{indent}    {child} = {mask} & ({test})")
+    else:
+        raise _NotVectorisable()
+
+    start: int = len(lines)
+    _lower_vectorised(body, depth + 1, child, lines, names)
+    if len(lines) == start:
+        lines.append(f"{'    ' * (depth + 1)}pass")
+    lines.extend(closing)
+
+
+def _condition_vectorised(condition: Condition[Any],
+                          names: dict[str, Any]) -> str:
+    """Machinery.
+
+    :meta private:
+
+    Return the source of :arg:`condition`, for arrays.
+    """
+    return (f"{_bind_counterpart(condition.function, names)}("
+            f"{", ".join(_operand(s) for s in condition.args)})")
+
+
+def _bind_counterpart(function: Callable[..., Any],
+                      names: dict[str, Any]) -> str:
+    """Machinery.
+
+    :meta private:
+
+    Bind the vectorised counterpart of :arg:`function`.
+    """
+    from ..primitives.vectorised import counterpart
+    return _bind(counterpart(function), names)
+
+
+def _where() -> Callable[..., Any]:
+    """Machinery.
+
+    :meta private:
+
+    Return :func:`numpy.where`.
+    """
+    import numpy as np
+    return np.where
+
+
+def _counts() -> Callable[[Any, int], Any]:
+    """Machinery.
+
+    :meta private:
+
+    Return a function that computes the number of times a
+    :class:`.For` loop runs for each case.
+    """
+    import numpy as np
+
+    def counts(values: Any, cap: int) -> Any:
+        return np.minimum(values, cap)
+    return counts
+
+
+def _most() -> Callable[[Any], int]:
+    """Machinery.
+
+    :meta private:
+
+    Return a function that computes the largest number of times
+    a :class:`.For` loop runs for any case.
+    """
+    import numpy as np
+
+    def most(counts: Any) -> int:
+        # `nan` counts compare false, and so never run.
+        return int(np.ceil(np.max(np.where(counts > 0, counts, 0),
+                                  initial=0)))
+    return most
@@ -42,7 +42,9 @@ class LGPFactory(Generic[R]):
                  allow_constant_conditions: bool = False,
                  allow_constant_operations: bool = False,
                  override_primitive_weights: Optional[Sequence[float]] = None,
-                 override_logical_operators: Optional[set[Predicate]] = None):
+                 override_logical_operators: Optional[set[Predicate]] = None,
+                 override_arities: Optional[dict[Callable[..., Any],
+                                                 int]] = None):
         """
         Args:
             primitives: Building blocks for the program. Each primitive
@@ -109,6 +111,11 @@ class LGPFactory(Generic[R]):
             override_logical_operators: Logical operators that may
                 be used by conditions. By default, all logical
                 operators in :mod:`.primitives` are used.
+
+            override_arities: Arities of primitives and logical
+                operators. Callables not in :arg:`override_arities`
+                are inspected with :meth:`inspect.signature`. Use this
+                argument for built-in functions that cannot be inspected.
         """
         # ++ Compile a list of primitives and their weights. Then,
         #   extract all labels for use by :class:`.StructUntilLabel`\\ s.
@@ -170,6 +177,17 @@ class LGPFactory(Generic[R]):
         else:
             self.logical_operators = override_logical_operators
 
+        # ++ Compute arities of callables once, so that building
+        #   instructions does not inspect signatures.
+        #: Arities of operations and logical operators.
+        self.arities: dict[Callable[..., Any], int] =\
+            dict(override_arities) if override_arities is not None\
+            else {}
+        for fun in (*self.primitives, *self.logical_operators):
+            if callable(fun) and not isinstance(fun, type)\
+                    and fun not in self.arities:
+                self.arities[fun] = _get_arity(fun)
+
     def build(self: Self,
               length: int) -> LinearGeneticProgram:
         """Build and return a sequence of instructions
@@ -236,7 +254,7 @@ class LGPFactory(Generic[R]):
                         0,
                         self.register_count_for_target_register_only),
                     operands=self._draw_cells(
-                        count=_get_arity(chosen_one),
+                        count=self._arity_of(chosen_one),
                         with_replacement=self.allow_replacement,
                         ensure_variable_register=not
                         self.allow_constant_operations
@@ -306,7 +324,7 @@ class LGPFactory(Generic[R]):
                               predicate: Predicate) -> Condition[R]:
         return Condition[R](function=predicate,
                             args=self._draw_cells(
-                                count=_get_arity(predicate),
+                                count=self._arity_of(predicate),
                                 ensure_variable_register=not
                                 self.allow_constant_conditions,
                                 with_replacement=self.allow_replacement))
@@ -344,6 +362,17 @@ class LGPFactory(Generic[R]):
         else:
             raise TypeError("_____________________")
 
+    def _arity_of(self: Self, fun: Callable[..., Any]) -> int:
+        """Return the arity of :arg:`fun`. Inspect :arg:`fun`
+        only if it is not already in :attr:`arities`.
+        """
+        try:
+            return self.arities[fun]
+        except KeyError:
+            arity: int = _get_arity(fun)
+            self.arities[fun] = arity
+            return arity
+
     def _draw_structure_scope(self: Self) -> int:
         return self._meth_draw_structure_scope()
 
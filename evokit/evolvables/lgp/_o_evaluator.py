@@ -1,11 +1,16 @@
 from ...core import Evaluator
 from ._o_individual import LinearGeneticProgram
 from ._program import RegisterStates
+from ._compile import CompiledProgram
 from ._optimise import optimise_and_mask, optimise_and_reduce
+from ...core.accelerator import SharedArray
+from ..._utils.dependency import ensure_installed
 from typing import Self, Optional, TYPE_CHECKING, Sequence, Callable, Literal
+from typing import Any, Iterator
 from typing import override
 if TYPE_CHECKING:
     from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures import ThreadPoolExecutor
     from ._program import Instruction
 
 #: A fitness case is a tuple of form
@@ -17,7 +22,97 @@ type FitnessCase[T] = tuple[tuple[tuple[T, ...],
                             tuple[T, ...]]
 
 
+class SharedFitnessCases[T](Sequence[FitnessCase[T]]):
+    """Fitness cases in shared memory.
+
+    When an :class:`LGPEvaluator` is sent to worker processes,
+    its fitness cases are sent with it. If these fitness cases are
+    a :class:`SharedFitnessCases`, then workers map the table once
+    instead of receiving a copy each time.
+
+    All fitness cases must have the same number of input registers,
+    input constants, and outputs. All values must be numbers.
+
+    Requires NumPy. See :class:`.SharedArray`.
+    """
+    def __init__(self: Self, fitness_cases: Sequence[FitnessCase[T]]):
+        """
+        Args:
+            fitness_cases: Fitness cases to share.
+
+        Raise:
+            ValueError: If fitness cases have different sizes.
+        """
+        ensure_installed("numpy")
+        registers = [case[0][0] for case in fitness_cases]
+        constants = [case[0][1] for case in fitness_cases]
+        outputs = [case[1] for case in fitness_cases]
+        for name, rows in (("input registers", registers),
+                           ("input constants", constants),
+                           ("outputs", outputs)):
+            if len(set(len(row) for row in rows)) > 1:
+                raise ValueError(f"All fitness cases must have the same"
+                                 f" number of {name}.")
+
+        count: int = len(fitness_cases)
+        #: Input registers of each fitness case, one case per row.
+        self.registers: SharedArray = _share_rows(registers, count)
+        #: Input constants of each fitness case, one case per row.
+        self.constants: SharedArray = _share_rows(constants, count)
+        #: Outputs of each fitness case, one case per row.
+        self.outputs: SharedArray = _share_rows(outputs, count)
+        self._cases: Optional[list[FitnessCase[T]]] = None
+
+    def _as_tuples(self: Self) -> list[FitnessCase[T]]:
+        """Machinery.
+
+        :meta private:
+
+        Return fitness cases as tuples of Python values. Build them
+        once in each process.
+        """
+        if self._cases is None:
+            self._cases = [
+                ((tuple(registers), tuple(constants)), tuple(outputs))
+                for registers, constants, outputs
+                in zip(self.registers.array.tolist(),
+                       self.constants.array.tolist(),
+                       self.outputs.array.tolist())]
+        return self._cases
+
+    def __getstate__(self: Self) -> dict[str, Any]:
+        # Only send references to shared memory.
+        state = self.__dict__.copy()
+        state["_cases"] = None
+        return state
+
+    def __len__(self: Self) -> int:
+        return len(self.registers)
+
+    def __getitem__(self: Self, key: Any) -> Any:
+        return self._as_tuples()[key]
+
+    def __iter__(self: Self) -> Iterator[FitnessCase[T]]:
+        return iter(self._as_tuples())
+
+
+def _share_rows(rows: Sequence[Sequence[Any]], count: int) -> SharedArray:
+    """Machinery.
+
+    :meta private:
+
+    Share :arg:`rows` as a two-dimensional array. Keep the shape
+    when rows are empty.
+    """
+    import numpy as np
+    width: int = len(rows[0]) if rows else 0
+    return SharedArray(np.asarray(rows).reshape(count, width))
+
+
 class LGPEvaluator[T](Evaluator[LinearGeneticProgram[T]]):
+    # Each thread runs programs in its own context.
+    thread_local_attributes = ("evaluation_context",)
+
     def __init__(self: Self,
                  fitness_cases: Sequence[FitnessCase],
                  output_indices: set[int],
@@ -25,10 +120,41 @@ class LGPEvaluator[T](Evaluator[LinearGeneticProgram[T]]):
                  fitness_function: Callable[[Sequence[T],
                                              Sequence[T]], float],
                  verbose=False,
-                 processes: "Optional[int | ProcessPoolExecutor]" = None,
-                 share_self: bool = False) -> None:
+                 processes: "Optional[int | str | ProcessPoolExecutor "
+                            "| ThreadPoolExecutor]" = None,
+                 share_self: bool = False,
+                 compiled: bool = True,
+                 vectorised: bool = False,
+                 vectorised_fitness_function:
+                 Optional[Callable[[Any, Any], float]] = None) -> None:
         """
         Args:
+            fitness_cases: Fitness cases. To avoid sending them to
+                worker processes each time, give a
+                :class:`SharedFitnessCases`.
+
+            compiled: If :python:`True`, then compile each program
+                once with :meth:`.LinearGeneticProgram.compiled`, then
+                run it on all fitness cases. Otherwise, run each program with
+                :meth:`.RegisterStates.run`. Programs always run with
+                :meth:`.RegisterStates.run` if :arg:`verbose` is
+                :python:`True`.
+
+            vectorised: If :python:`True`, then run each program once
+                on all fitness cases, where each register holds an
+                array with one item for each case. See
+                :class:`.CompiledProgram`. Requires NumPy. All fitness
+                cases must have the same number of input registers,
+                input constants, and outputs.
+
+            vectorised_fitness_function: If given and
+                :arg:`vectorised` is :python:`True`, then call this
+                function once for each program instead of
+                calling :arg:`fitness_function` once for each case. It
+                receives the expected outputs and the actual outputs
+                as two-dimensional arrays, one case per row, and
+                returns the accumulated fitness.
+
             processes: See :class:`.Variator`.
             share_self: See :class:`.Variator`.
         """
@@ -58,6 +184,29 @@ class LGPEvaluator[T](Evaluator[LinearGeneticProgram[T]]):
 
         self.fitness_function = fitness_function
 
+        #: If programs are compiled before they run.
+        self.compiled: bool = compiled
+
+        #: If each program runs on all fitness cases at once.
+        self.vectorised: bool = vectorised
+
+        #: Computes the fitness of all cases at once, if given.
+        self.vectorised_fitness_function = vectorised_fitness_function
+
+        if vectorised:
+            ensure_installed("numpy")
+
+        # Fitness cases as arrays. Built when first used,
+        #   once in each process.
+        self._columns: Optional[tuple[Any, Any, Any]] = None
+
+    def __getstate__(self: Self) -> dict[str, Any]:
+        # Workers build arrays from fitness cases, which may be
+        #   in shared memory, instead of receiving a copy.
+        state = super().__getstate__()
+        state["_columns"] = None
+        return state
+
     @override
     def evaluate(self: Self,
                  individual: LinearGeneticProgram[T]) -> tuple[float, ...]:
@@ -65,13 +214,24 @@ class LGPEvaluator[T](Evaluator[LinearGeneticProgram[T]]):
         """
         accumulated_fitness: float = 0
 
+        if self.vectorised and not self.verbose:
+            return (self._evaluate_vectorised(individual.compiled(
+                self.optimiser, self.output_indices, vectorised=True)),)
+
+        if self.compiled and not self.verbose:
+            return (self._evaluate_compiled(individual.compiled(
+                self.optimiser, self.output_indices)),)
+
         code_to_run: Sequence[Instruction[T] | None]
         if self.optimiser is not None:
-            code_to_run = self.optimiser(individual.genome,
-                                         self.output_indices)
+            code_to_run = individual.optimised(self.optimiser,
+                                               self.output_indices)
         else:
             code_to_run = individual.genome
 
+        # Find scopes of structures once for all fitness cases.
+        code_to_run = RegisterStates.prepare(code_to_run)
+
         for ((input_registers, input_constants), outputs)\
                 in self.fitness_cases:
             self.evaluation_context.registers = list(input_registers)
@@ -86,3 +246,99 @@ class LGPEvaluator[T](Evaluator[LinearGeneticProgram[T]]):
                                                          actual_outputs)
 
         return (accumulated_fitness,)
+
+    def _evaluate_compiled(self: Self, program: CompiledProgram[T])\
+            -> float:
+        """Machinery.
+
+        :meta private:
+
+        Run :arg:`program` on all fitness cases. Return the
+        accumulated fitness.
+        """
+        fitness_function = self.fitness_function
+        # Outputs are read in order of index, as in :meth:`evaluate`.
+        output_order: list[int] = sorted(i for i in self.output_indices
+                                         if i >= 0)
+        accumulated_fitness: float = 0
+
+        for ((input_registers, input_constants), outputs)\
+                in self.fitness_cases:
+            registers = list(input_registers)
+            program(registers, input_constants)
+            size: int = len(registers)
+            accumulated_fitness += fitness_function(
+                outputs, [registers[i] for i in output_order if i < size])
+
+        return accumulated_fitness
+
+    def _evaluate_vectorised(self: Self,
+                             program: CompiledProgram[T]) -> float:
+        """Machinery.
+
+        :meta private:
+
+        Run the vectorised :arg:`program` once on all fitness cases.
+        Return the accumulated fitness.
+        """
+        import numpy as np
+        registers, constants, expected = self._case_columns()
+        columns: list[Any] = list(registers)
+        program(columns, constants)
+
+        count: int = len(expected)
+        # Outputs are read in order of index, as in :meth:`evaluate`.
+        actual = np.column_stack(
+            [np.broadcast_to(columns[i], (count,))
+             for i in sorted(self.output_indices)
+             if 0 <= i < len(columns)]
+            or [np.empty((count, 0))])
+
+        if self.vectorised_fitness_function is not None:
+            return self.vectorised_fitness_function(expected, actual)
+
+        fitness_function = self.fitness_function
+        accumulated_fitness: float = 0
+        for outputs, actual_outputs in zip(self.fitness_cases,
+                                           actual.tolist()):
+            accumulated_fitness += fitness_function(outputs[1],
+                                                    actual_outputs)
+        return accumulated_fitness
+
+    def _case_columns(self: Self) -> tuple[Any, Any, Any]:
+        """Machinery.
+
+        :meta private:
+
+        Return the input registers and input constants of all
+        fitness cases as tuples of columns, one for each register,
+        and the expected outputs as an array, one case per row.
+
+        Raise:
+            ValueError: If fitness cases have different sizes.
+        """
+        if self._columns is None:
+            import numpy as np
+            cases = self.fitness_cases
+            count: int = len(cases)
+            tables: list[Any]
+            if isinstance(cases, SharedFitnessCases):
+                tables = [cases.registers.array,
+                          cases.constants.array,
+                          cases.outputs.array]
+            else:
+                tables = []
+                for name, rows in (
+                        ("input registers", [x[0][0] for x in cases]),
+                        ("input constants", [x[0][1] for x in cases]),
+                        ("outputs", [x[1] for x in cases])):
+                    if len(set(len(row) for row in rows)) > 1:
+                        raise ValueError(
+                            f"Vectorised evaluation requires all fitness"
+                            f" cases to have the same number of {name}.")
+                    tables.append(np.asarray(rows).reshape(
+                        count, len(rows[0]) if rows else 0))
+            self._columns = (tuple(tables[0].T),
+                             tuple(tables[1].T),
+                             tables[2])
+        return self._columns
@@ -1,6 +1,11 @@
 from ...core import Individual
 from ._program import Instruction
-from typing import Self, override, Sequence
+from ._program import StructureType
+from ._program import Condition
+from ._compile import CompiledProgram
+from ._compile import compile_program
+from typing import Self, override, Sequence, Hashable, Optional, Callable
+from typing import Any
 
 
 class LinearGeneticProgram[T](Individual[Sequence[Instruction[T]]]):
@@ -13,7 +18,112 @@ class LinearGeneticProgram[T](Individual[Sequence[Instruction[T]]]):
                  program: Sequence[Instruction[T]]):
         self.genome = program
 
+    @property
+    def genome(self: Self) -> Sequence[Instruction[T]]:
+        """Instructions of the program.
+
+        Assigning to this property also forgets the results
+        of :meth:`optimised` and :meth:`compiled`.
+        """
+        return self._genome
+
+    @genome.setter
+    def genome(self: Self, value: Sequence[Instruction[T]]) -> None:
+        self._genome: Sequence[Instruction[T]] = value
+        self._optimised: dict[tuple[Any, frozenset[int]],
+                              Sequence[Optional[Instruction[T]]]] = {}
+        self._compiled: dict[tuple[Any, frozenset[int], bool],
+                             CompiledProgram[T]] = {}
+
+    def optimised(self: Self,
+                  optimiser: Callable[[Sequence[Instruction[T]], set[int]],
+                                      Sequence[Optional[Instruction[T]]]],
+                  output_indices: set[int])\
+            -> Sequence[Optional[Instruction[T]]]:
+        """Return :python:`optimiser(self.genome, output_indices)`.
+
+        Remember the result, so that an individual evaluated more
+        than once (for example, an elite) is analysed only once.
+
+        .. warning::
+            The result does not reflect changes made to
+            :attr:`genome` in place. Operators in :mod:`.lgp` vary
+            copies of programs, which have not been optimised.
+        """
+        key = (optimiser, frozenset(output_indices))
+        try:
+            return self._optimised[key]
+        except KeyError:
+            result = optimiser(self.genome, output_indices)
+            self._optimised[key] = result
+            return result
+
+    def compiled(self: Self,
+                 optimiser: Optional[
+                     Callable[[Sequence[Instruction[T]], set[int]],
+                              Sequence[Optional[Instruction[T]]]]],
+                 output_indices: set[int],
+                 vectorised: bool = False) -> CompiledProgram[T]:
+        """Return :func:`.compile_program` of
+        :python:`self.optimised(optimiser, output_indices)`, or of
+        :attr:`genome` if :arg:`optimiser` is :python:`None`.
+
+        Remember the result, as :meth:`optimised` does. The result
+        is not pickled with this individual.
+        """
+        key = (optimiser, frozenset(output_indices), vectorised)
+        try:
+            return self._compiled[key]
+        except KeyError:
+            code = self.genome if optimiser is None\
+                else self.optimised(optimiser, output_indices)
+            result = compile_program(code, vectorised)
+            self._compiled[key] = result
+            return result
+
+    def __getstate__(self: Self) -> dict[str, Any]:
+        # Compiled programs compile again when unpickled. Workers
+        #   that need them compile them on demand instead.
+        state: dict[str, Any] = self.__dict__.copy()
+        state["_compiled"] = {}
+        return state
+
     @override
     def copy(self: Self) -> Self:
         return type(self)([x.copy()
                            for x in self.genome])
+
+    @override
+    def genome_key(self: Self) -> Hashable:
+        """Return a key that describes the structure of each instruction.
+
+        Two programs have equal keys if their instructions have the
+        same types and attributes: functions and predicates by
+        identity, and other values by type and value.
+        """
+        return tuple(_structural_key(x) for x in self.genome)
+
+
+def _structural_key(value: Any) -> Hashable:
+    """Machinery.
+
+    :meta private:
+
+    Return a hashable key for :arg:`value`, which is an instruction
+    or part of one. Describe instructions, structure types, and
+    conditions by their types and attributes.
+    """
+    if isinstance(value, (Instruction, StructureType, Condition)):
+        return (type(value),
+                tuple((name, _structural_key(item))
+                      for name, item in sorted(vars(value).items())))
+    if isinstance(value, (tuple, list)):
+        return (type(value), tuple(_structural_key(x) for x in value))
+    try:
+        hash(value)
+    except TypeError:
+        return (type(value), id(value))
+    if callable(value):
+        return value
+    # The type tells apart values that compare equal, such as 1 and True.
+    return (type(value), value)
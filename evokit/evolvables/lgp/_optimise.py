@@ -7,6 +7,7 @@ from ._program import If
 from ._program import While
 from ._program import Condition
 from ._program import Optional
+from ._program import _scopes
 from ..primitives import gt, lt, neq
 from .._common import replace_at_indices
 from typing import Callable, Sequence
@@ -40,49 +41,45 @@ def index_introns(instructions:
         connection table from *Redundancies in Linear
         GP, Canonical Transformation, and Its Exploitation:
         a Demonstration on Image Feature Synthesis*.
+
+    Each structure is represented by its range of indices, so that
+    the analysis takes time linear in the length of
+    :arg:`instructions`.
     """
     # In more details, this is done with the following
     # information:
-    #     * A matrix that maps each index to the index
-    #     of a control structure whose scope it is in.
-    #     * A matrix that maps each register to instructions
-    #     that assign to its operands.
+    #     * The scope of each control structure, found once.
+    #     * A set of registers whose values can affect an output.
 
-    #: `scope_matrix[i][j]` is ``True`` if the scope of
-    #: `instructions[i]` includes `instructions[j]`
-    scope_matrix: list[list[bool]] =\
-        create_matrix((len(instructions),
-                       len(instructions)), False)
+    #: Scope of each control structure, by its index.
+    scopes: dict[int, int] = _scopes(instructions)
 
     #: Indices of control statements. Useful for finding them,
     #: removing the need to iterate through `len(instructions)`
     #: indices.
-    control_indices: set[int] = set()
+    control_indices: set[int] = set(scopes)
 
-    #: Indices for statements that are not executed. This happens
-    #: if a statement is in the scope of a structure that never
-    #: runs.
-    noexec_indices: set[int] = set()
+    #: `noexec[i]` is ``True`` if the statement at `i` is not
+    #: executed. This happens if the statement is in the scope
+    #: of a structure that never runs.
+    noexec: list[bool] = [False] * len(instructions)
 
-    # First pass. Populate `scope_matrix`, `control_indices`, and
-    #   `noexec_indices`.
+    # First pass. Populate `noexec`. Scopes of structures that never
+    #   run start in order, so it suffices to track where the
+    #   furthest of these scopes ends.
+    noexec_end: int = -1
     for i in range(len(instructions)):
-        current_instruction: Instruction = instructions[i]
-        if isinstance(current_instruction, StructureScope):
-            scope: int = current_instruction.scope(instructions, i)
-            scope_matrix[i][i:i + scope] = [True] * scope
-            control_indices.add(i)
-            if not may_run(current_instruction):
-                noexec_indices.update(set(range(i, i + scope + 1)))
-                # Skip loop a couple times.
-                i += scope
+        if i in scopes and not may_run(instructions[i]):
+            noexec_end = max(noexec_end, i + scopes[i])
+        noexec[i] = i <= noexec_end
 
     if verbose:
         print("$ ++ Forward pass complete. ++")
         print("$ Found control instructions at indices:"
               f" {control_indices}")
         print("$ Instructions ineffective due"
-              f" to contradictory condition: {noexec_indices}")
+              " to contradictory condition:"
+              f" {set(i for i, x in enumerate(noexec) if x)}")
 
     # We only need to keep record of variable registers,
     #   because constant registers can never be assigned to.
@@ -93,13 +90,17 @@ def index_introns(instructions:
     #: Indices that point to effective instructions.
     effective_indices: set[int] = set()
 
+    #: Least index in `effective_indices`. Because the pass below
+    #: goes backwards, each effective index is the least so far.
+    least_effective: int = len(instructions)
+
     # Second pass. Populate `effective_registers` and
     #   `effective_indices`.
     # Note that we are iterating backwards.
     for i in range(len(instructions))[::-1]:
         current_instruction = instructions[i]
         # If this instruction is not executed, skip it.
-        if i in noexec_indices:
+        if noexec[i]:
             continue
         # If an operation assigns to an effective register:
         #   * Add its operands effective to the set of effective
@@ -115,23 +116,20 @@ def index_introns(instructions:
                         if x[0] == StateVectorType.register
                     ])
                     effective_indices.add(i)
+                    least_effective = i
             case StructureScope():
                 match current_instruction.stype:
                     # If the structure can take arguments ...
                     case If() | While() as stype:
-                        # ... check if it contains at least one effective
-                        #   instruction ...
-                        scope = current_instruction.scope(instructions, i)
                         # ... check if it contains at least one effective
                         #   instruction. If true, then ...
-                        if not set(range(i, i + scope + 1)).isdisjoint(
-                            effective_indices
-                        ):
+                        if least_effective <= i + scopes[i]:
                             # ... mark the instruction to be effective.
                             if verbose:
                                 print("$> Found effective control"
                                       f" instruction at [{i}].")
                             effective_indices.add(i)
+                            least_effective = i
 
                             # Also, if the condition of the structure
                             #   can take arguments (i.e. not a `bool`),
@@ -144,6 +142,7 @@ def index_introns(instructions:
             # If I don't know what it is, it's probably important.
             case _:
                 effective_indices.add(i)
+                least_effective = i
 
     if verbose:
         print("$ ++ Backward pass complete. ++")
@@ -218,47 +217,22 @@ def optimise_and_reduce[T](instructions: Sequence[Instruction[T]],
         output_indices
     )
 
-    scope_matrix: list[list[bool]] =\
-        create_matrix((len(instructions),
-                       len(instructions)), False)
-
-    rescope_scheme: list[int] = [0] * len(instructions)
-
-    # First, build a `scope_matrix` as is done in
-    # :meth:`index_introns`.
+    # `introns_before[i]` is the number of introns before index `i`.
+    introns_before: list[int] = [0]
     for i in range(len(instructions)):
-        current_instruction: Instruction = instructions[i]
-        if isinstance(current_instruction, StructureScope):
-            scope: int = current_instruction.scope(instructions,
-                                                   i)
-            scope_matrix[i][i:i + scope] = [True] * scope
-
-    # This list contains all `StructOverLines`\\ s that
-    #   need to be rescoped. Makes things a bit easier.
-    indices_of_controls_to_rescope: set[int] = set()
-
-    # Then, iterate through instructions backwards.
-    for i in range(len(instructions))[::-1]:
-        # Upon encountering an intron, ...
-        if i in indices_of_introns:
-            # ... find all control structures that include it, ...
-            for j in range(len(instructions)):
-                possible_control = instructions[j]
-                if scope_matrix[j][i] and\
-                        isinstance(possible_control, StructOverLines):
-                    # ... and for all fixed-size structures
-                    #   that happen to include the intron, shorten
-                    #   the structure by 1 (to accommodate)
-                    #   the removal of the intron
-                    rescope_scheme[j] += 1
-                    indices_of_controls_to_rescope.add(j)
-        # In the end, remove the intron.
-
-    for i in indices_of_controls_to_rescope:
-        control = instructions[i]
-        assert isinstance(control, StructOverLines)
-        control.line_count -= rescope_scheme[i]
-
-    for i in sorted(indices_of_introns)[::-1]:
-        del instructions[i]
-    return instructions
+        introns_before.append(introns_before[-1]
+                              + (i in indices_of_introns))
+
+    # Shorten each fixed-size structure by the number of introns
+    #   it includes, to accommodate their removal. A structure at
+    #   `j` includes indices from `j` to `j + scope - 1`.
+    for j, scope in _scopes(instructions).items():
+        control = instructions[j]
+        if isinstance(control, StructOverLines) and scope > 0:
+            control.line_count -= (
+                introns_before[min(j + scope, len(instructions))]
+                - introns_before[j])
+
+    # In the end, remove introns.
+    return [x for i, x in enumerate(instructions)
+            if i not in indices_of_introns]
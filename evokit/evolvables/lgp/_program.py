@@ -13,6 +13,7 @@ from ..otypes import ValueRange
 from typing import Self, override
 from typing import Callable
 from typing import Type
+from typing import Iterator
 from typing import overload
 
 from ..otypes import Endofunction
@@ -632,13 +633,39 @@ class RegisterStates[R]:
             case StateVectorType.constant:
                 return self.constants
 
+    @staticmethod
+    def prepare(instructions: Sequence[Optional[Instruction]])\
+            -> Sequence[Optional[Instruction]]:
+        """Find the scope of each control structure in
+        :arg:`instructions` once. Return a sequence of the
+        same instructions.
+
+        Running the result with :meth:`run` does not find these
+        scopes again, even for structures in the bodies of loops.
+        :meth:`run` prepares instructions that are not prepared.
+        To run the same instructions many times, prepare them once.
+
+        .. warning::
+            The result does not reflect changes made to
+            :arg:`instructions` after they are prepared.
+        """
+        # Checking the exact type is faster than `isinstance`.
+        if type(instructions) is _Span:
+            return instructions
+        return _Span(instructions,
+                     {i: scope for i, scope in _scopes(instructions).items()
+                      if type(instructions[i]).scope in _CLAMPED_SCOPES},
+                     0,
+                     len(instructions))
+
     def run(self: Self,
             instructions: Sequence[Optional[Instruction]]) -> None:
         """Execute :arg:`instructions` in this context.
 
         Args:
             instructions: A sequence of instructions to run.
-                Items that are ``None`` are skipped.
+                Items that are ``None`` are skipped. See
+                :meth:`prepare`.
 
         Effect:
             Executing an :class:`Operation` updates
@@ -651,10 +678,12 @@ class RegisterStates[R]:
         # This approach is preferable than passing a set of indices to
         #   skip because structures run code in their mini contexts,
         #   where the same instructions may have a different index.
+        prepared: _Span = self.prepare(instructions)  # type: ignore
         current_line: int = 0
+        length: int = len(prepared)
 
-        while current_line < len(instructions):
-            lines_skipped = self._run_instruction(instructions,
+        while current_line < length:
+            lines_skipped = self._run_instruction(prepared,
                                                   current_line)
             current_line += lines_skipped
 
@@ -672,7 +701,7 @@ class RegisterStates[R]:
         return result
 
     def _run_instruction(self: Self,
-                         instructions: Sequence[Optional[Instruction]],
+                         instructions: _Span,
                          pos: int) -> int:
         """Execute an instruction.
 
@@ -691,7 +720,8 @@ class RegisterStates[R]:
             pos: Position of current execution pointer.
 
         """
-        instruction: Optional[Instruction] = instructions[pos]
+        instruction: Optional[Instruction] =\
+            instructions.program[instructions.start + pos]
         match instruction:
             case Operation():
                 return self._run_operation(instruction)
@@ -739,20 +769,19 @@ class RegisterStates[R]:
 
     def _run_structure_scope(self: Self,
                              instruction: StructureScope,
-                             instructions: Sequence[Optional[Instruction]],
+                             instructions: _Span,
                              pos: int) -> int:
         """Execute a control structure.
 
-        Use `.StructureScope.scope` to find the scope
-        of the structure, then run all instructions within
-        the scope.
+        Use the scope found by :meth:`prepare`, or
+        `.StructureScope.scope` if there is none, to find
+        the scope of the structure, then run all instructions
+        within the scope.
         """
-        scope: int = instruction.scope(
-            instructions,
-            pos)
+        scope: int = instructions.scope(instruction, pos)
 
         instructions_to_run: Sequence[Optional[Instruction]] =\
-            instructions[pos + 1:pos + scope + 1]
+            instructions.body(pos, scope)
 
         if self.verbose:
             print(f"Running {type(instruction.stype).__name__}"
@@ -781,3 +810,125 @@ class RegisterStates[R]:
         return type(self)(self.registers.copy(),
                           self.constants,
                           self.verbose)
+
+
+class _Span(Sequence[Optional[Instruction]]):
+    """Machinery.
+
+    :meta private:
+
+    Instructions from :attr:`start` to :attr:`stop` in a program
+    prepared by :meth:`RegisterStates.prepare`. Control structures
+    run their bodies as spans of the same program, instead of
+    as copies, so that scopes found for the program still apply.
+    """
+    __slots__ = ("program", "scopes", "start", "stop")
+
+    def __init__(self: Self,
+                 program: Sequence[Optional[Instruction]],
+                 scopes: dict[int, int],
+                 start: int,
+                 stop: int):
+        #: All instructions of the program.
+        self.program = program
+        #: Scope of each structure in :attr:`program`, by its index,
+        #: if that scope is only limited by where the span stops.
+        self.scopes = scopes
+        self.start = start
+        self.stop = stop
+
+    def scope(self: Self, instruction: StructureScope, pos: int) -> int:
+        """Return the scope of :arg:`instruction`, which is
+        at :arg:`pos` in this span.
+        """
+        scope: Optional[int] = self.scopes.get(self.start + pos)
+        if scope is None:
+            return instruction.scope(self, pos)
+        # The body of a structure limits the scopes of
+        #   structures nested in it.
+        return min(scope, self.stop - (self.start + pos + 1))
+
+    def body(self: Self, pos: int, scope: int) -> _Span:
+        """Return the :arg:`scope` instructions after :arg:`pos`.
+        """
+        start: int = self.start + pos + 1
+        return _Span(self.program,
+                     self.scopes,
+                     start,
+                     max(start, min(start + scope, self.stop)))
+
+    def __len__(self: Self) -> int:
+        return self.stop - self.start
+
+    @overload
+    def __getitem__(self: Self, key: int) -> Optional[Instruction]:
+        pass
+
+    @overload
+    def __getitem__(self: Self,
+                    key: slice) -> Sequence[Optional[Instruction]]:
+        pass
+
+    def __getitem__(self: Self, key: int | slice)\
+            -> Optional[Instruction] | Sequence[Optional[Instruction]]:
+        if isinstance(key, int) and 0 <= key < self.stop - self.start:
+            return self.program[self.start + key]
+        indices = range(self.start, self.stop)[key]
+        if isinstance(indices, range):
+            return [self.program[i] for i in indices]
+        return self.program[indices]
+
+    def __iter__(self: Self) -> Iterator[Optional[Instruction]]:
+        for i in range(self.start, self.stop):
+            yield self.program[i]
+
+
+def _scopes(instructions: Sequence[Optional[Instruction]])\
+        -> dict[int, int]:
+    """Machinery.
+
+    :meta private:
+
+    Return the scope of each control structure in
+    :arg:`instructions`, by its index.
+
+    Find the scope of a :class:`.StructUntilLabel` from the next
+    label with its text, instead of searching for that label.
+    The result is the same as that of :meth:`.StructUntilLabel.scope`.
+    """
+    scopes: dict[int, int] = {}
+    #: Index of the next label with each text.
+    next_label: dict[str, int] = {}
+    # Checking the type of each instruction is slow for abstract
+    #   classes. Check each type once instead.
+    kinds: dict[type, tuple[bool, bool, bool]] = {}
+    for i in range(len(instructions))[::-1]:
+        current_instruction = instructions[i]
+        kind: Optional[tuple[bool, bool, bool]] =\
+            kinds.get(type(current_instruction))
+        if kind is None:
+            cls = type(current_instruction)
+            is_structure: bool = issubclass(cls, StructureScope)
+            kind = (is_structure,
+                    is_structure and cls.scope is StructUntilLabel.scope,
+                    issubclass(cls, Label))
+            kinds[cls] = kind
+        is_structure, until_label, is_label = kind
+
+        if until_label:
+            label: Optional[int] = next_label.get(
+                current_instruction.label)  # type: ignore[union-attr]
+            scopes[i] = len(instructions) - (i + 1) if label is None\
+                else label - i
+        elif is_structure:
+            scopes[i] = current_instruction.scope(  # type: ignore
+                instructions, i)
+        if is_label:
+            next_label[current_instruction.text] = i  # type: ignore
+    return scopes
+
+
+#: Implementations of :meth:`.StructureScope.scope` that give the same
+#: scope in a part of a program as in the whole program, unless the
+#: scope reaches past the end of that part.
+_CLAMPED_SCOPES = (StructOverLines.scope, StructUntilLabel.scope)
@@ -0,0 +1,125 @@
+"""This module contains vectorised counterparts of primitives
+in :mod:`.primitives`. Each function here accepts NumPy arrays
+(or scalars) and applies the same operation to each element.
+
+Vectorised primitives compute one node of an expression over
+many points at once. See :meth:`.Expression.compile`.
+"""
+from typing import Any
+from typing import Callable
+
+from ..._utils.dependency import ensure_installed
+
+from . import _arithmetic
+from . import _logical
+
+ensure_installed("numpy")
+import numpy as np  # noqa: E402
+
+
+def sin(x: Any) -> Any:
+    return np.sin(x)
+
+
+def cos(x: Any) -> Any:
+    return np.cos(x)
+
+
+def tan(x: Any) -> Any:
+    return np.tan(x)
+
+
+def add(x: Any, y: Any) -> Any:
+    return np.add(x, y)
+
+
+def sub(x: Any, y: Any) -> Any:
+    return np.subtract(x, y)
+
+
+def mul(x: Any, y: Any) -> Any:
+    return np.multiply(x, y)
+
+
+def div(x: Any, y: Any) -> Any:
+    # Division by zero gives 1, as does :meth:`.primitives.div`.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(np.equal(y, 0), 1.0, np.divide(x, y))
+
+
+def avg(x: Any, y: Any) -> Any:
+    return np.divide(np.add(x, y), 2)
+
+
+def lim(x: Any, max_val: Any, min_val: Any) -> Any:
+    return np.maximum(np.minimum(max_val, x), min_val)
+
+
+def gt(a: Any, b: Any) -> Any:
+    return np.greater(a, b)
+
+
+def lt(a: Any, b: Any) -> Any:
+    return np.less(a, b)
+
+
+def geq(a: Any, b: Any) -> Any:
+    return np.logical_not(np.less(a, b))
+
+
+def leq(a: Any, b: Any) -> Any:
+    return np.logical_not(np.greater(a, b))
+
+
+def eq(a: Any, b: Any) -> Any:
+    # Same tolerance as :meth:`math.isclose`, which is symmetric
+    #   unlike :meth:`numpy.isclose`. Also as :meth:`math.isclose`,
+    #   an infinity is only close to itself.
+    with np.errstate(invalid="ignore", over="ignore"):
+        difference = np.abs(np.subtract(a, b))
+        return np.logical_or(
+            np.equal(a, b),
+            np.logical_and(
+                np.isfinite(difference),
+                difference <= 1e-09 * np.maximum(np.abs(a), np.abs(b))))
+
+
+def neq(a: Any, b: Any) -> Any:
+    return np.logical_not(eq(a, b))
+
+
+#: Map each primitive in :mod:`.primitives` to its
+#: vectorised counterpart.
+COUNTERPARTS: dict[Callable[..., Any], Callable[..., Any]] = {
+    _arithmetic.sin: sin,
+    _arithmetic.cos: cos,
+    _arithmetic.tan: tan,
+    _arithmetic.add: add,
+    _arithmetic.sub: sub,
+    _arithmetic.mul: mul,
+    _arithmetic.div: div,
+    _arithmetic.avg: avg,
+    _arithmetic.lim: lim,
+    _logical.gt: gt,
+    _logical.lt: lt,
+    _logical.geq: geq,
+    _logical.leq: leq,
+    _logical.eq: eq,
+    _logical.neq: neq,
+}
+
+
+def counterpart(fun: Callable[..., Any]) -> Callable[..., Any]:
+    """Return the vectorised counterpart of :arg:`fun`.
+
+    If :arg:`fun` is a key in :attr:`COUNTERPARTS`, return
+    the corresponding value. Otherwise, wrap :arg:`fun` with
+    :class:`numpy.vectorize`, which is correct but slow.
+
+    Args:
+        fun: A primitive.
+    """
+    try:
+        return COUNTERPARTS[fun]
+    except (KeyError, TypeError):
+        return np.vectorize(fun)
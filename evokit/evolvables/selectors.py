@@ -1,7 +1,12 @@
 from ..core import Selector
 from ..core import Population
 from ..core import Individual
+from ..core.population import _top_k_indices
+from .._utils.dependency import is_installed
 
+import bisect
+import heapq
+import itertools
 import random
 
 from typing import Self
@@ -9,12 +14,13 @@ from typing import Self
 from typing import Any
 from typing import TypeVar
 from typing import Sequence
+from typing import Iterable
+from typing import Optional
 from typing import Callable
 from typing import override
 from types import MethodType
 from functools import wraps
 
-from operator import attrgetter
 
 D = TypeVar("D", bound=Individual[Any])
 
@@ -43,9 +49,69 @@ class TruncationSelector(Selector[D]):
 
     @override
     def select_population(self: Self,
-                          from_population: Population[D]) -> Population[D]:
-        return Population[D](sorted(list(from_population),
-                                    key=attrgetter("fitness"))[-self.budget:])
+                          from_population: Population[D] | Iterable[D])\
+            -> Population[D]:
+        """Select the :attr:`.budget` individuals with highest fitness,
+        in ascending order.
+
+        Individuals whose fitness has a ``nan`` (including those
+        without fitness) are lowest, as in :meth:`.Population.best`.
+        Between individuals with equal fitness, prefer later ones.
+
+        If NumPy is installed, partially sort
+        :meth:`.Population.fitness_matrix`. Otherwise, or if
+        :arg:`from_population` is not a :class:`.Population`,
+        keep a heap of the :attr:`.budget` highest individuals
+        (see :meth:`select_stream`). Both take :math:`O(n \\log k)`
+        time or better.
+        """
+        if not isinstance(from_population, Population):
+            return self.select_stream(from_population)
+
+        if is_installed("numpy"):
+            return from_population.take(_top_k_indices(
+                from_population.fitness_matrix(), self.budget))
+
+        return Population[D](_stream_top_k(from_population, self.budget))
+
+    @override
+    def select_stream(self: Self,
+                      individuals: Iterable[D]) -> Population[D]:
+        """Select the :attr:`.budget` individuals with highest fitness,
+        keeping at most that many individuals at once.
+
+        Selects the same individuals as :meth:`select_population`
+        with NumPy, in the same order.
+        """
+        return Population[D](_stream_top_k(individuals, self.budget))
+
+
+def _stream_top_k(individuals: Iterable[D], k: int) -> list[D]:
+    """Machinery.
+
+    :meta private:
+
+    Return the :arg:`k` highest individuals in :arg:`individuals`,
+    in ascending order. Order individuals as
+    :func:`.population._top_k_indices` orders rows: individuals whose
+    fitness has a ``nan`` are lowest; between equal individuals, the
+    later one is higher.
+
+    Keep a heap of at most :arg:`k` individuals.
+    """
+    if k < 1:
+        return []
+    # The index breaks ties, so individuals are never compared.
+    heap: list[tuple[bool, tuple[float, ...], int, D]] = []
+    for index, individual in enumerate(individuals):
+        fitness: tuple[float, ...] = individual.fitness
+        valid: bool = not any(x != x for x in fitness)
+        entry = (valid, fitness if valid else (), index, individual)
+        if len(heap) < k:
+            heapq.heappush(heap, entry)
+        elif entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+    return [entry[-1] for entry in sorted(heap)]
 
 
 class TournamentSelector(Selector[D]):
@@ -61,6 +127,11 @@ class TournamentSelector(Selector[D]):
        the last item.
 
     #. Repeat until :arg:`budget` items are selected.
+
+    If NumPy is installed, :meth:`select_population` holds all
+    tournaments at once, unless there are only a few. Then, it
+    holds them one at a time, so that it does not rank the whole
+    population.
     """
     def __init__(self: Self, budget: int, bracket_size: int = 2,
                  p: float = 1):
@@ -97,6 +168,609 @@ class TournamentSelector(Selector[D]):
         # If nothing is selected in the end, select the last element
         return (sample[-1],)
 
+    @override
+    def select_population(self: Self,
+                          from_population: Population[D]) -> Population[D]:
+        """Hold :attr:`.budget` tournaments.
+
+        If NumPy is installed, draw all brackets at once, then find
+        all winners with array operations. Rank individuals as
+        :class:`TruncationSelector` does. Otherwise, call
+        :meth:`select` once for each tournament.
+
+        If there are only a few tournaments, and they together have
+        fewer entrants than the population, then hold them one at a
+        time instead. Only entrants are ranked.
+        """
+        budget_cap: int = min(len(from_population), self.budget)
+
+        if not is_installed("numpy") or budget_cap == 0:
+            # Copy the population once, instead of once per tournament.
+            pool: tuple[D, ...] = tuple(from_population)
+            return Population[D]([self.select(pool)[0]
+                                  for _ in range(budget_cap)])
+
+        n: int = len(from_population)
+        # Same as :meth:`select`: if the budget is less than the
+        #   bracket size, each bracket is the whole population.
+        size: int = n if budget_cap < self.bracket_size\
+            else self.bracket_size
+
+        if budget_cap <= _PER_TOURNAMENT_LIMIT and budget_cap * size < n:
+            return from_population.take(
+                [self._hold_tournament(from_population, size)
+                 for _ in range(budget_cap)])
+
+        import numpy as np
+        rng = np.random.default_rng(random.getrandbits(64))
+
+        ranks = _ranks(from_population)
+
+        brackets = _draw_brackets(rng, n, budget_cap, size)
+        # Sort each bracket from highest to lowest rank.
+        brackets = np.take_along_axis(
+            brackets, np.argsort(-ranks[brackets], axis=1), axis=1)
+
+        size: int = brackets.shape[1]
+        if self.p == 1:
+            positions = np.zeros(budget_cap, dtype=np.intp)
+        else:
+            # Select the item at index ``i`` with probability
+            #   p * (1 - p)**i, or the last item if none is selected.
+            chances = self.p * (1 - self.p) ** np.arange(size)
+            hits = rng.random((budget_cap, size)) < chances
+            positions = np.where(hits.any(axis=1),
+                                 hits.argmax(axis=1), size - 1)
+
+        return from_population.take(
+            brackets[np.arange(budget_cap), positions].tolist())
+
+    def _hold_tournament(self: Self,
+                         population: Population[D],
+                         size: int) -> int:
+        """Machinery.
+
+        :meta private:
+
+        Hold one tournament of :arg:`size` entrants, drawn uniformly
+        from :arg:`population`. Rank entrants as
+        :meth:`select_population` does. Return the index of the
+        winner.
+        """
+        bracket: list[int] = random.sample(range(len(population)), size)
+        bracket.sort(key=lambda i: _sort_key(i, population[i]),
+                     reverse=True)
+        for i in range(len(bracket)):
+            if random.random() < self.p * (1 - self.p)**i:
+                return bracket[i]
+        return bracket[-1]
+
+
+#: Most tournaments that :meth:`TournamentSelector.select_population`
+#: holds one at a time.
+_PER_TOURNAMENT_LIMIT: int = 16
+
+
+def _draw_brackets(rng: Any, n: int, count: int, size: int) -> Any:
+    """Machinery.
+
+    :meta private:
+
+    Return a matrix of :arg:`count` rows, each a uniform sample of
+    :arg:`size` distinct indices below :arg:`n`.
+    """
+    import numpy as np
+    if 2 * size > n:
+        # Repeats would be common. Shuffle all indices instead.
+        return np.argsort(rng.random((count, n)), axis=1)[:, :size]
+
+    brackets = rng.integers(0, n, (count, size))
+    # Draw again rows with repeated indices. Repeats are rare when
+    #   brackets are small, compared to the population.
+    while True:
+        ordered = np.sort(brackets, axis=1)
+        repeated = np.flatnonzero(
+            (ordered[:, 1:] == ordered[:, :-1]).any(axis=1))
+        if repeated.size == 0:
+            return brackets
+        brackets[repeated] = rng.integers(0, n, (repeated.size, size))
+
+
+class FitnessProportionateSelector(Selector[D]):
+    """Roulette-wheel selector.
+
+    Select each individual with probability proportional to the
+    first item in its :attr:`.Individual.fitness`. That item must not
+    be negative. Individuals whose fitness has a ``nan`` are never
+    selected. If all weights are zero, select uniformly.
+
+    Individuals are selected with replacement.
+    """
+    @override
+    def __init__(self: Self, budget: int):
+        super().__init__(budget)
+
+    @override
+    def select_population(self: Self,
+                          from_population: Population[D]) -> Population[D]:
+        """Select :attr:`.budget` individuals.
+
+        Compute the cumulative distribution once, then find each
+        selection by binary search. If NumPy is installed, find all
+        selections at once.
+
+        Raise:
+            ValueError: If a weight is negative.
+        """
+        return from_population.take(_sample(
+            _weights(from_population), self.budget, universal=False))
+
+
+class StochasticUniversalSelector(Selector[D]):
+    """Stochastic universal sampling [SUS]_.
+
+    Same as :class:`FitnessProportionateSelector`, except that all
+    selections share one spin of a wheel with :attr:`.budget` evenly
+    spaced pointers. The number of times an individual is selected
+    is never far from its expected number.
+
+    .. [SUS] Reducing bias and inefficiency in the selection
+       algorithm, J. E. Baker (1987)
+    """
+    @override
+    def __init__(self: Self, budget: int):
+        super().__init__(budget)
+
+    @override
+    def select_population(self: Self,
+                          from_population: Population[D]) -> Population[D]:
+        """Select :attr:`.budget` individuals in one pass over
+        the cumulative distribution.
+
+        Raise:
+            ValueError: If a weight is negative.
+        """
+        return from_population.take(_sample(
+            _weights(from_population), self.budget, universal=True))
+
+
+class RankSelector(Selector[D]):
+    """Linear ranking selector.
+
+    Rank individuals as :class:`TruncationSelector` does, from ``0``
+    (lowest) to ``n - 1`` (highest). Select the individual of rank
+    ``i`` with probability
+    :math:`\\frac{2 - s}{n} + \\frac{2 i (s - 1)}{n (n - 1)}`,
+    where :math:`s` is :attr:`pressure`.
+
+    Individuals are selected with replacement.
+    """
+    def __init__(self: Self, budget: int, pressure: float = 1.5,
+                 universal: bool = False):
+        """
+        Args:
+            budget: Number of individuals to select.
+
+            pressure: Expected number of selections of the highest
+                individual, for each individual selected. Must be
+                between ``1`` (uniform) and ``2``.
+
+            universal: If :python:`True`, then use stochastic
+                universal sampling. See
+                :class:`StochasticUniversalSelector`.
+
+        Raise:
+            ValueError: If :arg:`pressure` is not between 1 and 2.
+        """
+        super().__init__(budget)
+        if not 1 <= pressure <= 2:
+            raise ValueError(f"Pressure must be between 1 and 2."
+                             f" Got: {pressure}")
+        #: Selection pressure.
+        self.pressure: float = pressure
+        #: If stochastic universal sampling is used.
+        self.universal: bool = universal
+
+    @override
+    def select_population(self: Self,
+                          from_population: Population[D]) -> Population[D]:
+        n: int = len(from_population)
+        if n < 2:
+            return from_population.take([0] * (self.budget if n else 0))
+        s: float = self.pressure
+        weights: list[float] = [
+            (2 - s) / n + 2 * int(rank) * (s - 1) / (n * (n - 1))
+            for rank in _ranks(from_population)]
+        return from_population.take(
+            _sample(weights, self.budget, universal=self.universal))
+
+
+def _ranks(population: Population[D]) -> Any:
+    """Machinery.
+
+    :meta private:
+
+    Return the rank of each individual in :arg:`population`, from
+    ``0`` (lowest) to ``n - 1`` (highest), in the order of
+    :func:`.population._top_k_indices`. Return an array if NumPy
+    is installed, or a list otherwise.
+    """
+    n: int = len(population)
+    if is_installed("numpy"):
+        import numpy as np
+        ranks = np.empty(n, dtype=np.intp)
+        ranks[_top_k_indices(population.fitness_matrix(), n)] =\
+            np.arange(n)
+        return ranks
+
+    order: list[int] = sorted(
+        range(n), key=lambda i: _sort_key(i, population[i]))
+    result: list[int] = [0] * n
+    for rank, index in enumerate(order):
+        result[index] = rank
+    return result
+
+
+def _sort_key(index: int, individual: Individual[Any])\
+        -> tuple[bool, tuple[float, ...], int]:
+    """Machinery.
+
+    :meta private:
+
+    Key that orders individuals as :func:`_stream_top_k` does.
+    """
+    fitness: tuple[float, ...] = individual.fitness
+    valid: bool = not any(x != x for x in fitness)
+    return (valid, fitness if valid else (), index)
+
+
+def _weights(population: Population[D]) -> list[float]:
+    """Machinery.
+
+    :meta private:
+
+    Return the first item in the fitness of each individual in
+    :arg:`population`, or ``0`` if the fitness has a ``nan``.
+    """
+    weights: list[float] = []
+    for individual in population:
+        fitness: tuple[float, ...] = individual.fitness
+        if any(x != x for x in fitness):
+            weights.append(0.0)
+        elif fitness[0] < 0:
+            raise ValueError(f"Fitness-proportionate selection requires"
+                             f" non-negative fitness. Got: {fitness}")
+        else:
+            weights.append(fitness[0])
+    return weights
+
+
+def _sample(weights: Sequence[float],
+            count: int,
+            universal: bool) -> list[int]:
+    """Machinery.
+
+    :meta private:
+
+    Return :arg:`count` indices, each drawn with probability
+    proportional to its weight in :arg:`weights`. If :arg:`universal`,
+    then use stochastic universal sampling.
+    """
+    n: int = len(weights)
+    if n == 0 or count < 1:
+        return []
+    total: float = sum(weights)
+    if total <= 0:
+        weights = [1.0] * n
+        total = float(n)
+
+    if is_installed("numpy"):
+        import numpy as np
+        cumulative = np.cumsum(weights)
+        rng = np.random.default_rng(random.getrandbits(64))
+        points = (rng.random() + np.arange(count)) * (total / count)\
+            if universal else rng.random(count) * total
+        # `side="right"` skips individuals of weight zero. Clip in
+        #   case rounding puts a point past the last sum.
+        return np.minimum(np.searchsorted(cumulative, points,
+                                          side="right"),
+                          n - 1).tolist()
+
+    sums: list[float] = list(itertools.accumulate(weights))
+    spacing: float = total / count
+    start: float = random.random() * spacing
+    points_list: Iterable[float] = (start + i * spacing
+                                    for i in range(count))\
+        if universal else (random.random() * total for _ in range(count))
+    return [min(bisect.bisect_right(sums, point), n - 1)
+            for point in points_list]
+
+
+class NSGA2Selector(Selector[D]):
+    """Survivor selection of NSGA-II [NSGA2]_.
+
+    Treat each item in :attr:`.Individual.fitness` as an objective to
+    maximise. Sort individuals into non-dominated fronts. Select whole
+    fronts, best first, while they fit in :attr:`.budget`. From the
+    next front, select individuals with the highest crowding distance.
+
+    Individuals whose fitness has a ``nan`` are selected last.
+
+    Requires NumPy.
+
+    .. [NSGA2] A fast and elitist multiobjective genetic algorithm:
+       NSGA-II, K. Deb, A. Pratap, S. Agarwal, and T. Meyarivan (2002)
+    """
+    @override
+    def __init__(self: Self, budget: int):
+        super().__init__(budget)
+
+    @override
+    def select_population(self: Self,
+                          from_population: Population[D]) -> Population[D]:
+        import numpy as np
+        ranks, crowding = _rank_and_crowd(from_population.fitness_matrix())
+        # Lower rank first, then higher crowding distance.
+        order = np.lexsort((-crowding, ranks))
+        return from_population.take(order[:self.budget].tolist())
+
+
+class CrowdedTournamentSelector(Selector[D]):
+    """Parent selection of NSGA-II. See :class:`NSGA2Selector`.
+
+    Hold binary tournaments. Prefer the individual in the better front;
+    if both are in the same front, prefer the one with the higher
+    crowding distance.
+
+    Requires NumPy.
+    """
+    @override
+    def __init__(self: Self, budget: int):
+        super().__init__(budget)
+
+    @override
+    def select_population(self: Self,
+                          from_population: Population[D]) -> Population[D]:
+        import numpy as np
+        n: int = len(from_population)
+        if n == 0:
+            return Population[D]()
+        ranks, crowding = _rank_and_crowd(from_population.fitness_matrix())
+        rng = np.random.default_rng(random.getrandbits(64))
+        first = rng.integers(0, n, self.budget)
+        second = rng.integers(0, n, self.budget)
+        second_wins = (ranks[second] < ranks[first])\
+            | ((ranks[second] == ranks[first])
+               & (crowding[second] > crowding[first]))
+        return from_population.take(
+            np.where(second_wins, second, first).tolist())
+
+
+def _rank_and_crowd(matrix: Any) -> tuple[Any, Any]:
+    """Machinery.
+
+    :meta private:
+
+    Return the front of each row of :arg:`matrix` (``0`` is the
+    best) and its crowding distance within that front. Rows that
+    have a ``nan`` form the last front.
+    """
+    import numpy as np
+
+    n: int = matrix.shape[0]
+    ranks = np.zeros(n, dtype=np.intp)
+    crowding = np.zeros(n)
+
+    valid_rows = np.flatnonzero(~np.isnan(matrix).any(axis=1))
+    valid = matrix[valid_rows]
+    if valid.shape[1] == 2:
+        fronts = _sort_two_objectives(valid)
+    elif valid.shape[1] == 3:
+        fronts = _sort_three_objectives(valid)
+    else:
+        fronts = _sort_many_objectives(valid)
+
+    for rank, front in enumerate(fronts):
+        ranks[valid_rows[front]] = rank
+        crowding[valid_rows[front]] = _crowding_distance(valid[front])
+
+    invalid_rows = np.flatnonzero(np.isnan(matrix).any(axis=1))
+    ranks[invalid_rows] = len(fronts)
+    return ranks, crowding
+
+
+def _sort_two_objectives(matrix: Any) -> list[Any]:
+    """Machinery.
+
+    :meta private:
+
+    Return non-dominated fronts of :arg:`matrix`, which has two
+    columns, best first. Each front is an array of row indices.
+    Takes :math:`O(n \\log n)` time.
+    """
+    import numpy as np
+
+    # Visit rows from highest to lowest, by the first objective and
+    #   then the second. A row can only be dominated by earlier rows.
+    order = np.lexsort((-matrix[:, 1], -matrix[:, 0]))
+    first = matrix[:, 0].tolist()
+    second = matrix[:, 1].tolist()
+
+    fronts: list[list[int]] = []
+    # The last row added to each front. In each front, it has the
+    #   highest second objective, so it dominates a later row if any
+    #   row in that front does.
+    lasts: list[int] = []
+    for i in order.tolist():
+        # Find the first front whose last row does not dominate
+        #   this row. Fronts that dominate this row come first.
+        low, high = 0, len(fronts)
+        while low < high:
+            middle = (low + high) // 2
+            last = lasts[middle]
+            if second[last] > second[i]\
+                    or (second[last] == second[i] and first[last] > first[i]):
+                low = middle + 1
+            else:
+                high = middle
+        if low == len(fronts):
+            fronts.append([])
+            lasts.append(i)
+        fronts[low].append(i)
+        lasts[low] = i
+
+    return [np.array(front, dtype=np.intp) for front in fronts]
+
+
+def _sort_three_objectives(matrix: Any) -> list[Any]:
+    """Machinery.
+
+    :meta private:
+
+    Return non-dominated fronts of :arg:`matrix`, which has three
+    columns, best first. Each front is an array of row indices.
+
+    Visit rows as :func:`_sort_two_objectives` does. For each front,
+    keep the staircase of rows that are not dominated in the last two
+    objectives, so that each comparison with a front takes
+    :math:`O(\\log n)` time.
+    """
+    import numpy as np
+
+    order = np.lexsort((-matrix[:, 2], -matrix[:, 1], -matrix[:, 0]))
+    first = matrix[:, 0].tolist()
+    second = matrix[:, 1].tolist()
+    third = matrix[:, 2].tolist()
+
+    fronts: list[list[int]] = []
+    # For each front, rows on the staircase, by ascending second
+    #   (and so descending third) objective.
+    stairs: list[list[int]] = []
+    stair_keys: list[list[float]] = []
+
+    def covered_by(front: int, i: int) -> Optional[int]:
+        # Return a row on the staircase that is at least row `i`
+        #   in the last two objectives, if any. The first row whose
+        #   second objective is at least that of `i` has the highest
+        #   third objective among such rows.
+        k = bisect.bisect_left(stair_keys[front], second[i])
+        if k < len(stairs[front]) and third[stairs[front][k]] >= third[i]:
+            return stairs[front][k]
+        return None
+
+    def dominated_by(front: int, i: int) -> bool:
+        # Rows on the staircase are visited earlier, so they are at
+        #   least row `i` in the first objective.
+        j = covered_by(front, i)
+        return j is not None and (second[j] > second[i]
+                                  or third[j] > third[i]
+                                  or first[j] > first[i])
+
+    for i in order.tolist():
+        low, high = 0, len(fronts)
+        while low < high:
+            middle = (low + high) // 2
+            if dominated_by(middle, i):
+                low = middle + 1
+            else:
+                high = middle
+        if low == len(fronts):
+            fronts.append([])
+            stairs.append([])
+            stair_keys.append([])
+        fronts[low].append(i)
+
+        if covered_by(low, i) is None:
+            stair, keys = stairs[low], stair_keys[low]
+            # Remove rows that this row covers.
+            start = end = bisect.bisect_left(keys, second[i])
+            if end < len(stair) and keys[end] == second[i]:
+                end += 1
+            while start > 0 and third[stair[start - 1]] <= third[i]:
+                start -= 1
+            stair[start:end] = [i]
+            keys[start:end] = [second[i]]
+
+    return [np.array(front, dtype=np.intp) for front in fronts]
+
+
+def _sort_many_objectives(matrix: Any) -> list[Any]:
+    """Machinery.
+
+    :meta private:
+
+    Return non-dominated fronts of :arg:`matrix`, best first. Use
+    efficient non-dominated sort with binary search [ENS]_, where
+    each comparison with a front is an array operation.
+
+    .. [ENS] An efficient approach to nondominated sorting for
+       evolutionary multiobjective optimization, X. Zhang, Y. Tian,
+       R. Cheng, and Y. Jin (2015)
+    """
+    import numpy as np
+
+    n: int = matrix.shape[0]
+    # Visit rows from highest to lowest, lexicographically.
+    #   A row can only be dominated by earlier rows.
+    order = np.lexsort(-matrix.T[::-1]) if n > 0 else np.arange(0)
+
+    fronts: list[list[int]] = []
+    # Objectives of rows in each front. Grows by doubling.
+    values: list[Any] = []
+
+    def dominated_by(front: int, row: Any) -> bool:
+        members = values[front][:len(fronts[front])]
+        at_least = (members >= row).all(axis=1)
+        return bool((at_least & (members > row).any(axis=1)).any())
+
+    for i in order.tolist():
+        row = matrix[i]
+        low, high = 0, len(fronts)
+        while low < high:
+            middle = (low + high) // 2
+            if dominated_by(middle, row):
+                low = middle + 1
+            else:
+                high = middle
+        if low == len(fronts):
+            fronts.append([])
+            values.append(np.empty((4, matrix.shape[1])))
+        size: int = len(fronts[low])
+        if size == len(values[low]):
+            values[low] = np.concatenate((values[low],
+                                          np.empty_like(values[low])))
+        values[low][size] = row
+        fronts[low].append(i)
+
+    return [np.array(front, dtype=np.intp) for front in fronts]
+
+
+def _crowding_distance(front: Any) -> Any:
+    """Machinery.
+
+    :meta private:
+
+    Return the crowding distance of each row in :arg:`front`.
+    Rows at either end of any objective have infinite distance.
+    """
+    import numpy as np
+
+    size, objectives = front.shape
+    distance = np.zeros(size)
+    if size < 3:
+        distance[:] = np.inf
+        return distance
+
+    for j in range(objectives):
+        order = np.argsort(front[:, j], kind="stable")
+        column = front[order, j]
+        span = column[-1] - column[0]
+        distance[order[0]] = distance[order[-1]] = np.inf
+        if span > 0:
+            distance[order[1:-1]] += (column[2:] - column[:-2]) / span
+
+    return distance
+
 
 def Elitist(sel: Selector[D]) -> Selector[D]:
     """Decorator that adds elitism to a selector.
@@ -124,45 +798,97 @@ def Elitist(sel: Selector[D]) -> Selector[D]:
             """Context that implements elitism.
             """
             population_best: D = population.best()
-            my_best: D
-
-            # Monkey-patch an attribute onto the selector.
-            # This attribute retains the HOF individual.
-            # Current name is taken from a randomly generated SSH pubkey.
-            #   Nobody else will use a name *this* absurd.
-            BEST_INDIVIDUAL_ATTR_NAME =\
-                "___g1AfoA2NMh8ZZCmRJbweeee4jS1f3Y2TRPIvBmVXQP"
-            if not hasattr(self, BEST_INDIVIDUAL_ATTR_NAME):
-                setattr(self, BEST_INDIVIDUAL_ATTR_NAME,
-                        population_best.copy())
-
-            hof_individual: D
-            my_best = getattr(self, BEST_INDIVIDUAL_ATTR_NAME)
-
-            if my_best.fitness > population_best.fitness:
-                hof_individual = my_best
-            else:
-                hof_individual = population_best
-                setattr(self, BEST_INDIVIDUAL_ATTR_NAME,
-                        population_best.copy())
 
             # Acquire results of the original selector
             results: Population[D] = \
                 original_select_population(self, population, *args, **kwargs)
 
-            # Append the best individual to results
-            temp_pop = Population(results)
-            temp_pop.append(hof_individual.copy())
-            return temp_pop
+            return _add_elite(self, population_best, results)
+        return wrapper
+
+    def wrap_stream(original_select_stream:
+                    Callable[[Selector[D], Iterable[D]], Population[D]])\
+            -> Callable[[Selector[D], Iterable[D]], Population[D]]:
+
+        @wraps(original_select_stream)
+        def wrapper(self: Selector[D],
+                    individuals: Iterable[D],
+                    *args: Any, **kwargs: Any) -> Population[D]:
+            """Context that implements elitism, for streams.
+            """
+            # Record the best individual as individuals pass by.
+            #   Same as :meth:`.Population.best`.
+            best: list[D] = []
+
+            def watch_best() -> Iterable[D]:
+                for x in individuals:
+                    if any(v != v for v in x.fitness):
+                        pass
+                    elif not best or x.fitness > best[0].fitness:
+                        best[:] = [x]
+                    yield x
+
+            results: Population[D] = \
+                original_select_stream(self, watch_best(), *args, **kwargs)
+
+            if not best:
+                return results
+            return _add_elite(self, best[0], results)
         return wrapper
 
     setattr(sel, 'select_population',
             MethodType(
                 wrap_function(sel.select_population.__func__),  # type:ignore
                 sel))
+    # Selectors that do not override :meth:`.Selector.select_stream`
+    #   already call the wrapped :meth:`.Selector.select_population`.
+    if type(sel).select_stream is not Selector.select_stream:
+        setattr(sel, 'select_stream',
+                MethodType(
+                    wrap_stream(sel.select_stream.__func__),  # type:ignore
+                    sel))
     return sel
 
 
+def _add_elite(self: Selector[D],
+               population_best: D,
+               results: Population[D]) -> Population[D]:
+    """Machinery.
+
+    :meta private:
+
+    Update the best individual that the elitist selector :arg:`self`
+    has encountered with :arg:`population_best`. Return a copy of
+    :arg:`results` that also has a copy of that individual.
+    """
+    my_best: D
+
+    # Monkey-patch an attribute onto the selector.
+    # This attribute retains the HOF individual.
+    # Current name is taken from a randomly generated SSH pubkey.
+    #   Nobody else will use a name *this* absurd.
+    BEST_INDIVIDUAL_ATTR_NAME =\
+        "___g1AfoA2NMh8ZZCmRJbweeee4jS1f3Y2TRPIvBmVXQP"
+    if not hasattr(self, BEST_INDIVIDUAL_ATTR_NAME):
+        setattr(self, BEST_INDIVIDUAL_ATTR_NAME,
+                population_best.copy())
+
+    hof_individual: D
+    my_best = getattr(self, BEST_INDIVIDUAL_ATTR_NAME)
+
+    if my_best.fitness > population_best.fitness:
+        hof_individual = my_best
+    else:
+        hof_individual = population_best
+        setattr(self, BEST_INDIVIDUAL_ATTR_NAME,
+                population_best.copy())
+
+    # Append the best individual to results
+    temp_pop = type(results)(results)
+    temp_pop.append(hof_individual.copy())
+    return temp_pop
+
+
 # class SimulatedAnnealingSelector(Selector[D]):
 #     """Select an individual by simulated annealing.
 
@@ -0,0 +1,369 @@
+"""Check algorithms in :mod:`evokit.evolvables.algorithms`.
+
+Fast paths are compared against the scans they replace. Full runs
+are checked for properties that hold whatever the random draws.
+"""
+from evokit.core import Evaluator
+from evokit.core import Population
+from evokit.core import Variator
+from evokit.core.accelerator import shutdown_pools
+from evokit.evolvables.algorithms import HomogeneousAlgorithm
+from evokit.evolvables.algorithms import IslandAlgorithm
+from evokit.evolvables.algorithms import NSGA2Algorithm
+from evokit.evolvables.algorithms import SimpleLinearAlgorithm
+from evokit.evolvables.algorithms import SteadyStateAlgorithm
+from evokit.evolvables.algorithms import full_topology
+from evokit.evolvables.algorithms import random_topology
+from evokit.evolvables.algorithms import ring_topology
+from evokit.evolvables.algorithms import _rank
+from evokit.evolvables.bitstring import BitString
+from evokit.evolvables.bitstring import CountBits
+from evokit.evolvables.bitstring import MutateBits
+from evokit.evolvables.selectors import Elitist
+from evokit.evolvables.selectors import TournamentSelector
+from evokit.evolvables.selectors import TruncationSelector
+from evokit.watch import Watcher
+
+from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import Sequence
+
+import random
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def release_pools() -> Iterator[None]:
+    yield
+    shutdown_pools()
+
+
+def random_fitness(rng: random.Random) -> tuple[float, ...]:
+    if rng.random() < 0.1:
+        # A new object, as evaluators would produce. Unlike copies of
+        #   `math.nan`, such values are not identical to each other.
+        return (float("nan"),)
+    # Few distinct values, so that members often tie.
+    return (float(rng.randint(0, 5)),)
+
+
+def individual(genome: int, fitness: Optional[tuple[float, ...]] = None)\
+        -> BitString:
+    result = BitString(genome, 16)
+    if fitness is not None:
+        result.fitness = fitness
+    return result
+
+
+def random_population(seed: int, count: int) -> Population[BitString]:
+    rng = random.Random(seed)
+    return Population([individual(rng.getrandbits(16))
+                       for _ in range(count)])
+
+
+def steady_state(pop: Population[BitString],
+                 **kwargs: Any) -> SteadyStateAlgorithm[BitString]:
+    return SteadyStateAlgorithm(pop, CountBits(), TournamentSelector(1, 3),
+                                MutateBits(0.1), **kwargs)
+
+
+def reference_insert(pop: list[BitString], offspring: BitString) -> None:
+    if not pop:
+        pop.append(offspring)
+        return
+    # `min` returns the first of several lowest items.
+    worst = min(range(len(pop)), key=lambda i: _rank(pop[i]))
+    if _rank(offspring) < _rank(pop[worst]):
+        return
+    pop[worst] = offspring
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_worst_replacement_matches_reference(seed: int) -> None:
+    rng = random.Random(seed)
+    pop = Population([individual(i, random_fitness(rng))
+                      for i in range(rng.randint(0, 30))])
+    expected = list(pop)
+
+    algorithm = steady_state(pop)
+    algorithm._index_population()
+    for genome in range(100, 600):
+        offspring = individual(genome, random_fitness(rng))
+        algorithm._insert(offspring)
+        reference_insert(expected, offspring)
+        assert [x.genome for x in pop] == [x.genome for x in expected]
+
+
+def test_worst_replacement_replaces_first_nan() -> None:
+    pop = Population([individual(i, (float("nan"),)) for i in range(8)])
+    algorithm = steady_state(pop)
+    algorithm._index_population()
+    for genome in range(100, 108):
+        algorithm._insert(individual(genome, (1.0,)))
+    assert [x.genome for x in pop] == list(range(100, 108))
+
+
+@pytest.mark.parametrize("processes", [None, 2, "threads:3"])
+@pytest.mark.parametrize("replacement", ["worst", "tournament"])
+def test_steady_state_inserts_births(processes: Any,
+                                     replacement: Any) -> None:
+    pop = random_population(0, 20)
+    algorithm = steady_state(pop, replacement=replacement, births=30,
+                             in_flight=4)
+    algorithm.evaluator.processes = processes
+    insertions = Watcher[SteadyStateAlgorithm[BitString], int](
+        {"POST_INSERTION"}, lambda x: len(x.population))
+    algorithm.register(insertions)
+
+    best: float = -1.0
+    for _ in range(3):
+        algorithm.step()
+        assert len(pop) == 20
+        assert all(x.fitness == (x.genome.bit_count(),) for x in pop)
+        if replacement == "worst":
+            # The best member is never replaced by a worse offspring.
+            assert pop.best().fitness[0] >= best
+            best = pop.best().fitness[0]
+    assert len(insertions) == 90
+
+
+class Barren(Variator[BitString]):
+    def __init__(self) -> None:
+        self.arity = 1
+
+    def vary(self, parents: Sequence[BitString]) -> tuple[BitString, ...]:
+        return ()
+
+
+def test_steady_state_gives_up_without_offspring() -> None:
+    algorithm = SteadyStateAlgorithm(random_population(1, 5), CountBits(),
+                                     TournamentSelector(1), Barren())
+    with pytest.raises(RuntimeError):
+        algorithm.step()
+
+
+def test_steady_state_rejects_unknown_replacement() -> None:
+    with pytest.raises(ValueError):
+        steady_state(random_population(2, 5),
+                     replacement="oldest")  # type: ignore[arg-type]
+
+
+class Still(HomogeneousAlgorithm[BitString]):
+    """Island whose population only changes by migration."""
+    def __init__(self, genomes: Sequence[int], fail: bool = False) -> None:
+        self.population = Population([individual(x, (float(x),))
+                                      for x in genomes])
+        self.fail = fail
+        self.steps = 0
+
+    def step(self) -> None:
+        if self.fail:
+            raise ValueError("This island fails.")
+        self.steps += 1
+
+
+def still_islands(count: int, size: int) -> list[Still]:
+    rng = random.Random(count)
+    return [Still(rng.sample(range(1000), size)) for _ in range(count)]
+
+
+def reference_migrate(populations: list[list[int]],
+                      emigrants: list[list[int]],
+                      sources: list[list[int]],
+                      migrants: int) -> list[list[int]]:
+    for population, source in zip(populations, sources):
+        immigrants = [x for i in source for x in emigrants[i]]
+        worst_first = sorted(range(len(population)),
+                             key=lambda i: population[i])
+        for index, immigrant in zip(worst_first, immigrants):
+            population[index] = immigrant
+    return [sorted(x, reverse=True)[:migrants] for x in populations]
+
+
+def test_topologies() -> None:
+    assert [ring_topology(4, i) for i in range(4)] == [[3], [0], [1], [2]]
+    assert full_topology(3, 1) == [0, 2]
+    assert ring_topology(1, 0) == [] == random_topology(1, 0)
+    random.seed(0)
+    assert all(random_topology(5, 2)[0] in (0, 1, 3, 4) for _ in range(50))
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+@pytest.mark.parametrize("topology", ["ring", "full"])
+@pytest.mark.parametrize("migrants", [1, 3])
+def test_island_migration_matches_reference(use_processes: bool,
+                                            topology: Any,
+                                            migrants: int) -> None:
+    islands = still_islands(4, 8)
+    populations = [[x.genome for x in island.population]
+                   for island in islands]
+    topologies = {"ring": ring_topology, "full": full_topology}
+    sources = [topologies[topology](4, i) for i in range(4)]
+
+    algorithm = IslandAlgorithm(islands, migration_interval=2,
+                                migrants=migrants, topology=topology,
+                                use_processes=use_processes)
+    try:
+        emigrants: list[list[int]] = [[] for _ in islands]
+        for _ in range(3):
+            algorithm.step()
+            emigrants = reference_migrate(populations, emigrants,
+                                          sources, migrants)
+            assert [x.genome for x in algorithm.population]\
+                == [x for e in emigrants for x in e]
+            assert algorithm.island_fitness\
+                == [(float(e[0]),) for e in emigrants]
+
+        collected = algorithm.collect()
+        assert [[x.genome for x in island.population]
+                for island in collected] == populations
+        assert [island.steps for island in collected] == [6] * 4
+    finally:
+        algorithm.close()
+
+
+def test_collect_in_process_returns_copies() -> None:
+    islands = still_islands(2, 4)
+    algorithm = IslandAlgorithm(islands, use_processes=False)
+    collected = algorithm.collect()
+    collected[0].population[0] = individual(5000, (5000.0,))
+    assert islands[0].population[0].genome != 5000
+    assert algorithm.collect()[0].population[0].genome != 5000
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_island_failure_keeps_replies_in_order(use_processes: bool) -> None:
+    islands: list[Still] = still_islands(3, 4)
+    islands[0].fail = True
+    algorithm = IslandAlgorithm(islands, use_processes=use_processes)
+    try:
+        with pytest.raises((ValueError, RuntimeError)):
+            algorithm.step()
+        # Replies of the other islands were drained, so the next
+        #   command receives its own replies.
+        collected = algorithm.collect()
+        assert [x.steps for x in collected] == [0, 1, 1]
+    finally:
+        algorithm.close()
+
+
+def test_islands_of_real_algorithms() -> None:
+    islands = [SimpleLinearAlgorithm(random_population(i, 10),
+                                     CountBits(),
+                                     TournamentSelector(10, 3),
+                                     MutateBits(0.1))
+               for i in range(3)]
+    algorithm = IslandAlgorithm(islands, migrants=2, topology="random")
+    try:
+        for _ in range(3):
+            algorithm.step()
+            assert len(algorithm.population) == 6
+            assert all(x.fitness == (x.genome.bit_count(),)
+                       for x in algorithm.population)
+    finally:
+        algorithm.close()
+
+
+class Batches(Evaluator[BitString]):
+    """Count bits, and record the size of each population evaluated."""
+    def __init__(self) -> None:
+        self.sizes: list[int] = []
+
+    def evaluate(self, individual: BitString) -> tuple[float]:
+        return (float(individual.genome.bit_count()),)
+
+    def evaluate_population(self, pop: Population[BitString]) -> None:
+        self.sizes.append(len(pop))
+        super().evaluate_population(pop)
+
+
+@pytest.mark.parametrize("batch_size", [1, 7, 50, 1024])
+def test_evaluate_stream_holds_one_batch(batch_size: int) -> None:
+    pop = random_population(3, 50)
+    produced: list[int] = []
+
+    def produce() -> Iterable[BitString]:
+        for x in pop:
+            produced.append(x.genome)
+            yield x
+
+    evaluator = Batches()
+    for count, x in enumerate(evaluator.evaluate_stream(produce(),
+                                                        batch_size)):
+        assert x is pop[count]
+        assert x.fitness == (x.genome.bit_count(),)
+        # Only the batch of ``x`` was produced.
+        assert len(produced) <= count - count % batch_size + batch_size
+    full, rest = divmod(50, batch_size)
+    assert evaluator.sizes == [batch_size] * full + ([rest] if rest else [])
+
+
+def seeded_run(streaming: bool,
+               selector: Callable[[], Any]) -> list[Any]:
+    np = pytest.importorskip("numpy")
+    random.seed(0)
+    np.random.seed(0)
+    algorithm = SimpleLinearAlgorithm(random_population(4, 30), CountBits(),
+                                      selector(), MutateBits(0.2),
+                                      streaming=streaming, batch_size=8)
+    events = Watcher[SimpleLinearAlgorithm[BitString], None](
+        set(algorithm.events), lambda x: None)
+    algorithm.register(events)
+    generations = []
+    for _ in range(4):
+        algorithm.step()
+        generations.append([(x.genome, x.fitness)
+                            for x in algorithm.population])
+    generations.append([x.event for x in events])
+    return generations
+
+
+@pytest.mark.parametrize("selector", [
+    lambda: TruncationSelector(20),
+    lambda: Elitist(TruncationSelector(20)),
+    lambda: TournamentSelector(20, 3),
+])
+def test_streaming_step_matches_collected_step(
+        selector: Callable[[], Any]) -> None:
+    streamed = seeded_run(True, selector)
+    collected = seeded_run(False, selector)
+    assert streamed[:-1] == collected[:-1]
+    assert streamed[-1] == ["POST_SELECTION"] * 4
+    assert collected[-1] == ["POST_VARIATION", "POST_EVALUATION",
+                             "POST_SELECTION"] * 4
+
+
+class TwoObjectives(Evaluator[BitString]):
+    """Count ones in the low byte and zeros in the high byte."""
+    def __init__(self) -> None:
+        self.evaluated: list[int] = []
+
+    def evaluate(self, individual: BitString) -> tuple[float, float]:
+        self.evaluated.append(individual.genome)
+        genome = individual.genome
+        return (float((genome & 0xFF).bit_count()),
+                float(8 - (genome >> 8).bit_count()))
+
+
+def test_nsga2_evaluates_only_offspring() -> None:
+    np = pytest.importorskip("numpy")
+    random.seed(0)
+    np.random.seed(0)
+    evaluator = TwoObjectives()
+    algorithm = NSGA2Algorithm(random_population(5, 20), evaluator,
+                               MutateBits(0.1))
+    algorithm.step()
+    # The first population and its offspring.
+    assert len(evaluator.evaluated) == 40
+
+    for _ in range(3):
+        evaluator.evaluated.clear()
+        algorithm.step()
+        assert len(evaluator.evaluated) == 20
+        assert len(algorithm.population) == 20
+        assert all(x.fitness == evaluator.evaluate(x)
+                   for x in algorithm.population)
@@ -0,0 +1,124 @@
+"""Check the packed :class:`.BitStringPopulation` in
+:mod:`evokit.evolvables.bitstring`.
+
+Each population-level kernel is compared against the operator it
+replaces, applied to one member at a time.
+"""
+from evokit.core import Population
+from evokit.evolvables.bitstring import BitString
+from evokit.evolvables.bitstring import BitStringPopulation
+from evokit.evolvables.bitstring import CountBits
+from evokit.evolvables.bitstring import MutateBits
+from evokit.evolvables.bitstring import OnePointCrossover
+from evokit.evolvables.bitstring import _flip_mask
+from evokit.evolvables.selectors import TruncationSelector
+
+import math
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+SIZES = [0, 1, 7, 8, 9, 63, 64, 100]
+
+
+def random_members(rng: random.Random, count: int,
+                   size: int) -> list[BitString]:
+    return [BitString(rng.getrandbits(size), size) for _ in range(count)]
+
+
+def splice(first: int, second: int, k: int, size: int) -> int:
+    # Same masks as :meth:`OnePointCrossover.vary`.
+    m1 = 2**size - 1
+    head_mask = m1 >> (size - k) << (size - k)
+    tail_mask = (m1 >> k) & m1
+    return (first & head_mask) | (second & tail_mask)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_pack_and_unpack_round_trip(size: int) -> None:
+    members = random_members(random.Random(size), 20, size)
+    pop = BitStringPopulation(members)
+
+    bits = pop.bits
+    assert pop.is_packed()
+    for row, member in zip(bits, members):
+        assert row.tobytes()\
+            == member.genome.to_bytes(bits.shape[1], "big")
+    assert [pop.member(i).genome for i in range(len(pop))]\
+        == [x.genome for x in members]
+
+    unpacked = BitStringPopulation.from_bits(bits, size)
+    assert [(x.genome, x.size) for x in unpacked]\
+        == [(x.genome, x.size) for x in members]
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_count_bits_matches_reference(size: int) -> None:
+    members = random_members(random.Random(size), 50, size)
+    pop = BitStringPopulation(members)
+    CountBits().evaluate_population(pop)
+    assert pop.is_packed()
+    assert [x.fitness for x in pop]\
+        == [(float(x.genome.bit_count()),) for x in members]
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("rate", [0.01, 0.3])
+def test_flip_mask_sets_only_used_bits(size: int, rate: float) -> None:
+    np.random.seed(size)
+    mask = _flip_mask(2000, size, rate)
+    assert mask.shape == (2000, (size + 7) // 8)
+    flips = 0
+    for row in mask:
+        value = int.from_bytes(row.tobytes(), "big")
+        assert value < 2**size
+        flips += value.bit_count()
+    # Within five standard deviations of the expected count.
+    expected = 2000 * size * rate
+    assert abs(flips - expected) <= 5 * math.sqrt(expected) + 1
+
+
+@pytest.mark.parametrize("rate", [0.0, 1.0])
+def test_mutate_bits_matches_reference(rate: float) -> None:
+    size = 37
+    members = random_members(random.Random(0), 30, size)
+    offspring = MutateBits(rate).vary_population(BitStringPopulation(members))
+    flipped = 2**size - 1 if rate == 1.0 else 0
+    assert [x.genome for x in offspring]\
+        == [x.genome ^ flipped for x in members]
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("probability", [0.0, 0.5, 1.0])
+def test_crossover_matches_reference(size: int, probability: float) -> None:
+    members = random_members(random.Random(size), 41, size)
+    offspring = OnePointCrossover(probability).vary_population(
+        BitStringPopulation(members))
+    assert len(offspring) == 40
+
+    for i in range(0, 40, 2):
+        first, second = members[i].genome, members[i + 1].genome
+        children = (offspring[i].genome, offspring[i + 1].genome)
+        # Some split point gives both children, as in
+        #   :meth:`OnePointCrossover.vary`.
+        assert any(children == (splice(first, second, k, size),
+                                splice(second, first, k, size))
+                   for k in range(size + 1))
+        if probability == 0.0:
+            assert children == (first, second)
+
+
+def test_truncation_takes_packed_rows() -> None:
+    members = random_members(random.Random(1), 60, 12)
+    packed = BitStringPopulation(members)
+    CountBits().evaluate_population(packed)
+    unpacked = Population([x.copy() for x in members])
+    CountBits().evaluate_population(unpacked)
+
+    selected = TruncationSelector(10).select_population(packed)
+    assert selected.is_packed()
+    assert [(x.genome, x.fitness) for x in selected]\
+        == [(x.genome, x.fitness)
+            for x in TruncationSelector(10).select_population(unpacked)]
@@ -0,0 +1,266 @@
+"""Check evaluators in :mod:`evokit.core.evaluator` against
+evaluating one individual at a time.
+"""
+from evokit.core import Population
+from evokit.core import Evaluator
+from evokit.core.accelerator import shutdown_pools
+from evokit.core.evaluator import AsyncEvaluator
+from evokit.core.evaluator import FitnessCache
+from evokit.evolvables.bitstring import BitString
+from evokit.evolvables.lgp import LGPFactory
+from evokit.evolvables.primitives import add, sub
+
+from collections.abc import Hashable
+from pathlib import Path
+
+from typing import Any
+from typing import Iterator
+from typing import Optional
+
+import asyncio
+import random
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def release_pools() -> Iterator[None]:
+    yield
+    shutdown_pools()
+
+
+def random_population(seed: int, count: int) -> Population[BitString]:
+    rng = random.Random(seed)
+    return Population([BitString(rng.getrandbits(16), 16)
+                       for _ in range(count)])
+
+
+def count_bits(individual: BitString) -> tuple[float]:
+    return (float(individual.genome.bit_count()),)
+
+
+class AsyncCountBits(AsyncEvaluator[BitString]):
+    """Count bits after a delay. Each genome fails :attr:`failures`
+    times before it succeeds.
+    """
+    def __init__(self, *args: Any, delay: float = 0.0, failures: int = 0,
+                 **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.delay = delay
+        self.failures = failures
+        self.attempts: dict[int, int] = {}
+        self.in_flight = 0
+        self.most_in_flight = 0
+
+    async def evaluate(self, individual: BitString) -> tuple[float]:
+        self.in_flight += 1
+        self.most_in_flight = max(self.most_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            attempt = self.attempts.get(individual.genome, 0)
+            self.attempts[individual.genome] = attempt + 1
+            if attempt < self.failures:
+                raise RuntimeError(f"Attempt {attempt} fails.")
+            return count_bits(individual)
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.mark.parametrize("concurrency", [1, 7, 64])
+def test_async_evaluator_matches_reference(concurrency: int) -> None:
+    pop = random_population(0, 50)
+    evaluator = AsyncCountBits(concurrency=concurrency, delay=0.001)
+    evaluator.evaluate_population(pop)
+    assert [x.fitness for x in pop] == [count_bits(x) for x in pop]
+    assert evaluator.most_in_flight == min(concurrency, 50)
+
+
+def test_async_evaluator_times_out() -> None:
+    evaluator = AsyncCountBits(delay=10.0, timeout=0.01)
+    with pytest.raises(TimeoutError):
+        evaluator.evaluate_population(random_population(1, 3))
+
+
+@pytest.mark.parametrize("retries", [0, 1, 2, 3])
+def test_async_evaluator_retries(retries: int) -> None:
+    pop = random_population(2, 10)
+    evaluator = AsyncCountBits(failures=2, retries=retries)
+    if retries < 2:
+        with pytest.raises(RuntimeError):
+            evaluator.evaluate_population(pop)
+    else:
+        evaluator.evaluate_population(pop)
+        assert [x.fitness for x in pop] == [count_bits(x) for x in pop]
+        assert set(evaluator.attempts.values()) == {3}
+
+
+def test_async_evaluator_runs_inside_event_loop() -> None:
+    pop = random_population(3, 20)
+    evaluator = AsyncCountBits()
+
+    async def main() -> None:
+        evaluator.evaluate_population(pop)
+
+    asyncio.run(main())
+    assert [x.fitness for x in pop] == [count_bits(x) for x in pop]
+
+    other = random_population(4, 20)
+    asyncio.run(evaluator.evaluate_population_async(other))
+    assert [x.fitness for x in other] == [count_bits(x) for x in other]
+
+
+def test_async_evaluator_retains_fitness() -> None:
+    pop = random_population(5, 10)
+    for individual in pop:
+        individual.fitness = (-1.0,)
+    evaluator = AsyncCountBits()
+    evaluator.retain_fitness = True
+    evaluator.evaluate_population(pop)
+    assert [x.fitness for x in pop] == [(-1.0,)] * 10
+    assert evaluator.attempts == {}
+
+
+def test_async_evaluator_rejects_bad_arguments() -> None:
+    with pytest.raises(ValueError):
+        AsyncCountBits(concurrency=0)
+    with pytest.raises(ValueError):
+        AsyncCountBits(retries=-1)
+
+
+class ReferenceCache:
+    """Scan all keys to find the one to forget."""
+    def __init__(self, max_size: int, policy: str) -> None:
+        self.max_size = max_size
+        self.policy = policy
+        self.fitnesses: dict[Hashable, tuple[float, ...]] = {}
+        self.last_use: dict[Hashable, int] = {}
+        self.uses: dict[Hashable, int] = {}
+        self.clock = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def touch(self, key: Hashable) -> None:
+        self.clock += 1
+        self.last_use[key] = self.clock
+        self.uses[key] += 1
+
+    def lookup(self, key: Hashable) -> Optional[tuple[float, ...]]:
+        if key not in self.fitnesses:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.touch(key)
+        return self.fitnesses[key]
+
+    def store(self, key: Hashable, fitness: tuple[float, ...]) -> None:
+        if key in self.fitnesses:
+            self.fitnesses[key] = fitness
+            self.touch(key)
+            return
+        if self.max_size < 1:
+            return
+        if len(self.fitnesses) >= self.max_size:
+            if self.policy == "lru":
+                victim = min(self.fitnesses, key=lambda k: self.last_use[k])
+            else:
+                victim = min(self.fitnesses,
+                             key=lambda k: (self.uses[k], self.last_use[k]))
+            del self.fitnesses[victim]
+            self.evictions += 1
+        self.fitnesses[key] = fitness
+        self.uses[key] = 0
+        self.touch(key)
+
+
+@pytest.mark.parametrize("policy", ["lru", "lfu"])
+@pytest.mark.parametrize("max_size", [0, 1, 5, 20])
+def test_fitness_cache_matches_reference(policy: Any, max_size: int) -> None:
+    rng = random.Random(max_size)
+    cache: FitnessCache[Any] = FitnessCache(max_size, policy)
+    expected = ReferenceCache(max_size, policy)
+    for step in range(3000):
+        # Some keys are much more frequent than others.
+        key = int(rng.paretovariate(1.0)) % 40
+        if rng.random() < 0.5:
+            assert cache.lookup(key) == expected.lookup(key)
+        else:
+            cache.store(key, (float(step),))
+            expected.store(key, (float(step),))
+        assert len(cache) == len(expected.fitnesses)
+    assert cache._fitnesses == expected.fitnesses
+    assert (cache.hits, cache.misses, cache.evictions)\
+        == (expected.hits, expected.misses, expected.evictions)
+
+
+def test_fitness_cache_rejects_unknown_policy() -> None:
+    with pytest.raises(ValueError):
+        FitnessCache(policy="fifo")  # type: ignore[arg-type]
+
+
+class SyncCountBits(Evaluator[BitString]):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.calls = 0
+
+    def evaluate(self, individual: BitString) -> tuple[float]:
+        self.calls += 1
+        return count_bits(individual)
+
+
+def duplicated_population(seed: int) -> Population[BitString]:
+    rng = random.Random(seed)
+    genomes = [rng.getrandbits(6) for _ in range(200)]
+    return Population([BitString(x, 6) for x in genomes])
+
+
+@pytest.mark.parametrize("processes", [None, 2, "threads:2"])
+def test_cache_evaluates_each_genome_once(processes: Any) -> None:
+    cache: FitnessCache[BitString] = FitnessCache()
+    evaluator = SyncCountBits(processes=processes, cache=cache)
+    pop = duplicated_population(0)
+    distinct = len({x.genome for x in pop})
+
+    evaluator.evaluate_population(pop)
+    assert [x.fitness for x in pop] == [count_bits(x) for x in pop]
+    assert len(cache) == distinct
+    assert cache.misses == len(pop)
+
+    again = duplicated_population(0)
+    evaluator.evaluate_population(again)
+    assert [x.fitness for x in again] == [count_bits(x) for x in again]
+    assert cache.hits == len(again)
+    if processes is None:
+        assert evaluator.calls == distinct
+
+
+def test_async_cache_evaluates_each_genome_once() -> None:
+    cache: FitnessCache[BitString] = FitnessCache()
+    evaluator = AsyncCountBits(cache=cache)
+    pop = duplicated_population(1)
+    evaluator.evaluate_population(pop)
+    assert [x.fitness for x in pop] == [count_bits(x) for x in pop]
+    assert set(evaluator.attempts.values()) == {1}
+    assert len(evaluator.attempts) == len(cache)
+
+
+def test_fitness_cache_save_and_load(tmp_path: Path) -> None:
+    pytest.importorskip("dill")
+    cache: FitnessCache[Any] = FitnessCache(10, "lfu", key=str)
+    for key in range(15):
+        cache.store(key, (float(key),))
+    cache.save(tmp_path / "cache")
+    restored = FitnessCache.load(tmp_path / "cache")
+    assert restored._fitnesses == cache._fitnesses
+    assert restored.evictions == 5
+    assert restored.key_of(3) == "3"
+
+
+def test_linear_programs_are_keyed_by_structure() -> None:
+    random.seed(0)
+    factory = LGPFactory([add, sub], 3, 2)
+    programs = [factory.build(10) for _ in range(50)]
+    for program in programs:
+        assert program.genome_key() == program.copy().genome_key()
+    for a in programs:
+        for b in programs:
+            assert (a.genome_key() == b.genome_key())\
+                == ([str(x) for x in a.genome] == [str(x) for x in b.genome])
@@ -0,0 +1,226 @@
+"""Check tree-based genetic programs in :mod:`evokit.evolvables.gp`.
+
+Each fast path is compared against the slow path it replaces, on
+random programs: compiled callables against calling the tree, and
+vectorised evaluation against evaluation at each point.
+"""
+from evokit.core import Evaluator
+from evokit.core import Population
+from evokit.evolvables.gp import Expression
+from evokit.evolvables.gp import ExpressionFactory
+from evokit.evolvables.gp import MemoiseExpression
+from evokit.evolvables.gp import Program
+from evokit.evolvables.gp import Symbol
+from evokit.evolvables.gp import SymbolicEvaluator
+from evokit.evolvables.gp import _get_arity
+from evokit.evolvables.primitives import add, sub, mul, div
+
+from typing import Any
+
+import copy
+import math
+import pickle
+import random
+
+import pytest
+
+
+def random_programs(seed: int, count: int,
+                    primitives: tuple[Any, ...] = (add, sub, mul, 1.0, 2.0))\
+        -> list[Program[float]]:
+    random.seed(seed)
+    factory = ExpressionFactory[float](primitives=primitives, arity=2)
+    return [Program(factory.build(random.randint(1, 30), 6))
+            for _ in range(count)]
+
+
+def objective(x: float, y: float) -> float:
+    return x * y + 1
+
+
+def reference_evaluate(program: Program[float],
+                       support: list[tuple[float, float]]) -> tuple[float]:
+    return (-sum([abs(objective(*sup) - program.genome(*sup))
+                 for sup in support]),)
+
+
+def random_points(seed: int, count: int) -> list[tuple[float, float]]:
+    rng = random.Random(seed)
+    return [(rng.uniform(-2, 2), rng.uniform(-2, 2)) for _ in range(count)]
+
+
+def close(a: float, b: float) -> bool:
+    return math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-9)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_compiled_matches_tree(seed: int) -> None:
+    points = random_points(seed, 5)
+    for program in random_programs(seed, 100):
+        compiled = program.compile()
+        for point in points:
+            assert close(compiled(*point), program.genome(*point))
+
+
+def test_compiled_is_cached() -> None:
+    program = random_programs(0, 1)[0]
+    assert program.compile() is program.compile()
+    assert program.compile() is not program.compile(vectorised=True)
+
+
+def test_vectorised_compiled_matches_tree() -> None:
+    np = pytest.importorskip("numpy")
+    points = random_points(1, 20)
+    columns = np.asarray(points).T
+    for program in random_programs(1, 100):
+        outputs = np.broadcast_to(
+            program.compile(vectorised=True)(*columns), (len(points),))
+        for output, point in zip(outputs, points):
+            assert close(float(output), program.genome(*point))
+
+
+def test_compile_rejects_misconfigured_node() -> None:
+    node = Expression(1, add, [Expression(1, Symbol(0), [])],
+                      value_arity=2)
+    with pytest.raises(ValueError):
+        node.compile()
+
+
+def test_compiled_program_can_be_pickled() -> None:
+    program = random_programs(2, 1)[0]
+    program.compile()
+    program.compile(vectorised=True)
+
+    restored = pickle.loads(pickle.dumps(program))
+    assert restored.genome._compiled == {}
+    assert close(restored.compile()(0.5, -1.5), program.genome(0.5, -1.5))
+
+    assert copy.deepcopy(program).genome._compiled == {}
+    assert program.copy().genome._compiled == {}
+
+
+@pytest.mark.parametrize("vectorised", [False, True])
+def test_symbolic_evaluator_matches_reference(vectorised: bool) -> None:
+    if vectorised:
+        pytest.importorskip("numpy")
+    support = random_points(3, 30)
+    evaluator = SymbolicEvaluator(objective, tuple(support),
+                                  vectorised=vectorised)
+    for program in random_programs(3, 100,
+                                   (add, sub, mul, div, 0.0, 1.0)):
+        assert close(evaluator.evaluate(program)[0],
+                     reference_evaluate(program, support)[0])
+
+
+def test_symbolic_evaluator_rejects_wrong_arity() -> None:
+    with pytest.raises(TypeError):
+        SymbolicEvaluator(objective, ((1.0,),))
+
+
+def nodes(expr: Expression[Any]) -> list[Expression[Any]]:
+    return [expr] + [x for child in expr.children for x in nodes(child)]
+
+
+def test_stored_arities_match_signatures() -> None:
+    for program in random_programs(4, 100):
+        factory = program.genome.factory
+        assert factory is not None
+        for node in nodes(program.genome):
+            assert node.value_arity == _get_arity(node.value)
+            assert factory.arity_of(node.value) == node.value_arity
+            assert len(node.children) == node.value_arity
+
+
+def test_override_arities_admit_builtins() -> None:
+    with pytest.raises(ValueError):
+        ExpressionFactory[float](primitives=(max, 1.0), arity=1)
+
+    factory = ExpressionFactory[float](primitives=(max, add, 1.0),
+                                       arity=1,
+                                       override_arities={max: 2})
+    assert factory.arity_of(max) == 2
+    random.seed(5)
+    for _ in range(50):
+        expr = factory.build(random.randint(1, 20), 5)
+        assert expr(0.5) == reference_call(expr, 0.5)
+
+
+def reference_call(expr: Expression[float], *args: float) -> float:
+    if callable(expr.value):
+        return expr.value(*(reference_call(x, *args)
+                            for x in expr.children))
+    if isinstance(expr.value, Symbol):
+        return args[expr.value.pos]
+    return expr.value
+
+
+@pytest.mark.parametrize("processes", [None, "threads:4"])
+def test_shared_subtrees_match_reference(processes: Any) -> None:
+    pytest.importorskip("numpy")
+    support = random_points(6, 30)
+    evaluator = SymbolicEvaluator(objective, tuple(support),
+                                  vectorised=True, share_subtrees=True)
+    evaluator.processes = processes
+    programs = random_programs(6, 200)
+    # Copies share every subtree with their originals.
+    pop = Population(programs + [x.copy() for x in programs[:50]])
+    for _ in range(2):
+        evaluator.evaluate_population(pop)
+        for program in pop:
+            assert close(program.fitness[0],
+                         reference_evaluate(program, support)[0])
+
+
+def test_subtree_limit_bounds_memory() -> None:
+    pytest.importorskip("numpy")
+    support = random_points(7, 10)
+    evaluator = SymbolicEvaluator(objective, tuple(support),
+                                  vectorised=True, share_subtrees=True)
+    evaluator.subtree_limit = 50
+    for program in random_programs(7, 100):
+        assert close(evaluator.evaluate(program)[0],
+                     reference_evaluate(program, support)[0])
+        # Each program adds at most 30 nodes after the limit is checked.
+        assert len(evaluator._subtree_outputs) <= 50 + 30
+
+
+def test_structural_key_identifies_structure() -> None:
+    programs = random_programs(8, 100)
+    for program in programs:
+        assert program.genome.structural_key()\
+            == program.copy().genome.structural_key()
+    for a in programs:
+        for b in programs:
+            if a.genome.structural_key() == b.genome.structural_key():
+                assert str(a.genome) == str(b.genome)
+
+
+class CountingEvaluator(Evaluator[Program[float]]):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def evaluate(self, individual: Program[float]) -> tuple[float]:
+        self.calls += 1
+        return reference_evaluate(individual, [(1.0, 2.0)])
+
+
+def test_memoise_expression_evaluates_each_structure_once() -> None:
+    programs = random_programs(9, 50)
+    evaluator = MemoiseExpression(CountingEvaluator(), max_size=1000)
+    for program in programs + [x.copy() for x in programs]:
+        assert evaluator.evaluate(program)\
+            == reference_evaluate(program, [(1.0, 2.0)])
+    assert evaluator.calls\
+        == len({x.genome.structural_key() for x in programs})
+
+
+def test_memoise_expression_forgets_least_recently_used() -> None:
+    first, second, third = random_programs(10, 3,
+                                           (add, 1.0, 2.0, 3.0, 4.0, 5.0))
+    assert len({x.genome.structural_key()
+                for x in (first, second, third)}) == 3
+    evaluator = MemoiseExpression(CountingEvaluator(), max_size=2)
+    for program in (first, second, first, third, first, second):
+        evaluator.evaluate(program)
+    # ``second`` is forgotten when ``third`` is remembered.
+    assert evaluator.calls == 4
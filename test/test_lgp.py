@@ -0,0 +1,468 @@
+"""Check linear genetic programs in :mod:`evokit.evolvables.lgp`.
+
+Each fast path is compared against the slow path it replaces, on
+random programs. The interpreter that :meth:`.RegisterStates.run`
+replaced is copied below, with its verbose output removed.
+"""
+from evokit.evolvables.lgp import CellSpecifier
+from evokit.evolvables.lgp import Condition
+from evokit.evolvables.lgp import For
+from evokit.evolvables.lgp import If
+from evokit.evolvables.lgp import LGPEvaluator
+from evokit.evolvables.lgp import Instruction
+from evokit.evolvables.lgp import Label
+from evokit.evolvables.lgp import LGPFactory
+from evokit.evolvables.lgp import LinearGeneticProgram
+from evokit.evolvables.lgp import Operation
+from evokit.evolvables.lgp import RegisterStates
+from evokit.evolvables.lgp import StateVectorType
+from evokit.evolvables.lgp import StructNextLine
+from evokit.evolvables.lgp import StructOverLines
+from evokit.evolvables.lgp import StructureScope
+from evokit.evolvables.lgp import StructUntilLabel
+from evokit.evolvables.lgp import StructureType
+from evokit.evolvables.lgp import While
+from evokit.evolvables.lgp import cell
+from evokit.evolvables.lgp import compile_program
+from evokit.evolvables.lgp._program import _Span
+from evokit.evolvables.lgp._program import _scopes
+from evokit.evolvables.lgp._optimise import optimise_and_mask
+from evokit.evolvables.lgp._optimise import optimise_and_reduce
+from evokit.evolvables.primitives import add, sub, mul
+from evokit.evolvables.primitives import gt, lt, neq, eq
+
+from typing import Any
+from typing import Optional
+from typing import Sequence
+
+import pickle
+import random
+
+import pytest
+
+
+REGISTER_COUNT = 5
+
+CONSTANT_COUNT = 3
+
+LABELS = ["A", "B", "C"]
+
+
+@pytest.fixture(autouse=True)
+def short_loops(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Nested loops run for the product of their caps.
+    monkeypatch.setattr(For, "LOOP_CAP", 4)
+    monkeypatch.setattr(While, "LOOP_CAP", 3)
+
+
+# Modular arithmetic keeps values small in loops, and exact.
+def madd(x: int, y: int) -> int:
+    return (x + y) % 97
+
+
+def msub(x: int, y: int) -> int:
+    return (x - y) % 97
+
+
+def mmul(x: int, y: int) -> int:
+    return (x * y) % 97
+
+
+class ReferenceStates:
+    """The interpreter of :class:`.RegisterStates`, before it found
+    scopes once for each program. Structures run copies of their
+    bodies, and find scopes each time they run.
+    """
+    def __init__(self, registers: list[Any],
+                 constants: tuple[Any, ...]) -> None:
+        self.registers = registers
+        self.constants = constants
+
+    def get_cell_value(self, spec: CellSpecifier) -> Any:
+        if spec[0] == StateVectorType.register:
+            return self.registers[spec[1]]
+        return self.constants[spec[1]]
+
+    def check_condition(self, cond: Condition) -> bool:
+        return cond.function(*(self.get_cell_value(spec)
+                               for spec in cond.args))
+
+    def run(self, instructions: Sequence[Optional[Instruction]]) -> None:
+        current_line = 0
+        while current_line < len(instructions):
+            current_line += self._run_instruction(instructions,
+                                                  current_line)
+
+    def _run_instruction(self,
+                         instructions: Sequence[Optional[Instruction]],
+                         pos: int) -> int:
+        instruction = instructions[pos]
+        match instruction:
+            case Operation():
+                if instruction.target < 0:
+                    raise ValueError("Malformed instruction.")
+                self.registers[instruction.target] =\
+                    instruction.function(
+                        *(self.get_cell_value(s)
+                          for s in instruction.operands))
+                return 1
+            case StructOverLines() | StructUntilLabel():
+                scope = instruction.scope(instructions, pos)
+                instruction.stype(self,  # type: ignore[arg-type]
+                                  instructions[pos + 1:pos + scope + 1])
+                return scope + 1
+            case Label() | None:
+                return 1
+            case _:
+                raise ValueError("Instruction not recognised.")
+
+
+class FirstTwo(StructOverLines):
+    """Structure whose scope is found by a custom method."""
+    def scope(self, instructions: Sequence[Optional[Instruction[Any]]],
+              pos: int) -> int:
+        return min(2, len(instructions) - (pos + 1))
+
+
+class Backwards(StructureType):
+    """Custom structure type that runs a slice of its body."""
+    def __call__(self, lgp: RegisterStates,
+                 instructions: Sequence[Optional[Instruction]]) -> None:
+        lgp.run(instructions[::-1])
+
+    def copy(self) -> "Backwards":
+        return Backwards()
+
+    def __str__(self) -> str:
+        return "backwards"
+
+    __repr__ = __str__
+
+
+def random_operand(rng: random.Random) -> CellSpecifier:
+    if rng.random() < 0.7:
+        return cell(rng.randrange(REGISTER_COUNT))
+    return cell(-1 - rng.randrange(CONSTANT_COUNT))
+
+
+def random_condition(rng: random.Random) -> Condition | bool:
+    if rng.random() < 0.15:
+        return rng.random() < 0.5
+    return Condition(rng.choice([gt, lt, neq, eq]),
+                     (random_operand(rng), random_operand(rng)))
+
+
+def random_structure_type(rng: random.Random,
+                          custom: bool) -> StructureType:
+    roll = rng.random()
+    if custom and roll < 0.1:
+        return Backwards()
+    if roll < 0.35:
+        return If(random_condition(rng))
+    if roll < 0.6:
+        return While(random_condition(rng))
+    if rng.random() < 0.6:
+        return For(rng.randint(0, 4))
+    return For(random_operand(rng))
+
+
+def random_instruction(rng: random.Random, custom: bool) -> Instruction:
+    roll = rng.random()
+    if roll < 0.6:
+        return Operation(rng.choice([madd, msub, mmul]),
+                         rng.randrange(REGISTER_COUNT),
+                         (cell(rng.randrange(REGISTER_COUNT)),
+                          random_operand(rng)))
+    if roll < 0.7:
+        return Label(rng.choice(LABELS))
+    stype = random_structure_type(rng, custom)
+    if roll < 0.82:
+        return StructOverLines(stype, rng.randint(0, 6))
+    if roll < 0.88:
+        return StructNextLine(stype)
+    if custom and roll < 0.92:
+        return FirstTwo(stype, 0)
+    return StructUntilLabel(stype, rng.choice(LABELS))
+
+
+def random_program(rng: random.Random,
+                   custom: bool = False) -> list[Instruction]:
+    return [random_instruction(rng, custom)
+            for _ in range(rng.randint(0, 25))]
+
+
+def random_case(rng: random.Random) -> tuple[list[int], tuple[int, ...]]:
+    return ([rng.randrange(97) for _ in range(REGISTER_COUNT)],
+            tuple(rng.randrange(97) for _ in range(CONSTANT_COUNT)))
+
+
+def reference_run(program: Sequence[Optional[Instruction]],
+                  registers: list[int],
+                  constants: tuple[int, ...]) -> list[int]:
+    registers = list(registers)
+    ReferenceStates(registers, constants).run(program)
+    return registers
+
+
+def test_factory_arities_match_operands() -> None:
+    factory = LGPFactory([add, sub, max], 4, 2, override_arities={max: 2})
+    assert factory.arities[max] == 2
+    for _ in range(20):
+        for instruction in factory.build(20).genome:
+            if isinstance(instruction, Operation):
+                assert len(instruction.operands)\
+                    == factory.arities[instruction.function]
+
+
+def test_factory_rejects_builtins_without_arities() -> None:
+    with pytest.raises(ValueError):
+        LGPFactory([max], 4, 2)
+
+
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize("custom", [False, True])
+def test_compiled_program_matches_reference(seed: int,
+                                            custom: bool) -> None:
+    rng = random.Random(seed)
+    for _ in range(250):
+        program = random_program(rng, custom)
+        masked = optimise_and_mask(program, {0, 1})
+        compiled = compile_program(program)
+        compiled_masked = compile_program(masked)
+        for _ in range(3):
+            registers, constants = random_case(rng)
+            expected = reference_run(program, registers, constants)
+
+            actual = list(registers)
+            compiled(actual, constants)
+            assert actual == expected, compiled.source
+
+            # Masked instructions are skipped.
+            expected = reference_run(masked, registers, constants)
+            actual = list(registers)
+            compiled_masked(actual, constants)
+            assert actual == expected, compiled_masked.source
+
+
+def test_deeply_nested_program_is_interpreted() -> None:
+    # Python cannot compile so many nested blocks.
+    program: list[Instruction] = [StructOverLines(For(1), 100)
+                                  for _ in range(30)]
+    program.append(Operation(madd, 0, (cell(0), cell(-1))))
+    compiled = compile_program(program)
+    assert compiled._function == compiled._interpret
+    registers = [0] * REGISTER_COUNT
+    compiled(registers, (1, 0, 0))
+    assert registers == [1] + [0] * (REGISTER_COUNT - 1)
+
+
+def test_compiled_program_rejects_negative_targets() -> None:
+    with pytest.raises(ValueError):
+        compile_program([Operation(madd, -1, (cell(0), cell(1)))])
+
+
+def test_compiled_program_pickles_by_instructions() -> None:
+    rng = random.Random(0)
+    program = random_program(rng)
+    compiled = pickle.loads(pickle.dumps(compile_program(program)))
+    registers, constants = random_case(rng)
+    expected = reference_run(program, registers, constants)
+    compiled(registers, constants)
+    assert registers == expected
+
+
+def test_programs_remember_compiled_code() -> None:
+    rng = random.Random(1)
+    program = LinearGeneticProgram(random_program(rng))
+    compiled = program.compiled(None, {0})
+    assert program.compiled(None, {0}) is compiled
+    assert program.compiled(optimise_and_mask, {0}) is not compiled
+    assert program.compiled(None, {1}) is not compiled
+
+    restored = pickle.loads(pickle.dumps(program))
+    assert restored._compiled == {}
+
+    # Assigning a genome forgets compiled code.
+    program.genome = random_program(rng)
+    recompiled = program.compiled(None, {0})
+    assert recompiled is not compiled
+    assert recompiled.instructions is program.genome
+
+
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize("custom", [False, True])
+def test_vectorised_program_matches_reference(seed: int,
+                                              custom: bool) -> None:
+    np = pytest.importorskip("numpy")
+    rng = random.Random(seed)
+    # All cases share the first constant, which is given as a scalar.
+    cases = [(registers, (seed, *constants[1:]))
+             for registers, constants in
+             (random_case(rng) for _ in range(20))]
+    columns = [np.array(x) for x in zip(*(case[0] for case in cases))]
+    constants = [seed, *(np.array(x) for x in
+                         list(zip(*(case[1] for case in cases)))[1:])]
+
+    for _ in range(100):
+        program = random_program(rng, custom)
+        compiled = compile_program(program, vectorised=True)
+        registers = list(columns)
+        compiled(registers, constants)
+        actual = np.column_stack(registers).tolist()
+        expected = [reference_run(program, *case) for case in cases]
+        assert actual == expected, compiled.source
+
+
+def distance(expected: Sequence[float], actual: Sequence[float]) -> float:
+    return -sum(abs(x - y) for x, y in zip(expected, actual))
+
+
+def total_distance(expected: Any, actual: Any) -> float:
+    return -float(abs(expected - actual).sum())
+
+
+@pytest.mark.parametrize("optimise_mode", ["none", "mask", "reduce"])
+def test_vectorised_evaluator_matches_interpreter(optimise_mode: Any) -> None:
+    pytest.importorskip("numpy")
+    random.seed(0)
+    rng = random.Random(0)
+    cases = [((tuple(rng.uniform(-2, 2) for _ in range(4)), (1.0, 0.5)),
+              (rng.uniform(-2, 2), rng.uniform(-2, 2)))
+             for _ in range(30)]
+    # Targets are drawn from one more register than the count.
+    factory = LGPFactory([add, sub, mul], 3, 2)
+    programs = [factory.build(15) for _ in range(40)]
+
+    def evaluator(**kwargs: Any) -> LGPEvaluator[float]:
+        return LGPEvaluator(cases, {0, 2}, optimise_mode, distance,
+                            **kwargs)
+
+    interpreted = [evaluator(compiled=False).evaluate(x) for x in programs]
+    for kwargs in ({"compiled": True},
+                   {"vectorised": True},
+                   {"vectorised": True,
+                    "vectorised_fitness_function": total_distance}):
+        assert [evaluator(**kwargs).evaluate(x) for x in programs]\
+            == [pytest.approx(x, rel=1e-9, nan_ok=True)
+                for x in interpreted]
+
+
+def test_vectorised_evaluator_rejects_ragged_cases() -> None:
+    pytest.importorskip("numpy")
+    cases = [(((1.0, 2.0), (1.0,)), (1.0,)),
+             (((1.0,), (1.0,)), (1.0,))]
+    program = LinearGeneticProgram(
+        [Operation(add, 0, (cell(0), cell(-1)))])
+    with pytest.raises(ValueError):
+        LGPEvaluator(cases, {0}, "none", distance,
+                     vectorised=True).evaluate(program)
+
+
+class CountingOptimiser:
+    """Optimiser that counts the programs it analyses."""
+    def __init__(self, optimiser: Any) -> None:
+        self.optimiser = optimiser
+        self.calls = 0
+
+    def __call__(self, instructions: Sequence[Instruction],
+                 output_indices: set[int]) -> Any:
+        self.calls += 1
+        return self.optimiser(instructions, output_indices)
+
+
+@pytest.mark.parametrize("optimiser", [optimise_and_mask,
+                                       optimise_and_reduce])
+@pytest.mark.parametrize("compiled", [False, True])
+def test_evaluator_analyses_each_program_once(optimiser: Any,
+                                              compiled: bool) -> None:
+    rng = random.Random(0)
+    cases = [random_case(rng) for _ in range(5)]
+    fitness_cases = [((tuple(r), c), tuple(r[:2])) for r, c in cases]
+    programs = [LinearGeneticProgram(random_program(rng))
+                for _ in range(30)]
+    evaluator = LGPEvaluator(fitness_cases, {0, 1}, "none", distance,
+                             compiled=compiled)
+    counting = CountingOptimiser(optimiser)
+    evaluator.optimiser = counting
+
+    expected = []
+    for program in programs:
+        code = optimiser(program.genome, {0, 1})
+        expected.append((sum(
+            distance(outputs, reference_run(code, list(r), c)[:2])
+            for (r, c), outputs in fitness_cases),))
+
+    for _ in range(3):
+        assert [evaluator.evaluate(x) for x in programs] == expected
+    assert counting.calls == len(programs)
+
+    # Copies and new genomes are analysed again.
+    evaluator.evaluate(programs[0].copy())
+    programs[1].genome = list(programs[1].genome)
+    evaluator.evaluate(programs[1])
+    assert counting.calls == len(programs) + 2
+
+
+def test_programs_remember_analysis_by_outputs() -> None:
+    program = LinearGeneticProgram(random_program(random.Random(2)))
+    counting = CountingOptimiser(optimise_and_mask)
+    first = program.optimised(counting, {0})
+    assert program.optimised(counting, {0}) is first
+    program.optimised(counting, {1})
+    assert counting.calls == 2
+    assert [str(x) for x in first]\
+        == [str(x) for x in optimise_and_mask(program.genome, {0})]
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_scopes_match_reference(seed: int) -> None:
+    rng = random.Random(seed)
+    for _ in range(250):
+        program = random_program(rng, custom=True)
+        assert _scopes(program)\
+            == {i: x.scope(program, i) for i, x in enumerate(program)
+                if isinstance(x, StructureScope)}
+
+
+def assert_spans_match_slices(span: _Span,
+                              instructions: list[Optional[Instruction]])\
+        -> None:
+    assert len(span) == len(instructions)
+    assert list(span) == instructions
+    assert [span[i] for i in range(len(span))] == instructions
+    assert span[1:-1] == instructions[1:-1]
+    assert span[::-1] == instructions[::-1]
+    for pos, instruction in enumerate(instructions):
+        if isinstance(instruction, StructureScope):
+            # Scopes in a body are found as in a copy of that body.
+            scope = span.scope(instruction, pos)
+            assert scope == instruction.scope(instructions, pos)
+            assert_spans_match_slices(
+                span.body(pos, scope),
+                instructions[pos + 1:pos + scope + 1])
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_prepared_spans_match_slices(seed: int) -> None:
+    rng = random.Random(seed)
+    for _ in range(250):
+        program = random_program(rng, custom=True)
+        prepared = RegisterStates.prepare(program)
+        assert isinstance(prepared, _Span)
+        assert RegisterStates.prepare(prepared) is prepared
+        assert_spans_match_slices(prepared, list(program))
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_interpreter_matches_reference(seed: int) -> None:
+    rng = random.Random(seed)
+    for _ in range(250):
+        program = random_program(rng, custom=True)
+        prepared = RegisterStates.prepare(program)
+        for _ in range(3):
+            registers, constants = random_case(rng)
+            expected = reference_run(program, registers, constants)
+            for code in (program, prepared):
+                actual = list(registers)
+                RegisterStates(actual, constants).run(code)
+                assert actual == expected, program
@@ -0,0 +1,249 @@
+"""Check that the intron finder in
+:mod:`evokit.evolvables.lgp._optimise` agrees with the quadratic
+implementation that it replaced, on random programs.
+
+The old implementation is copied below, with its verbose output
+removed.
+"""
+from evokit.evolvables.lgp import Instruction
+from evokit.evolvables.lgp import StructureScope
+from evokit.evolvables.lgp import StructOverLines
+from evokit.evolvables.lgp import StructNextLine
+from evokit.evolvables.lgp import StructUntilLabel
+from evokit.evolvables.lgp import Label
+from evokit.evolvables.lgp import StateVectorType
+from evokit.evolvables.lgp import CellSpecifier
+from evokit.evolvables.lgp import Operation
+from evokit.evolvables.lgp import Condition
+from evokit.evolvables.lgp import StructureType
+from evokit.evolvables.lgp import If
+from evokit.evolvables.lgp import While
+from evokit.evolvables.lgp import For
+from evokit.evolvables.lgp import cell
+from evokit.evolvables.lgp import _optimise
+from evokit.evolvables.primitives import add, sub, mul
+from evokit.evolvables.primitives import gt, lt, neq, eq
+from evokit.evolvables._common import replace_at_indices
+
+from typing import Optional
+from typing import Sequence
+
+import random
+
+import pytest
+
+
+REGISTER_COUNT = 6
+
+CONSTANT_COUNT = 3
+
+LABELS = ["A", "B", "C"]
+
+
+def reference_index_introns(instructions: Sequence[Instruction],
+                            output_indices: set[int]) -> set[int]:
+    scope_matrix: list[list[bool]] =\
+        create_matrix((len(instructions),
+                       len(instructions)), False)
+
+    control_indices: set[int] = set()
+
+    noexec_indices: set[int] = set()
+
+    for i in range(len(instructions)):
+        current_instruction: Instruction = instructions[i]
+        if isinstance(current_instruction, StructureScope):
+            scope: int = current_instruction.scope(instructions, i)
+            scope_matrix[i][i:i + scope] = [True] * scope
+            control_indices.add(i)
+            if not may_run(current_instruction):
+                noexec_indices.update(set(range(i, i + scope + 1)))
+                i += scope
+
+    effective_registers: set[int] = set(output_indices)
+
+    effective_indices: set[int] = set()
+
+    for i in range(len(instructions))[::-1]:
+        current_instruction = instructions[i]
+        if i in noexec_indices:
+            continue
+        match current_instruction:
+            case Operation():
+                if current_instruction.target in effective_registers:
+                    effective_registers.update([
+                        x[1] for x in current_instruction.operands
+                        if x[0] == StateVectorType.register
+                    ])
+                    effective_indices.add(i)
+            case StructureScope():
+                match current_instruction.stype:
+                    case If() | While() as stype:
+                        scope = current_instruction.scope(instructions, i)
+                        if not set(range(i, i + scope + 1)).isdisjoint(
+                            effective_indices
+                        ):
+                            effective_indices.add(i)
+                            if isinstance(stype.condition, Condition):
+                                effective_registers.update([
+                                    x[1] for x in stype.condition.args
+                                    if x[0] == StateVectorType.register
+                                ])
+            case _:
+                effective_indices.add(i)
+
+    return set(range(len(instructions))).difference(effective_indices)
+
+
+def may_run(struct: StructureScope) -> bool:
+    match struct.stype:
+        case If() | While():
+            match struct.stype.condition:
+                case Condition() as c:
+                    if c.function in {gt, lt, neq}:
+                        return c.args[0] != c.args[1]
+                    else:
+                        return True
+                case bool():
+                    return struct.stype.condition
+        case _:
+            return True
+
+
+def create_matrix[T](shape: tuple[int, int],
+                     value: T) -> list[list[T]]:
+    return [[value] * shape[0]
+            for _ in range(shape[0])]
+
+
+def reference_optimise_and_mask(instructions: Sequence[Instruction],
+                                output_indices: set[int])\
+        -> Sequence[Optional[Instruction]]:
+    return replace_at_indices(instructions,
+                              reference_index_introns(instructions,
+                                                      output_indices),
+                              None)
+
+
+def reference_optimise_and_reduce(instructions: Sequence[Instruction],
+                                  output_indices: set[int])\
+        -> Sequence[Instruction]:
+    instructions = [x.copy() for x in instructions]
+
+    indices_of_introns: set[int] = reference_index_introns(
+        instructions,
+        output_indices
+    )
+
+    scope_matrix: list[list[bool]] =\
+        create_matrix((len(instructions),
+                       len(instructions)), False)
+
+    rescope_scheme: list[int] = [0] * len(instructions)
+
+    for i in range(len(instructions)):
+        current_instruction: Instruction = instructions[i]
+        if isinstance(current_instruction, StructureScope):
+            scope: int = current_instruction.scope(instructions,
+                                                   i)
+            scope_matrix[i][i:i + scope] = [True] * scope
+
+    indices_of_controls_to_rescope: set[int] = set()
+
+    for i in range(len(instructions))[::-1]:
+        if i in indices_of_introns:
+            for j in range(len(instructions)):
+                possible_control = instructions[j]
+                if scope_matrix[j][i] and\
+                        isinstance(possible_control, StructOverLines):
+                    rescope_scheme[j] += 1
+                    indices_of_controls_to_rescope.add(j)
+
+    for i in indices_of_controls_to_rescope:
+        control = instructions[i]
+        assert isinstance(control, StructOverLines)
+        control.line_count -= rescope_scheme[i]
+
+    for i in sorted(indices_of_introns)[::-1]:
+        del instructions[i]
+    return instructions
+
+
+def random_operand(rng: random.Random) -> CellSpecifier:
+    if rng.random() < 0.7:
+        return cell(rng.randrange(REGISTER_COUNT))
+    return cell(-1 - rng.randrange(CONSTANT_COUNT))
+
+
+def random_condition(rng: random.Random) -> Condition | bool:
+    if rng.random() < 0.15:
+        return rng.random() < 0.5
+    left = random_operand(rng)
+    # Identical operands make some conditions always false.
+    right = left if rng.random() < 0.3 else random_operand(rng)
+    if left[0] != StateVectorType.register\
+            and right[0] != StateVectorType.register:
+        left = cell(0)
+    return Condition(rng.choice([gt, lt, neq, eq]), (left, right))
+
+
+def random_structure_type(rng: random.Random) -> StructureType:
+    roll = rng.random()
+    if roll < 0.33:
+        return If(random_condition(rng))
+    if roll < 0.66:
+        return While(random_condition(rng))
+    if rng.random() < 0.7:
+        return For(rng.randint(0, 4))
+    return For(random_operand(rng))
+
+
+def random_instruction(rng: random.Random) -> Instruction:
+    roll = rng.random()
+    if roll < 0.55:
+        return Operation(rng.choice([add, sub, mul]),
+                         rng.randrange(REGISTER_COUNT),
+                         (cell(rng.randrange(REGISTER_COUNT)),
+                          random_operand(rng)))
+    if roll < 0.65:
+        return Label(rng.choice(LABELS))
+    if roll < 0.8:
+        return StructOverLines(random_structure_type(rng),
+                               rng.randint(0, 8))
+    if roll < 0.85:
+        return StructNextLine(random_structure_type(rng))
+    return StructUntilLabel(random_structure_type(rng),
+                            rng.choice(LABELS))
+
+
+def random_program(rng: random.Random) -> list[Instruction]:
+    return [random_instruction(rng)
+            for _ in range(rng.randint(0, 60))]
+
+
+def assert_same(actual: Sequence[Optional[Instruction]],
+                expected: Sequence[Optional[Instruction]]) -> None:
+    assert [str(x) for x in actual] == [str(x) for x in expected]
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_optimise_matches_reference(seed: int) -> None:
+    rng = random.Random(seed)
+    for _ in range(250):
+        program = random_program(rng)
+        outputs = set(rng.sample(range(REGISTER_COUNT), rng.randint(0, 3)))
+
+        assert _optimise.index_introns(program, outputs)\
+            == reference_index_introns(program, outputs), program
+        assert_same(_optimise.optimise_and_mask(program, outputs),
+                    reference_optimise_and_mask(program, outputs))
+        assert_same(_optimise.optimise_and_reduce(program, outputs),
+                    reference_optimise_and_reduce(program, outputs))
+
+
+def test_optimise_and_reduce_leaves_input_unchanged() -> None:
+    rng = random.Random(0)
+    program = random_program(rng)
+    before = [str(x) for x in program]
+    _optimise.optimise_and_reduce(program, {0, 1})
+    assert [str(x) for x in program] == before
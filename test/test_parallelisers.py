@@ -0,0 +1,272 @@
+"""Check :mod:`evokit.core.accelerator.parallelisers`.
+
+Each backend of :func:`.parallelise_task` is compared against
+calling the task in this thread. Files that hold serialised callers
+are checked to be kept while referenced, and removed afterwards.
+"""
+from evokit.core import Evaluator
+from evokit.core.accelerator import AdaptiveChunkSize
+from evokit.core.accelerator import ChunkPolicy
+from evokit.core.accelerator import ChunksPerWorker
+from evokit.core.accelerator import FixedChunkSize
+from evokit.core.accelerator import TaskSubmitter
+from evokit.core.accelerator import parallelise_task
+from evokit.core.accelerator import shutdown_pools
+from evokit.core.accelerator import parallelisers
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+from typing import Iterator
+
+import time
+
+import pytest
+
+
+class Scale(Evaluator[Any]):
+    def __init__(self, factor: int) -> None:
+        self.factor = factor
+        self.calls = 0
+        self.log: list[int] = []
+
+    def evaluate(self, individual: Any) -> tuple[float]:
+        return (individual * self.factor,)
+
+
+def scale(self: Scale, item: int) -> tuple[int, int]:
+    # Count calls made with this copy of ``self``.
+    self.calls += 1
+    return (item * self.factor, self.calls)
+
+
+class LoggedScale(Scale):
+    thread_local_attributes = ("log",)
+
+
+def log_and_scale(self: Scale, item: int) -> tuple[int, list[int]]:
+    self.log.append(item)
+    return (item * self.factor, list(self.log))
+
+
+def reference(items: list[int], factor: int) -> list[int]:
+    return [x * factor for x in items]
+
+
+@pytest.fixture(autouse=True)
+def release_pools() -> Iterator[None]:
+    yield
+    shutdown_pools()
+
+
+def wait_until_released(digest: str) -> None:
+    # Futures call back after they wake their waiters.
+    for _ in range(100):
+        if digest not in parallelisers._PINS:
+            return
+        time.sleep(0.01)
+    assert digest not in parallelisers._PINS
+
+
+def test_processes_match_reference() -> None:
+    items = list(range(100))
+    results = parallelise_task(scale, Scale(3), items, 2, False, 1)
+    assert [x[0] for x in results] == reference(items, 3)
+    # Each chunk of one item runs with a fresh copy of ``self``.
+    assert {x[1] for x in results} == {1}
+
+
+def test_process_pool_executor_matches_reference() -> None:
+    items = list(range(50))
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        results = parallelise_task(scale, Scale(3), items, executor, True)
+    assert [x[0] for x in results] == reference(items, 3)
+    assert not parallelisers._PINS
+
+
+def test_broadcast_reuses_and_releases_files() -> None:
+    caller = Scale(2)
+    first = parallelisers._broadcast(scale, caller, False)
+    second = parallelisers._broadcast(scale, caller, False)
+    assert first == second
+    assert Path(first[0]).exists()
+    assert parallelisers._PINS[first[1]] == 2
+
+    parallelisers._release(first)
+    assert parallelisers._PINS[first[1]] == 1
+    parallelisers._release(second)
+    assert first[1] not in parallelisers._PINS
+
+
+def test_eviction_keeps_referenced_files(
+        monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(parallelisers, "_BROADCAST_LIMIT", 2)
+    pinned = parallelisers._broadcast(scale, Scale(-1), False)
+
+    released = []
+    for factor in range(5):
+        broadcast = parallelisers._broadcast(scale, Scale(factor), False)
+        parallelisers._release(broadcast)
+        released.append(broadcast)
+
+    assert Path(pinned[0]).exists()
+    assert len(parallelisers._BROADCASTS) == 2
+    assert [Path(x[0]).exists() for x in released]\
+        == [False, False, False, False, True]
+    parallelisers._release(pinned)
+
+
+def test_broadcast_serialises_again_only_after_assignment(
+        monkeypatch: pytest.MonkeyPatch) -> None:
+    dumps = parallelisers._dumps
+    sizes: list[int] = []
+
+    def counting_dumps(value: Any) -> bytes:
+        data = dumps(value)
+        sizes.append(len(data))
+        return data
+
+    monkeypatch.setattr(parallelisers, "_dumps", counting_dumps)
+    caller = Scale(2)
+    broadcasts = [parallelisers._broadcast(scale, caller, False)
+                  for _ in range(3)]
+    assert len(sizes) == 1
+
+    caller.factor = 5
+    broadcasts.append(parallelisers._broadcast(scale, caller, False))
+    assert len(sizes) == 2
+    assert broadcasts[-1] != broadcasts[0]
+
+    # Changes inside an attribute are not detected.
+    caller.log.append(1)
+    broadcasts.append(parallelisers._broadcast(scale, caller, False))
+    assert len(sizes) == 2
+
+    for broadcast in broadcasts:
+        parallelisers._release(broadcast)
+
+
+def test_shutdown_pools_removes_files() -> None:
+    parallelise_task(scale, Scale(2), [1, 2, 3], 2, False)
+    broadcast = parallelisers._broadcast(scale, Scale(7), False)
+    paths = list(parallelisers._BROADCASTS.values())
+    assert Path(broadcast[0]) in paths
+
+    shutdown_pools()
+    assert not any(x.exists() for x in paths)
+    assert not parallelisers._BROADCASTS
+    assert not parallelisers._PINS
+    assert not parallelisers._POOLS
+
+
+def test_task_submitter_releases_on_close() -> None:
+    items = list(range(20))
+    with TaskSubmitter(scale, Scale(4), 2, False) as submitter:
+        broadcast = submitter._reference
+        assert broadcast is not None
+        futures = [submitter.submit(x) for x in items]
+    assert [x.result()[0] for x in futures] == reference(items, 4)
+    wait_until_released(broadcast[1])
+
+    with pytest.raises(RuntimeError):
+        submitter.submit(0)
+
+
+def test_chunk_sizes() -> None:
+    assert FixedChunkSize(7).chunk_size(100, 4) == 7
+    assert ChunksPerWorker(4).chunk_size(100, 4) == 7
+    assert ChunksPerWorker(4).chunk_size(3, 4) == 1
+    with pytest.raises(ValueError):
+        FixedChunkSize(0)
+    with pytest.raises(ValueError):
+        ChunksPerWorker(0)
+
+
+def test_adaptive_chunk_size_follows_measurements() -> None:
+    policy = AdaptiveChunkSize(target_seconds=0.05, smoothing=0.5)
+    assert policy.chunk_size(1000, 2) == ChunksPerWorker(4).chunk_size(1000, 2)
+
+    policy.record(10, 0.01)
+    assert policy.seconds_per_item == pytest.approx(0.001)
+    assert policy.chunk_size(1000, 2) == 50
+
+    policy.record(10, 0.03)
+    assert policy.seconds_per_item == pytest.approx(0.002)
+    assert policy.chunk_size(1000, 2) == 25
+    # Never larger than the chunks of :class:`ChunksPerWorker`.
+    assert policy.chunk_size(40, 2) == 5
+
+    policy.record(0, 1.0)
+    assert policy.seconds_per_item == pytest.approx(0.002)
+
+
+@pytest.mark.parametrize("size", [1, 3, 10, 200])
+def test_split_keeps_items_in_order(size: int) -> None:
+    items = list(range(57))
+    chunks = parallelisers._split(items, FixedChunkSize(size), 4)
+    assert [x for chunk in chunks for x in chunk] == items
+    assert all(len(chunk) == size for chunk in chunks[:-1])
+
+
+@pytest.mark.parametrize("processes", [2, "threads:3"])
+@pytest.mark.parametrize("chunking", [None, 1, 5, ChunksPerWorker(2),
+                                      AdaptiveChunkSize()])
+def test_chunking_keeps_results_in_order(
+        processes: int | str,
+        chunking: ChunkPolicy | int | None) -> None:
+    items = list(range(101))
+    results = parallelise_task(scale, Scale(2), items, processes, False,
+                               chunking)
+    assert [x[0] for x in results] == reference(items, 2)
+    if isinstance(chunking, AdaptiveChunkSize):
+        assert chunking.seconds_per_item is not None
+
+
+def test_threads_match_reference() -> None:
+    items = list(range(100))
+    results = parallelise_task(scale, Scale(3), items, "threads:4", False, 1)
+    assert [x[0] for x in results] == reference(items, 3)
+    assert {x[1] for x in results} == {1}
+
+    pool = parallelisers._POOLS["threads:4"]
+    parallelise_task(scale, Scale(3), items, "threads:4", False)
+    assert parallelisers._POOLS["threads:4"] is pool
+
+
+def test_thread_pool_executor_matches_reference() -> None:
+    items = list(range(50))
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        results = parallelise_task(scale, Scale(3), items, executor, False)
+    assert [x[0] for x in results] == reference(items, 3)
+
+
+def test_threads_copy_thread_local_attributes() -> None:
+    caller = LoggedScale(2)
+    items = list(range(40))
+    results = parallelise_task(log_and_scale, caller, items,
+                               "threads:4", False, 5)
+    assert [x[0] for x in results] == reference(items, 2)
+    # Each chunk appends to its own copy of the log.
+    for i, (_, log) in enumerate(results):
+        assert log == items[i - i % 5:i + 1]
+    assert caller.log == []
+
+
+def test_task_submitter_uses_threads() -> None:
+    items = list(range(20))
+    with TaskSubmitter(log_and_scale, LoggedScale(4), "threads:2",
+                       False) as submitter:
+        assert submitter._reference is None
+        futures = [submitter.submit(x) for x in items]
+    assert [x.result() for x in futures]\
+        == [(x * 4, [x]) for x in items]
+
+
+@pytest.mark.parametrize("spec", ["threads", "threads:0", "threads:x",
+                                  "processes:2"])
+def test_bad_thread_spec_is_rejected(spec: str) -> None:
+    with pytest.raises(ValueError):
+        parallelise_task(scale, Scale(1), [1], spec, False)
+    with pytest.raises(ValueError):
+        TaskSubmitter(scale, Scale(1), spec, False)
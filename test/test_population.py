@@ -0,0 +1,116 @@
+"""Check fitness matrices in :mod:`evokit.core.population` against
+building the same values one individual at a time.
+"""
+from evokit.core import Individual
+from evokit.core import Population
+
+from typing import Any
+from typing import Optional
+from typing import Self
+
+import math
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+
+class Number(Individual[int]):
+    """Individual that compares equal to others with the same genome,
+    as individuals in user code may do.
+    """
+    def __init__(self, genome: int) -> None:
+        self.genome = genome
+
+    def copy(self) -> Self:
+        return type(self)(self.genome)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, Number) and self.genome == other.genome
+
+    def __hash__(self) -> int:
+        return hash(self.genome)
+
+
+def random_fitness(rng: random.Random,
+                   width: int) -> Optional[tuple[float, ...]]:
+    roll = rng.random()
+    if roll < 0.1:
+        return None
+    if roll < 0.15:
+        return (math.nan,) * width
+    # Few distinct values, so that rows often tie.
+    return tuple(float(rng.randint(0, 3)) for _ in range(width))
+
+
+def random_population(rng: random.Random, size: int,
+                      width: int) -> Population[Number]:
+    pop: Population[Number] = Population()
+    for i in range(size):
+        individual = Number(i)
+        fitness = random_fitness(rng, width)
+        if fitness is not None:
+            individual.fitness = fitness
+        pop.append(individual)
+    return pop
+
+
+def reference_fitness_matrix(pop: Population[Number]) -> Any:
+    width = max((len(x.fitness) for x in pop if x.has_fitness()), default=1)
+    return np.array([x.fitness if x.has_fitness() else (math.nan,) * width
+                     for x in pop], dtype=float)
+
+
+def reference_best(pop: Population[Number]) -> Number:
+    candidates = [x for x in pop if not any(math.isnan(y) for y in x.fitness)]
+    if not candidates:
+        return pop[0]
+    # `max` returns the first of several highest items.
+    return max(candidates, key=lambda x: x.fitness)
+
+
+@pytest.mark.parametrize("width", [1, 2, 3])
+def test_fitness_matrix_and_best_match_reference(width: int) -> None:
+    rng = random.Random(width)
+    for _ in range(200):
+        pop = random_population(rng, rng.randint(1, 40), width)
+        np.testing.assert_array_equal(pop.fitness_matrix(),
+                                      reference_fitness_matrix(pop))
+        assert pop.best() is reference_best(pop)
+
+
+def test_fitness_matrix_is_cached_and_read_only() -> None:
+    pop = random_population(random.Random(0), 10, 2)
+    matrix = pop.fitness_matrix()
+    assert pop.fitness_matrix() is matrix
+    with pytest.raises(ValueError):
+        matrix[0, 0] = 1.0
+
+
+def test_fitness_matrix_follows_changes() -> None:
+    pop = random_population(random.Random(1), 10, 1)
+    pop.fitness_matrix()
+
+    pop[3].fitness = (100.0,)
+    assert pop.fitness_matrix()[3, 0] == 100.0
+    assert pop.best() is pop[3]
+
+    pop.append(Number(10))
+    assert pop.fitness_matrix().shape == (11, 1)
+
+    pop[3].reset_fitness()
+    assert math.isnan(pop.fitness_matrix()[3, 0])
+
+
+def test_fitness_matrix_replaces_equal_individuals() -> None:
+    pop = Population([Number(0), Number(1)])
+    for x in pop:
+        x.fitness = (1.0,)
+    pop.fitness_matrix()
+
+    # Equal to the individual it replaces, but with another fitness.
+    replacement = Number(0)
+    replacement._fitness = (5.0,)
+    pop[0] = replacement
+    assert pop.fitness_matrix()[0, 0] == 5.0
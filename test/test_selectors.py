@@ -0,0 +1,442 @@
+"""Check selectors in :mod:`evokit.evolvables.selectors`.
+
+Selectors that sort are compared against a full sort, as the old
+implementations did, or against brute force. Selectors that draw at
+random are compared against the distribution of the rules they
+replace, or of their definitions.
+"""
+from evokit.core import Population
+from evokit.core.population import _top_k_indices
+from evokit.evolvables import selectors
+from evokit.evolvables.bitstring import BitString
+from evokit.evolvables.selectors import Elitist
+from evokit.evolvables.selectors import FitnessProportionateSelector
+from evokit.evolvables.selectors import NSGA2Selector
+from evokit.evolvables.selectors import RankSelector
+from evokit.evolvables.selectors import StochasticUniversalSelector
+from evokit.evolvables.selectors import TournamentSelector
+from evokit.evolvables.selectors import TruncationSelector
+from evokit.evolvables.selectors import _crowding_distance
+from evokit.evolvables.selectors import _draw_brackets
+from evokit.evolvables.selectors import _rank_and_crowd
+from evokit.evolvables.selectors import _ranks
+from evokit.evolvables.selectors import _sort_many_objectives
+from evokit.evolvables.selectors import _sort_three_objectives
+from evokit.evolvables.selectors import _sort_two_objectives
+from evokit.evolvables.selectors import _stream_top_k
+
+from collections import Counter
+from math import comb
+from operator import attrgetter
+from typing import Any
+from typing import Callable
+from typing import Sequence
+
+import heapq
+import math
+import random
+
+import pytest
+
+
+def individual(genome: int, fitness: tuple[float, ...]) -> BitString:
+    result = BitString(genome, 16)
+    result.fitness = fitness
+    return result
+
+
+def random_population(seed: int, count: int, objectives: int = 1,
+                      nan_rate: float = 0.0) -> Population[BitString]:
+    rng = random.Random(seed)
+    pop: Population[BitString] = Population()
+    for genome in range(count):
+        # Few distinct values, so that members often tie.
+        fitness = [float(rng.randint(0, 4)) for _ in range(objectives)]
+        if rng.random() < nan_rate:
+            fitness[rng.randrange(objectives)] = float("nan")
+        pop.append(individual(genome, tuple(fitness)))
+    return pop
+
+
+def old_truncation(pop: Population[BitString], budget: int) -> list[int]:
+    # The full sort that :class:`TruncationSelector` used.
+    if budget == 0:
+        return []
+    return [x.genome for x in sorted(list(pop),
+                                     key=attrgetter("fitness"))[-budget:]]
+
+
+def reference_top_k(pop: Population[BitString], k: int) -> list[int]:
+    # Rows with a ``nan`` are lowest. A stable sort keeps later
+    #   members of equal rows higher.
+    def key(x: BitString) -> tuple[bool, tuple[float, ...]]:
+        valid = not any(v != v for v in x.fitness)
+        return (valid, x.fitness if valid else ())
+    return [x.genome for x in sorted(pop, key=key)][len(pop) - k:]\
+        if k > 0 else []
+
+
+@pytest.mark.parametrize("objectives", [1, 2, 3])
+@pytest.mark.parametrize("nan_rate", [0.0, 0.3, 1.0])
+def test_top_k_matches_reference(objectives: int, nan_rate: float) -> None:
+    np = pytest.importorskip("numpy")
+    for seed in range(100):
+        count = seed % 23
+        pop = random_population(seed, count, objectives, nan_rate)
+        matrix = np.array([x.fitness for x in pop]).reshape(count,
+                                                            objectives)
+        for k in range(count + 2):
+            expected = reference_top_k(pop, min(k, count))
+            assert _top_k_indices(matrix, k).tolist() == expected
+            assert [x.genome for x in _stream_top_k(pop, k)] == expected
+            if nan_rate == 0.0:
+                assert expected == old_truncation(pop, min(k, count))
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+@pytest.mark.parametrize("budget", [0, 1, 10, 60])
+def test_truncation_matches_reference(monkeypatch: pytest.MonkeyPatch,
+                                      numpy: bool, budget: int) -> None:
+    if numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(selectors, "is_installed",
+                            lambda name: name != "numpy")
+    pop = random_population(budget, 50, 2, 0.2)
+    expected = reference_top_k(pop, min(budget, 50))
+
+    selector = TruncationSelector(budget)
+    assert [x.genome for x in selector.select_population(pop)] == expected
+    assert [x.genome for x in selector.select_population(iter(pop))]\
+        == expected
+    assert [x.genome for x in selector.select_stream(iter(pop))]\
+        == expected
+
+
+def test_stream_top_k_keeps_budget_individuals(
+        monkeypatch: pytest.MonkeyPatch) -> None:
+    heap_sizes: list[int] = []
+    heappush = heapq.heappush
+
+    def counting_heappush(heap: list[Any], item: Any) -> None:
+        heappush(heap, item)
+        heap_sizes.append(len(heap))
+
+    monkeypatch.setattr(heapq, "heappush", counting_heappush)
+    selected = _stream_top_k(iter(random_population(0, 200)), 5)
+    assert len(selected) == 5
+    assert max(heap_sizes) == 5
+
+
+def test_elitist_stream_matches_elitist_population() -> None:
+    streamed = Elitist(TruncationSelector(3))
+    collected = Elitist(TruncationSelector(3))
+    for seed in range(10):
+        pop = random_population(seed, 20, 1, 0.2)
+        assert [x.genome for x in streamed.select_stream(iter(pop))]\
+            == [x.genome for x in collected.select_population(pop)]
+
+
+def tournament_chances(n: int, size: int, p: float) -> list[float]:
+    """Chance that the individual with ``r`` better individuals wins
+    one tournament of :meth:`TournamentSelector.select`, for each
+    ``r``. Fitnesses are distinct.
+    """
+    # Chance that the ``i``-th best entrant wins.
+    places: list[float] = []
+    missed = 1.0
+    for i in range(size):
+        places.append(missed * p * (1 - p)**i)
+        missed *= 1 - p * (1 - p)**i
+    places[-1] += missed
+
+    return [sum(comb(r, i) * comb(n - 1 - r, size - 1 - i)
+                * places[i] for i in range(size)) / comb(n, size)
+            for r in range(n)]
+
+
+def assert_follows(counts: Counter[int], chances: list[float],
+                   draws: int = 0) -> None:
+    draws = draws or sum(counts.values())
+    for r, chance in enumerate(chances):
+        # Within five standard deviations of the expected count.
+        spread = math.sqrt(draws * chance * (1 - chance))
+        assert abs(counts[r] - draws * chance) <= 5 * spread + 1
+
+
+def ranked_population(n: int) -> Population[BitString]:
+    # The genome is the number of better individuals.
+    order = random.Random(n).sample(range(n), n)
+    return Population([individual(r, (float(n - r),)) for r in order])
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 6])
+@pytest.mark.parametrize("p", [1.0, 0.6, 0.0])
+@pytest.mark.parametrize("budget", [12, 3000])
+def test_tournaments_follow_reference(size: int, p: float,
+                                      budget: int) -> None:
+    pytest.importorskip("numpy")
+    random.seed(size)
+    pop = ranked_population(40)
+    chances = tournament_chances(40, size, p)
+    selector = TournamentSelector(budget, size, p)
+
+    # Few tournaments are held one at a time; many are held at once.
+    counts: Counter[int] = Counter()
+    for _ in range(6000 // budget):
+        counts.update(x.genome for x in selector.select_population(pop))
+    assert_follows(counts, chances)
+
+    # The old implementation holds one tournament per call.
+    old: Counter[int] = Counter(selector.select(pop)[0].genome
+                                for _ in range(6000))
+    assert_follows(old, chances)
+
+
+def test_tournaments_without_numpy_follow_reference(
+        monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(selectors, "is_installed",
+                        lambda name: name != "numpy")
+    random.seed(0)
+    pop = ranked_population(20)
+    counts: Counter[int] = Counter(
+        x.genome for x in TournamentSelector(6000, 3, 0.6)
+        .select_population(pop))
+    assert_follows(counts, tournament_chances(20, 3, 0.6))
+
+
+@pytest.mark.parametrize("budget", [1, 4, 40])
+def test_small_budget_brackets_hold_everyone(budget: int) -> None:
+    pytest.importorskip("numpy")
+    pop = random_population(budget, 30, 2, 0.2)
+    # A bracket larger than the budget is the whole population, so
+    #   the highest individual wins. The later of equals is higher.
+    best = reference_top_k(pop, 1)
+    selector = TournamentSelector(min(budget, 30), 50)
+    assert [x.genome for x in selector.select_population(pop)]\
+        == best * min(budget, 30)
+
+
+def test_nan_entrants_lose() -> None:
+    pytest.importorskip("numpy")
+    random.seed(1)
+    pop = Population([individual(i, (float("nan"),)) for i in range(30)])
+    pop.append(individual(30, (0.0,)))
+    selected = TournamentSelector(3000, 31).select_population(pop)
+    assert {x.genome for x in selected} == {30}
+
+
+@pytest.mark.parametrize("n, size", [(5, 5), (10, 7), (1000, 4), (50, 1)])
+def test_brackets_are_uniform_samples(n: int, size: int) -> None:
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(n)
+    brackets = _draw_brackets(rng, n, 4000, size)
+    assert brackets.shape == (4000, size)
+    assert all(len(set(row)) == size for row in brackets.tolist())
+    assert brackets.min() >= 0 and brackets.max() < n
+    if n <= 50:
+        counts = Counter(brackets.ravel().tolist())
+        assert_follows(counts, [size / n] * n, 4000)
+
+
+def dominates(a: Sequence[float], b: Sequence[float]) -> bool:
+    return all(x >= y for x, y in zip(a, b))\
+        and any(x > y for x, y in zip(a, b))
+
+
+def reference_fronts(rows: list[list[float]]) -> list[list[int]]:
+    # Remove the non-dominated rows, until none remain.
+    remaining = list(range(len(rows)))
+    fronts = []
+    while remaining:
+        front = [i for i in remaining
+                 if not any(dominates(rows[j], rows[i]) for j in remaining)]
+        fronts.append(front)
+        remaining = [i for i in remaining if i not in front]
+    return fronts
+
+
+def reference_crowding(rows: list[list[float]]) -> list[float]:
+    size = len(rows)
+    if size < 3:
+        return [math.inf] * size
+    distance = [0.0] * size
+    for j in range(len(rows[0])):
+        order = sorted(range(size), key=lambda i: rows[i][j])
+        span = rows[order[-1]][j] - rows[order[0]][j]
+        distance[order[0]] = distance[order[-1]] = math.inf
+        for k in range(1, size - 1):
+            if span > 0:
+                distance[order[k]] += (rows[order[k + 1]][j]
+                                       - rows[order[k - 1]][j]) / span
+    return distance
+
+
+def random_rows(rng: random.Random, count: int,
+                objectives: int) -> list[list[float]]:
+    # Few distinct values, so that rows often tie and repeat.
+    return [[float(rng.randint(0, 5)) for _ in range(objectives)]
+            for _ in range(count)]
+
+
+SORTS: list[tuple[int, Callable[[Any], list[Any]]]] = [
+    (2, _sort_two_objectives),
+    (3, _sort_three_objectives),
+    (1, _sort_many_objectives),
+    (2, _sort_many_objectives),
+    (3, _sort_many_objectives),
+    (5, _sort_many_objectives),
+]
+
+
+@pytest.mark.parametrize("objectives, sort", SORTS)
+def test_non_dominated_sort_matches_reference(
+        objectives: int, sort: Callable[[Any], list[Any]]) -> None:
+    np = pytest.importorskip("numpy")
+    rng = random.Random(objectives)
+    for count in list(range(12)) + [40, 100]:
+        rows = random_rows(rng, count, objectives)
+        matrix = np.array(rows).reshape(count, objectives)
+        assert [sorted(x.tolist()) for x in sort(matrix)]\
+            == reference_fronts(rows)
+
+
+def test_crowding_distance_matches_reference() -> None:
+    np = pytest.importorskip("numpy")
+    rng = random.Random(0)
+    for count in range(12):
+        for objectives in (1, 2, 4):
+            rows = [[rng.uniform(0, 3) for _ in range(objectives)]
+                    for _ in range(count)]
+            if count > 3:
+                rows[1] = list(rows[0])
+            matrix = np.array(rows).reshape(count, objectives)
+            assert _crowding_distance(matrix).tolist()\
+                == pytest.approx(reference_crowding(rows))
+
+
+@pytest.mark.parametrize("objectives", [2, 3, 4])
+def test_nsga2_selector_matches_reference(objectives: int) -> None:
+    np = pytest.importorskip("numpy")
+    rng = random.Random(objectives)
+    # Crowding distances of equal values depend on the order of the
+    #   front, so values are distinct.
+    rows = [[rng.uniform(0, 5) for _ in range(objectives)]
+            for _ in range(60)]
+    for i in rng.sample(range(60), 6):
+        rows[i][0] = float("nan")
+    pop = Population([individual(i, tuple(x)) for i, x in enumerate(rows)])
+
+    valid = [i for i, x in enumerate(rows) if not any(v != v for v in x)]
+    ranks = [0] * 60
+    crowding = [0.0] * 60
+    fronts = reference_fronts([rows[i] for i in valid])
+    for rank, front in enumerate(fronts):
+        distances = reference_crowding([rows[valid[i]] for i in front])
+        for i, distance in zip(front, distances):
+            ranks[valid[i]] = rank
+            crowding[valid[i]] = distance
+    for i in set(range(60)) - set(valid):
+        ranks[i] = len(fronts)
+
+    actual_ranks, actual_crowding = _rank_and_crowd(np.array(rows))
+    assert actual_ranks.tolist() == ranks
+    assert actual_crowding.tolist() == pytest.approx(crowding)
+
+    order = sorted(range(60), key=lambda i: (ranks[i], -crowding[i]))
+    for budget in (0, 10, 30, 60):
+        assert [x.genome for x in NSGA2Selector(budget)
+                .select_population(pop)] == order[:budget]
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "python"])
+def numpy(request: pytest.FixtureRequest,
+          monkeypatch: pytest.MonkeyPatch) -> bool:
+    if request.param:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(selectors, "is_installed",
+                            lambda name: name != "numpy")
+    return bool(request.param)
+
+
+def weighted_population() -> Population[BitString]:
+    fitnesses = [3.0, 0.0, 1.0, float("nan"), 0.5, 7.5, 0.0, 2.0]
+    return Population([individual(i, (x, -1.0))
+                       for i, x in enumerate(fitnesses)])
+
+
+def wheel_chances(pop: Population[BitString]) -> list[float]:
+    weights = [0.0 if x.fitness[0] != x.fitness[0] else x.fitness[0]
+               for x in pop]
+    return [x / sum(weights) for x in weights]
+
+
+def test_roulette_follows_weights(numpy: bool) -> None:
+    random.seed(0)
+    pop = weighted_population()
+    selected = FitnessProportionateSelector(20000).select_population(pop)
+    assert_follows(Counter(x.genome for x in selected), wheel_chances(pop))
+
+
+@pytest.mark.parametrize("budget", [1, 7, 8, 100, 1001])
+def test_universal_sampling_is_close_to_expected(numpy: bool,
+                                                 budget: int) -> None:
+    random.seed(budget)
+    pop = weighted_population()
+    chances = wheel_chances(pop)
+    for _ in range(20):
+        counts = Counter(x.genome for x in StochasticUniversalSelector(
+            budget).select_population(pop))
+        assert sum(counts.values()) == budget
+        # Each count is the expected count, rounded up or down.
+        for i, chance in enumerate(chances):
+            assert math.floor(budget * chance) <= counts[i]\
+                <= math.ceil(budget * chance)
+
+
+def test_wheel_without_weight_is_uniform(numpy: bool) -> None:
+    random.seed(1)
+    pop = Population([individual(i, (0.0,)) for i in range(5)])
+    pop.append(individual(5, (float("nan"),)))
+    selected = FitnessProportionateSelector(6000).select_population(pop)
+    assert_follows(Counter(x.genome for x in selected), [1 / 6] * 6)
+
+
+def test_wheel_rejects_negative_fitness(numpy: bool) -> None:
+    pop = Population([individual(0, (1.0,)), individual(1, (-1.0,))])
+    with pytest.raises(ValueError):
+        FitnessProportionateSelector(3).select_population(pop)
+    assert len(FitnessProportionateSelector(3)
+               .select_population(Population())) == 0
+
+
+def test_ranks_match_reference(numpy: bool) -> None:
+    pop = random_population(0, 40, 2, 0.2)
+    ranks = [int(x) for x in _ranks(pop)]
+    assert [ranks.index(r) for r in range(40)] == reference_top_k(pop, 40)
+
+
+@pytest.mark.parametrize("pressure", [1.0, 1.5, 2.0])
+@pytest.mark.parametrize("universal", [False, True])
+def test_rank_selection_follows_ranks(numpy: bool, pressure: float,
+                                      universal: bool) -> None:
+    random.seed(2)
+    n = 12
+    pop = ranked_population(n)
+    # The genome is the number of better individuals.
+    chances = [(2 - pressure) / n
+               + 2 * (n - 1 - r) * (pressure - 1) / (n * (n - 1))
+               for r in range(n)]
+    counts = Counter(x.genome for x in RankSelector(
+        12000, pressure, universal).select_population(pop))
+    assert_follows(counts, chances)
+
+
+def test_rank_selection_of_few_individuals() -> None:
+    assert len(RankSelector(4).select_population(Population())) == 0
+    only = Population([individual(0, (1.0,))])
+    assert [x.genome for x in RankSelector(4).select_population(only)]\
+        == [0] * 4
+    with pytest.raises(ValueError):
+        RankSelector(4, pressure=2.5)
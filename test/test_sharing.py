@@ -0,0 +1,119 @@
+"""Check :mod:`evokit.core.accelerator.sharing` and
+:class:`.SharedFitnessCases`.
+
+Arrays and fitness cases are sent to worker processes, then
+compared with the values they were created from.
+"""
+from evokit.core.accelerator import SharedArray
+from evokit.core.accelerator import parallelise_task
+from evokit.core.accelerator import shutdown_pools
+from evokit.evolvables.lgp import LGPEvaluator
+from evokit.evolvables.lgp import LGPFactory
+from evokit.evolvables.lgp import SharedFitnessCases
+from evokit.evolvables.primitives import add, sub, mul
+
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+from typing import Iterator
+
+import copy
+import gc
+import pickle
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+ARRAYS = [
+    np.arange(12, dtype=np.float64).reshape(3, 4),
+    np.array([1, -2, 3], dtype=np.int32),
+    np.array([True, False]),
+    np.zeros((0, 3)),
+]
+
+
+@pytest.fixture(autouse=True)
+def release_pools() -> Iterator[None]:
+    yield
+    shutdown_pools()
+
+
+def describe(_: Any, shared: Any) -> tuple[Any, ...]:
+    array = np.asarray(shared)
+    return (array.shape, array.dtype.str, array.tolist(),
+            array.flags.writeable)
+
+
+def random_cases(rng: random.Random, count: int) -> list[Any]:
+    return [((tuple(rng.randint(-5, 5) for _ in range(4)),
+              (1, 2)),
+             (rng.randint(-5, 5),))
+            for _ in range(count)]
+
+
+def distance(expected: Any, actual: Any) -> float:
+    return -sum(abs(x - y) for x, y in zip(expected, actual))
+
+
+@pytest.mark.parametrize("array", ARRAYS)
+def test_shared_array_round_trip(array: Any) -> None:
+    shared = SharedArray(array)
+    assert pickle.loads(pickle.dumps(shared)) is shared
+    assert copy.deepcopy(shared) is shared
+    assert not shared.array.flags.writeable
+
+    # Workers attach the same block, without copying it.
+    expected = (array.shape, array.dtype.str, array.tolist(), False)
+    assert parallelise_task(describe, None, [shared] * 4, 2, False, 1)\
+        == [expected] * 4
+
+
+def test_shared_array_rejects_objects() -> None:
+    with pytest.raises(TypeError):
+        SharedArray(np.array([object()]))
+
+
+def test_shared_array_unlinks_when_collected() -> None:
+    shared = SharedArray(ARRAYS[0])
+    name = shared.name
+    del shared
+    gc.collect()
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=name)
+
+
+def test_shared_fitness_cases_round_trip() -> None:
+    cases = random_cases(random.Random(0), 30)
+    shared = SharedFitnessCases(cases)
+    assert len(shared) == len(cases)
+    assert list(shared) == cases
+    assert shared[3] == cases[3]
+
+    restored = pickle.loads(pickle.dumps(shared))
+    assert restored._cases is None
+    assert list(restored) == cases
+
+
+def test_shared_fitness_cases_reject_ragged_cases() -> None:
+    cases = random_cases(random.Random(1), 3)
+    cases.append((((1, 2), (1, 2)), (0,)))
+    with pytest.raises(ValueError):
+        SharedFitnessCases(cases)
+
+
+def test_shared_fitness_cases_match_plain_cases() -> None:
+    random.seed(2)
+    cases = random_cases(random.Random(2), 40)
+    # Targets are drawn from one more register than the count.
+    factory = LGPFactory([add, sub, mul], 3, 2)
+    programs = [factory.build(20) for _ in range(30)]
+
+    plain = LGPEvaluator(cases, {0}, "none", distance)
+    shared = LGPEvaluator(SharedFitnessCases(cases), {0}, "none",
+                          distance, processes=2)
+    assert [shared.evaluate(x) for x in programs]\
+        == [plain.evaluate(x) for x in programs]
+    assert parallelise_task(LGPEvaluator.evaluate, shared, programs,
+                            2, False)\
+        == [plain.evaluate(x) for x in programs]
@@ -0,0 +1,91 @@
+"""Check :meth:`.Variator.vary_population` and
+:meth:`.Variator.vary_population_iter` against concatenating the
+offspring of each group with :python:`sum`, as the old
+implementation did.
+"""
+from evokit.core import Population
+from evokit.core import Variator
+from evokit.core.accelerator import shutdown_pools
+from evokit.evolvables.bitstring import BitString
+
+from typing import Any
+from typing import Iterator
+from typing import Sequence
+
+import random
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def release_pools() -> Iterator[None]:
+    yield
+    shutdown_pools()
+
+
+class Litter(Variator[BitString]):
+    """Parents produce between zero and three offspring, which keep
+    the fitness of the first parent.
+    """
+    def __init__(self, arity: int) -> None:
+        self.arity = arity
+
+    def vary(self, parents: Sequence[BitString]) -> tuple[BitString, ...]:
+        total = sum(x.genome for x in parents)
+        offspring = []
+        for i in range(total % 4):
+            child = BitString(total + i, 16)
+            child.fitness = parents[0].fitness
+            offspring.append(child)
+        return tuple(offspring)
+
+
+def random_population(seed: int, count: int) -> Population[BitString]:
+    rng = random.Random(seed)
+    pop = Population([BitString(rng.getrandbits(12), 16)
+                      for _ in range(count)])
+    for individual in pop:
+        individual.fitness = (1.0,)
+    return pop
+
+
+def reference(variator: Litter, pop: Population[BitString]) -> list[int]:
+    groups = tuple(zip(*(iter(pop),) * variator.arity))
+    offspring = list(sum((variator.vary(x) for x in groups), ()))
+    return [x.genome for x in offspring]
+
+
+@pytest.mark.parametrize("arity", [1, 2, 3])
+@pytest.mark.parametrize("processes", [None, 2, "threads:2"])
+def test_vary_population_matches_reference(arity: int,
+                                           processes: Any) -> None:
+    pop = random_population(arity, 101)
+    variator = Litter(arity)
+    variator.processes = processes
+    offspring = variator.vary_population(pop)
+    assert [x.genome for x in offspring] == reference(variator, pop)
+    assert not any(x.has_fitness() for x in offspring)
+
+
+@pytest.mark.parametrize("arity", [1, 2, 3])
+def test_vary_population_iter_matches_reference(arity: int) -> None:
+    pop = random_population(arity, 101)
+    variator = Litter(arity)
+    offspring = variator.vary_population_iter(pop)
+    assert isinstance(offspring, Iterator)
+    offspring = list(offspring)
+    assert [x.genome for x in offspring] == reference(variator, pop)
+    assert not any(x.has_fitness() for x in offspring)
+
+
+def test_too_few_parents() -> None:
+    pop = random_population(0, 2)
+    assert len(Litter(3).vary_population(pop)) == 0
+    assert list(Litter(3).vary_population_iter(pop)) == []
+
+    variator = Litter(1)
+    variator.arity = None
+    with pytest.raises(TypeError):
+        variator.vary_population(pop)
+    with pytest.raises(TypeError):
+        next(variator.vary_population_iter(pop))